@@ -0,0 +1,50 @@
+# benchmarks/ahp_batch.py
+#
+# Membandingkan AHP.calculate_weights_batch dengan loop calculate_weights_from_matrix +
+# calculate_consistency_ratio per matriks.
+#
+# Jalankan dari root proyek:
+#     python -m benchmarks.ahp_batch --k 2000 --n 8
+
+import argparse
+import time
+
+import numpy as np
+
+from methods.ahp import AHP
+from benchmarks.generators import random_reciprocal_matrices
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark AHP batch vs loop.")
+    parser.add_argument('--k', type=int, default=2000, help="Jumlah matriks.")
+    parser.add_argument('--n', type=int, default=8, help="Ukuran setiap matriks.")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    matrices = random_reciprocal_matrices(args.k, args.n, args.seed)
+    ahp = AHP([], [])
+
+    start = time.perf_counter()
+    loop_weights = []
+    loop_CR = []
+    for matrix in matrices:
+        weights = ahp.calculate_weights_from_matrix(matrix)
+        loop_weights.append(weights)
+        loop_CR.append(ahp.calculate_consistency_ratio(matrix, weights))
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_weights, _, batch_CR = ahp.calculate_weights_batch(matrices)
+    batch_time = time.perf_counter() - start
+
+    print(f"k={args.k} n={args.n}")
+    print(f"loop : {loop_time:.4f} s")
+    print(f"batch: {batch_time:.4f} s")
+    print(f"speed-up: {loop_time / batch_time:.1f}x")
+    print(f"selisih bobot maks: {np.abs(np.array(loop_weights) - batch_weights).max():.2e}")
+    print(f"selisih CR maks   : {np.abs(np.array(loop_CR) - batch_CR).max():.2e}")
+
+
+if __name__ == "__main__":
+    main()
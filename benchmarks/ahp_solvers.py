@@ -0,0 +1,38 @@
+# benchmarks/ahp_solvers.py
+#
+# Laporan perbandingan solver bobot prioritas AHP (eig, power, geometric_mean):
+# waktu, selisih bobot terhadap solver eksak dan diagnostik konvergensi.
+#
+# Jalankan dari root proyek:
+#     python -m benchmarks.ahp_solvers --n 300
+
+import argparse
+
+from methods.priority import compare_solvers
+from benchmarks.generators import random_reciprocal_matrices
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Perbandingan solver bobot prioritas AHP.")
+    parser.add_argument('--n', type=int, default=300, help="Ukuran matriks.")
+    parser.add_argument('--k', type=int, default=1, help="Jumlah matriks (batch).")
+    parser.add_argument('--tol', type=float, default=1e-10, help="Toleransi power iteration.")
+    parser.add_argument('--max-iter', type=int, default=1000, help="Batas iterasi power iteration.")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    matrices = random_reciprocal_matrices(args.k, args.n, args.seed)
+    if args.k == 1:
+        matrices = matrices[0]
+    report = compare_solvers(matrices, tol=args.tol, max_iter=args.max_iter)
+
+    base_time = report['eig']['time']
+    print(f"k={args.k} n={args.n}")
+    print(f"{'solver':<16}{'waktu (s)':>12}{'speed-up':>10}{'selisih maks':>14}{'iterasi':>9}{'konvergen':>11}{'residual':>12}")
+    for solver, row in report.items():
+        print(f"{solver:<16}{row['time']:>12.5f}{base_time / row['time']:>9.1f}x{row['max_abs_diff']:>14.2e}"
+              f"{row['iterations']:>9}{str(row['converged']):>11}{row['residual']:>12.2e}")
+
+
+if __name__ == "__main__":
+    main()
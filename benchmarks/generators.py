@@ -0,0 +1,95 @@
+# benchmarks/generators.py
+#
+# Generator data sintetis (dengan seed) untuk benchmark metode SPK.
+
+import numpy as np
+
+from methods.ahp import AHP
+
+# Skala Saaty 1-9 beserta kebalikannya
+SAATY_SCALE = np.array([1/9, 1/7, 1/5, 1/3, 1, 3, 5, 7, 9])
+
+
+def random_reciprocal_matrices(k, n, seed=0):
+    """
+    Membuat k matriks perbandingan berpasangan acak (resiprokal) berukuran n x n dengan nilai skala Saaty.
+    """
+    rng = np.random.default_rng(seed)
+    matrices = np.ones((k, n, n))
+    iu = np.triu_indices(n, 1)
+    values = rng.choice(SAATY_SCALE, size=(k, len(iu[0])))
+    matrices[:, iu[0], iu[1]] = values
+    matrices[:, iu[1], iu[0]] = 1 / values
+    return matrices
+
+
+def reciprocal_matrix(n, target_cr=0.05, seed=0, tol=1e-3, max_iter=60):
+    """
+    Membuat satu matriks perbandingan berpasangan resiprokal dengan Consistency Ratio mendekati target_cr.
+
+    Matriks dibangun dari bobot acak (matriks konsisten w_i / w_j, CR = 0) lalu setiap elemen di atas
+    diagonal dikalikan exp(sigma * noise). Besarnya sigma dicari dengan bisection sampai CR ~ target_cr.
+
+    Args:
+        n (int): Ukuran matriks.
+        target_cr (float): Consistency Ratio yang diinginkan.
+        seed (int): Seed generator acak.
+        tol (float): Toleransi selisih CR terhadap target.
+        max_iter (int): Batas iterasi bisection.
+
+    Returns:
+        tuple: (matriks n x n, CR sebenarnya).
+    """
+    rng = np.random.default_rng(seed)
+    weights = rng.uniform(1, 9, n)
+    consistent = weights[:, None] / weights[None, :]
+    noise = np.triu(rng.standard_normal((n, n)), 1)
+    noise = noise - noise.T
+    ahp = AHP([], [])
+
+    def build(sigma):
+        matrix = consistent * np.exp(sigma * noise)
+        return matrix, ahp.calculate_consistency_ratio(matrix, ahp.calculate_weights_from_matrix(matrix))
+
+    if n < 3 or target_cr <= 0:
+        return build(0.0)
+
+    low, high = 0.0, 1.0
+    while build(high)[1] < target_cr and high < 64:
+        high *= 2
+    matrix, cr = build(high)
+    for _ in range(max_iter):
+        sigma = (low + high) / 2
+        matrix, cr = build(sigma)
+        if abs(cr - target_cr) <= tol:
+            break
+        if cr < target_cr:
+            low = sigma
+        else:
+            high = sigma
+    return matrix, cr
+
+
+def comparisons_from_matrix(matrix):
+    """
+    Mengubah matriks perbandingan menjadi daftar (i, j, value) untuk elemen di atas diagonal.
+    """
+    iu = np.triu_indices(matrix.shape[0], 1)
+    return list(zip(iu[0].tolist(), iu[1].tolist(), matrix[iu].tolist()))
+
+
+def decision_matrix(n_alternatives, n_criteria, seed=0, low=1.0, high=10.0):
+    """
+    Membuat matriks keputusan acak (alternatif x kriteria) dengan nilai positif.
+    """
+    rng = np.random.default_rng(seed)
+    return rng.uniform(low, high, (n_alternatives, n_criteria))
+
+
+def criteria_weights(n_criteria, seed=0):
+    """
+    Membuat bobot kriteria acak yang totalnya 1.
+    """
+    rng = np.random.default_rng(seed)
+    weights = rng.uniform(1, 10, n_criteria)
+    return weights / weights.sum()
@@ -0,0 +1,41 @@
+# benchmarks/ranking_topk.py
+#
+# Membandingkan ranking penuh (argsort) dengan ranking top-k (seleksi parsial)
+# untuk 10^5 - 10^7 alternatif.
+#
+# Jalankan dari root proyek:
+#     python -m benchmarks.ranking_topk --k 10 100
+
+import argparse
+import time
+
+import numpy as np
+
+from methods.ranking import rank_indices
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ranking top-k vs argsort penuh.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10**5, 10**6, 10**7])
+    parser.add_argument('--k', type=int, nargs='+', default=[10, 100])
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'n':>10}{'k':>6}{'penuh (s)':>12}{'top-k (s)':>12}{'speed-up':>10}{'sama':>6}")
+    for n in args.sizes:
+        # Skor dibulatkan agar ada banyak skor yang sama (menguji urutan tie)
+        scores = np.round(rng.random(n), 4)
+        start = time.perf_counter()
+        full = rank_indices(scores)
+        full_time = time.perf_counter() - start
+        for k in args.k:
+            start = time.perf_counter()
+            top = rank_indices(scores, k)
+            top_time = time.perf_counter() - start
+            same = np.array_equal(full[:k], top)
+            print(f"{n:>10}{k:>6}{full_time:>12.4f}{top_time:>12.4f}{full_time / top_time:>9.1f}x{str(same):>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+# benchmarks/suite.py
+#
+# Benchmark semua metode di package methods (AHP, SAW, WP, MAUT) untuk berbagai ukuran
+# alternatif x kriteria. Setiap tahap diukur waktunya (terbaik dari beberapa pengulangan),
+# throughput (alternatif per detik) dan puncak memori (tracemalloc). Hasil ditulis sebagai JSON.
+#
+# Jalankan dari root proyek:
+#     python -m benchmarks.suite run --alternatives 100 1000 10000 --criteria 5 20 --output base.json
+#     python -m benchmarks.suite compare base.json new.json --threshold 0.10
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from methods.ahp import AHP
+from methods.saw import SAW
+from methods.wp import WP
+from methods.maut import MAUT
+from methods.topsis import TOPSIS
+from benchmarks.generators import comparisons_from_matrix, criteria_weights, decision_matrix, reciprocal_matrix
+
+
+def ahp_stages(n_alternatives, n_criteria, seed, target_cr=0.05):
+    """
+    Menyiapkan data AHP dan mengembalikan fungsi pembuat tahap-tahap perhitungan.
+    """
+    criteria = [f"C{j}" for j in range(n_criteria)]
+    alternatives = [f"A{i}" for i in range(n_alternatives)]
+    criteria_comparisons = comparisons_from_matrix(reciprocal_matrix(n_criteria, target_cr, seed)[0])
+    alternative_comparisons = {
+        crit: comparisons_from_matrix(reciprocal_matrix(n_alternatives, target_cr, seed + j + 1)[0])
+        for j, crit in enumerate(criteria)
+    }
+
+    def make():
+        ahp = AHP(criteria, alternatives)
+
+        def set_comparisons():
+            ahp.set_criteria_comparisons(criteria_comparisons)
+            for crit in criteria:
+                ahp.set_alternative_comparisons(crit, alternative_comparisons[crit])
+
+        return [
+            ('set_comparisons', set_comparisons),
+            ('perform_ahp', ahp.perform_ahp),
+            ('get_results', lambda: ahp.get_results().to_dict()),
+        ]
+    return make
+
+
+def _split(n_criteria):
+    """
+    Membagi kriteria menjadi benefit (setengah pertama) dan cost (sisanya).
+    """
+    n_benefit = max(1, n_criteria // 2)
+    return n_benefit, n_criteria - n_benefit
+
+
+def saw_stages(n_alternatives, n_criteria, seed):
+    """
+    Menyiapkan data SAW dan mengembalikan fungsi pembuat tahap-tahap perhitungan.
+    """
+    n_benefit, _ = _split(n_criteria)
+    criteria = [f"C{j}" for j in range(n_criteria)]
+    alternatives = [f"A{i}" for i in range(n_alternatives)]
+    matrix = decision_matrix(n_alternatives, n_criteria, seed)
+    weights = criteria_weights(n_criteria, seed).tolist()
+
+    def make():
+        saw = SAW()
+        saw.set_criteria(criteria[:n_benefit], criteria[n_benefit:])
+        saw.set_weights(weights[:n_benefit], weights[n_benefit:])
+        return [
+            ('set_decision_matrix', lambda: saw.set_decision_matrix(matrix, alternatives, criteria)),
+            ('create_matrices', saw.create_matrices),
+            ('normalization', saw.normalization),
+            ('calculate_score', saw.calculate_score),
+            ('rank_alternative', saw.rank_alternative),
+        ]
+    return make
+
+
+def topsis_stages(n_alternatives, n_criteria, seed):
+    """
+    Menyiapkan data TOPSIS dan mengembalikan fungsi pembuat tahap-tahap perhitungan.
+    """
+    n_benefit, _ = _split(n_criteria)
+    criteria = [f"C{j}" for j in range(n_criteria)]
+    alternatives = [f"A{i}" for i in range(n_alternatives)]
+    matrix = decision_matrix(n_alternatives, n_criteria, seed)
+    weights = criteria_weights(n_criteria, seed).tolist()
+
+    def make():
+        topsis = TOPSIS()
+        topsis.set_criteria(criteria[:n_benefit], criteria[n_benefit:])
+        topsis.set_weights(weights[:n_benefit], weights[n_benefit:])
+        return [
+            ('set_decision_matrix', lambda: topsis.set_decision_matrix(matrix, alternatives, criteria)),
+            ('create_matrix', topsis.create_matrix),
+            ('normalization', topsis.normalization),
+            ('ideal_solutions', topsis.ideal_solutions),
+            ('calculate_score', topsis.calculate_score),
+            ('rank_alternative', topsis.rank_alternative),
+        ]
+    return make
+
+
+def score_stages(method_class, n_alternatives, n_criteria, seed):
+    """
+    Menyiapkan data WP/MAUT dan mengembalikan fungsi pembuat tahap-tahap perhitungan.
+    """
+    n_benefit, _ = _split(n_criteria)
+    criteria = [f"C{j}" for j in range(n_criteria)]
+    alternatives = [f"A{i}" for i in range(n_alternatives)]
+    matrix = decision_matrix(n_alternatives, n_criteria, seed)
+    weights = criteria_weights(n_criteria, seed)
+
+    def make():
+        method = method_class(verbose=False)
+        method.set_criteria(criteria[:n_benefit], criteria[n_benefit:])
+        method.set_alternatives(alternatives)
+        method.set_weights(weights[:n_benefit], weights[n_benefit:])
+        return [
+            ('set_matrices', lambda: method.set_matrices(matrix[:, :n_benefit], matrix[:, n_benefit:])),
+            ('calculate_scores', method.calculate_scores),
+            ('rank_alternatives', method.rank_alternatives),
+        ]
+    return make
+
+
+METHODS = {
+    'ahp': ahp_stages,
+    'saw': saw_stages,
+    'wp': lambda n, m, seed: score_stages(WP, n, m, seed),
+    'maut': lambda n, m, seed: score_stages(MAUT, n, m, seed),
+    'topsis': topsis_stages,
+}
+
+
+def measure(make, repeat):
+    """
+    Mengukur setiap tahap: waktu terbaik dari `repeat` kali jalan, lalu satu jalan dengan tracemalloc
+    untuk puncak memori (tracemalloc tidak aktif saat pengukuran waktu).
+
+    Returns:
+        dict: Nama tahap -> {'time_s', 'peak_bytes'}.
+    """
+    times = {}
+    for _ in range(repeat):
+        for stage, func in make():
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            times[stage] = min(elapsed, times.get(stage, float('inf')))
+
+    peaks = {}
+    tracemalloc.start()
+    try:
+        for stage, func in make():
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            func()
+            peaks[stage] = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+    return {stage: {'time_s': times[stage], 'peak_bytes': peaks[stage]} for stage in times}
+
+
+def run(methods, alternatives, criteria, repeat=3, seed=0, ahp_max_alternatives=200, target_cr=0.05):
+    """
+    Menjalankan sweep benchmark untuk semua kombinasi metode x alternatif x kriteria.
+
+    Returns:
+        dict: {'meta': {...}, 'results': [baris per metode/ukuran/tahap]}.
+    """
+    results = []
+    for method in methods:
+        for n in alternatives:
+            if method == 'ahp' and n > ahp_max_alternatives:
+                continue  # Matriks perbandingan n x n per kriteria terlalu besar untuk AHP
+            for m in criteria:
+                if method == 'ahp':
+                    make = ahp_stages(n, m, seed, target_cr)
+                else:
+                    make = METHODS[method](n, m, seed)
+                for stage, row in measure(make, repeat).items():
+                    results.append({
+                        'method': method,
+                        'stage': stage,
+                        'alternatives': n,
+                        'criteria': m,
+                        'time_s': row['time_s'],
+                        'throughput': n / row['time_s'] if row['time_s'] > 0 else float('inf'),
+                        'peak_bytes': row['peak_bytes'],
+                    })
+                    print(f"{method:<5} n={n:<8} m={m:<4} {stage:<20} {row['time_s']:.6f} s  "
+                          f"{row['peak_bytes'] / 1e6:9.3f} MB", file=sys.stderr)
+    meta = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'seed': seed,
+        'target_cr': target_cr,
+    }
+    return {'meta': meta, 'results': results}
+
+
+def compare(base, new, threshold=0.10, metric='time_s'):
+    """
+    Membandingkan dua hasil benchmark dan menandai regresi.
+
+    Args:
+        base (dict): Hasil run sebelumnya.
+        new (dict): Hasil run baru.
+        threshold (float): Kenaikan relatif yang dianggap regresi (0.10 = 10%).
+        metric (str): 'time_s' atau 'peak_bytes'.
+
+    Returns:
+        list: Baris perbandingan {'method', 'stage', 'alternatives', 'criteria', 'base', 'new', 'change', 'regression'}.
+    """
+    def key(row):
+        return row['method'], row['stage'], row['alternatives'], row['criteria']
+
+    base_rows = {key(row): row for row in base['results']}
+    rows = []
+    for row in new['results']:
+        old = base_rows.get(key(row))
+        if old is None:
+            continue
+        change = (row[metric] - old[metric]) / old[metric] if old[metric] else 0.0
+        rows.append({
+            'method': row['method'],
+            'stage': row['stage'],
+            'alternatives': row['alternatives'],
+            'criteria': row['criteria'],
+            'base': old[metric],
+            'new': row[metric],
+            'change': change,
+            'regression': change > threshold,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark metode SPK.")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = sub.add_parser('run', help="Menjalankan sweep benchmark.")
+    run_parser.add_argument('--methods', nargs='+', default=list(METHODS), choices=list(METHODS))
+    run_parser.add_argument('--alternatives', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    run_parser.add_argument('--criteria', type=int, nargs='+', default=[5, 20])
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--target-cr', type=float, default=0.05, help="CR matriks AHP sintetis.")
+    run_parser.add_argument('--ahp-max-alternatives', type=int, default=200)
+    run_parser.add_argument('--output', help="File JSON hasil (default stdout).")
+
+    compare_parser = sub.add_parser('compare', help="Membandingkan dua hasil dan menandai regresi.")
+    compare_parser.add_argument('base')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=0.10)
+    compare_parser.add_argument('--metric', default='time_s', choices=['time_s', 'peak_bytes'])
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        report = run(args.methods, args.alternatives, args.criteria, args.repeat, args.seed,
+                     args.ahp_max_alternatives, args.target_cr)
+        text = json.dumps(report, indent=2)
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(text)
+        else:
+            print(text)
+        return 0
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    rows = compare(base, new, args.threshold, args.metric)
+    print(json.dumps(rows, indent=2))
+    regressions = [row for row in rows if row['regression']]
+    for row in regressions:
+        print(f"REGRESI {row['method']} {row['stage']} n={row['alternatives']} m={row['criteria']}: "
+              f"{row['base']:.6g} -> {row['new']:.6g} ({row['change']:+.1%})", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,9 @@
-const { app, BrowserWindow } = require('electron'); 
+const { app, BrowserWindow, ipcMain } = require('electron'); 
 const path = require('path'); 
+const { PythonWorkerPool } = require('./python-worker');
 
 let mainWindow;
+let workerPool;
 
 function createWindow() {
   mainWindow = new BrowserWindow({
@@ -19,6 +21,12 @@ function createWindow() {
 }
 
 app.whenReady().then(() => {
+  // Worker Python dijalankan sekali dan dipakai ulang untuk setiap perhitungan
+  workerPool = new PythonWorkerPool();
+  ipcMain.handle('compute', (_, method, params) => workerPool.request(method, params));
+  // Hasil biner (Buffer) dikirim ke renderer sebagai Uint8Array tanpa encoding JSON
+  ipcMain.handle('compute-binary', (_, method, params) => workerPool.request(method, params, 'binary'));
+
   createWindow();
 
   app.on('activate', () => {
@@ -26,6 +34,10 @@ app.whenReady().then(() => {
   });
 });
 
+app.on('will-quit', () => {
+  if (workerPool) workerPool.close();
+});
+
 app.on('window-all-closed', () => {
   if (process.platform !== 'darwin') app.quit();
 });
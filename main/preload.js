@@ -4,4 +4,6 @@ const { contextBridge, ipcRenderer } = require('electron');
 contextBridge.exposeInMainWorld('api', {
   sendMessage: (message) => ipcRenderer.send('message', message),
   onMessage: (callback) => ipcRenderer.on('reply', (_, data) => callback(data)),
+  compute: (method, params) => ipcRenderer.invoke('compute', method, params),
+  computeBinary: (method, params) => ipcRenderer.invoke('compute-binary', method, params),
 });
@@ -0,0 +1,155 @@
+const { spawn } = require('child_process');
+const path = require('path');
+
+// Direktori root proyek (tempat package methods berada)
+const PROJECT_ROOT = path.join(__dirname, '..');
+
+// Worker yang berhenti dijalankan ulang dengan jeda yang berlipat dua (backoff), paling banyak
+// MAX_RESTARTS kali berturut-turut; hitungan direset setiap kali worker berhasil membalas request.
+const MAX_RESTARTS = 5;
+const RESTART_DELAY_MS = 250;
+
+// Satu proses Python yang tetap hidup dan menerima request JSON per baris.
+// Response berupa satu baris JSON; untuk format 'binary' baris itu diikuti `length` byte frame biner
+// (lihat methods/transport.py) yang diteruskan apa adanya sebagai Buffer.
+class PythonWorker {
+  constructor(pythonPath) {
+    this.pythonPath = pythonPath;
+    this.pending = new Map();
+    this.process = null;
+    this.alive = false;        // True selama proses berjalan dan stdin bisa ditulis
+    this.closed = false;
+    this.restarts = 0;         // Jumlah restart berturut-turut tanpa response yang berhasil
+    this.restartTimer = null;
+    this.start();
+  }
+
+  start() {
+    this.restartTimer = null;
+    const child = spawn(this.pythonPath, ['-u', '-m', 'methods.worker'], { cwd: PROJECT_ROOT });
+    this.process = child;
+    this.alive = true;
+
+    this.buffer = Buffer.alloc(0);
+    this.awaiting = null; // Header response biner yang sedang menunggu payload
+    child.stdout.on('data', (chunk) => this.handleData(chunk));
+
+    child.stderr.on('data', (data) => {
+      console.error(`Python worker: ${data}`);
+    });
+
+    // Misal python tidak ditemukan (ENOENT): 'exit' tidak selalu dipanggil, jadi ditangani di sini juga
+    child.on('error', (error) => this.handleStop(child, new Error(`Python worker gagal dijalankan: ${error.message}`)));
+    // Menulis ke stdin proses yang sudah berhenti (EPIPE) tidak boleh menjadi exception yang tidak tertangani
+    child.stdin.on('error', (error) => this.handleStop(child, new Error(`Python worker tidak bisa menerima request: ${error.message}`)));
+    child.on('exit', (code) => this.handleStop(child, new Error(`Python worker berhenti dengan kode ${code}`)));
+  }
+
+  handleStop(child, error) {
+    if (child !== this.process || !this.alive) return; // Sudah ditangani (error dan exit bisa sama-sama terjadi)
+    this.alive = false;
+    this.rejectAll(error);
+    if (this.closed) return;
+    if (this.restarts >= MAX_RESTARTS) {
+      console.error(`Python worker tidak dijalankan ulang setelah ${MAX_RESTARTS} kali gagal: ${error.message}`);
+      return;
+    }
+    const delay = RESTART_DELAY_MS * 2 ** this.restarts;
+    this.restarts += 1;
+    this.restartTimer = setTimeout(() => this.start(), delay);
+  }
+
+  rejectAll(error) {
+    for (const { reject } of this.pending.values()) {
+      reject(error);
+    }
+    this.pending.clear();
+  }
+
+  handleData(chunk) {
+    this.buffer = this.buffer.length ? Buffer.concat([this.buffer, chunk]) : chunk;
+    for (;;) {
+      if (this.awaiting) {
+        // Menunggu sampai seluruh payload biner diterima
+        const { length } = this.awaiting;
+        if (this.buffer.length < length) return;
+        const payload = this.buffer.subarray(0, length);
+        this.buffer = this.buffer.subarray(length);
+        const response = this.awaiting;
+        this.awaiting = null;
+        this.settle(response, payload);
+        continue;
+      }
+      const newline = this.buffer.indexOf(0x0a);
+      if (newline === -1) return;
+      const line = this.buffer.subarray(0, newline).toString('utf8');
+      this.buffer = this.buffer.subarray(newline + 1);
+      this.handleLine(line);
+    }
+  }
+
+  handleLine(line) {
+    let response;
+    try {
+      response = JSON.parse(line);
+    } catch (error) {
+      console.error(`Response worker tidak valid: ${line}`);
+      return;
+    }
+    if (response.format === 'binary') {
+      this.awaiting = response;
+      return;
+    }
+    this.settle(response, response.result);
+  }
+
+  settle(response, result) {
+    this.restarts = 0; // Worker membalas: restart berikutnya dimulai lagi dari jeda terpendek
+    const entry = this.pending.get(response.id);
+    if (!entry) return;
+    this.pending.delete(response.id);
+    if (response.ok) {
+      entry.resolve(result);
+    } else {
+      entry.reject(new Error(response.error));
+    }
+  }
+
+  send(id, method, params, format = 'json') {
+    if (!this.alive) {
+      return Promise.reject(new Error('Python worker tidak berjalan.'));
+    }
+    return new Promise((resolve, reject) => {
+      this.pending.set(id, { resolve, reject });
+      this.process.stdin.write(JSON.stringify({ id, method, params, format }) + '\n');
+    });
+  }
+
+  close() {
+    this.closed = true;
+    clearTimeout(this.restartTimer);
+    if (this.alive) this.process.stdin.end();
+  }
+}
+
+// Kumpulan worker; request dikirim ke worker dengan antrian paling sedikit
+class PythonWorkerPool {
+  constructor({ size = 2, pythonPath = 'python' } = {}) {
+    this.nextId = 1;
+    this.workers = Array.from({ length: size }, () => new PythonWorker(pythonPath));
+  }
+
+  request(method, params, format = 'json') {
+    // Worker yang sedang mati dilewati; jika semua mati, send menolak request dengan error
+    const alive = this.workers.filter((w) => w.alive);
+    const candidates = alive.length ? alive : this.workers;
+    const worker = candidates.reduce((best, w) => (w.pending.size < best.pending.size ? w : best));
+    return worker.send(this.nextId++, method, params, format);
+  }
+
+  close() {
+    this.workers.forEach((worker) => worker.close());
+  }
+}
+
+module.exports = { PythonWorker, PythonWorkerPool };
@@ -1,11 +1,45 @@
 # methods/ahp.py
 
+import copy
+
 import numpy as np
 import pandas as pd
 
 from .base_method import BaseMethod
+from .cache import PriorityCache
+from .group import GeometricMeanAccumulator, comparison_matrices, iter_chunks
+from .packed import PackedComparisons, solve_packed
+from .priority import SOLVERS, connected_components, log_least_squares_priorities, solve_priorities
+from .results import LazyResults
+from .trace import DEBUG, Traceable, Tracer
+
+# Random Index (RI) berdasarkan ukuran matriks, dipakai untuk menghitung Consistency Ratio
+RANDOM_INDEX = {1: 0.0, 2: 0.0, 3: 0.58, 4: 0.90, 5: 1.12,
+                6: 1.24, 7: 1.32, 8: 1.41, 9: 1.45, 10: 1.49}
+
+
+def reciprocal_matrix(n, comparisons):
+    """
+    Membentuk matriks perbandingan berpasangan n x n dari daftar (i, j, value): a_ij = value, a_ji = 1 / value,
+    diagonal dan pasangan yang tidak diberikan bernilai 1.
+    """
+    matrix = np.ones((n, n))  # Inisialisasi matriks dengan 1 di diagonal utama
+    for (i, j, value) in comparisons:
+        matrix[i, j] = value              # Menetapkan nilai perbandingan
+        matrix[j, i] = 1 / value          # Menetapkan invers dari nilai perbandingan
+    return matrix
+
+
+def consistency_ratios(lambda_max, n):
+    """
+    Consistency Ratio untuk banyak matriks berukuran n sekaligus dari lambda_max (k,).
+    """
+    RI = RANDOM_INDEX.get(n, 1.49)
+    if RI == 0:
+        return np.zeros(len(lambda_max))  # Menghindari pembagian dengan nol jika RI=0
+    return (lambda_max - n) / (n - 1) / RI
 
-class AHP(BaseMethod):
+class AHP(BaseMethod, Traceable):
     def __init__(self, criteria, alternatives):
         """
         Inisialisasi kelas AHP dengan kriteria dan alternatif yang diberikan.
@@ -20,7 +54,80 @@ class AHP(BaseMethod):
         self.alternative_matrices = {}     # Matriks perbandingan berpasangan antar alternatif untuk setiap kriteria
         self.alternative_weights = {}      # Bobot alternatif untuk setiap kriteria setelah perhitungan
         self.final_ranking = None          # Ranking akhir alternatif berdasarkan bobot kriteria dan bobot alternatif
-        self.steps = []                    # Menyimpan langkah-langkah pengerjaan untuk dokumentasi
+        self.tracer = Tracer()             # Langkah-langkah pengerjaan (lihat set_trace dan self.steps)
+        self.solver = 'eig'                # Solver bobot prioritas ('eig', 'power' atau 'geometric_mean')
+        self.solver_options = {}           # Opsi solver, misal tol dan max_iter untuk 'power'
+        self.diagnostics = {'criteria': None, 'alternatives': {}}  # Diagnostik konvergensi solver per matriks
+        self.last_diagnostics = None       # Hasil solver terakhir beserta diagnostiknya
+        self.consistency_ratios = {'criteria': None, 'alternatives': {}}  # CR terakhir per matriks
+        self.dirty = {'criteria'} | set(criteria)  # Matriks yang berubah sejak perform_ahp terakhir
+        self.cache = None                  # PriorityCache opsional untuk bobot, lambda_max dan CR
+        self.group_summary = {}            # Ringkasan agregasi kelompok (GDSS) per matriks
+        self.sparse_comparisons = {}       # Perbandingan tidak lengkap per matriks: {'rows', 'cols', 'values'}
+        # Copy-on-write dengan snapshot get_results: wadah dan matriks yang boleh diubah di tempat (lihat _own)
+        self.owned_buffers = {'alternative_matrices', 'sparse_comparisons', 'alternative_weights', 'diagnostics'}
+        self.owned_matrices = set()        # Matriks dense/perbandingan tidak lengkap yang dibuat sejak snapshot terakhir
+    
+    def set_cache(self, cache=1024):
+        """
+        Mengaktifkan cache bobot prioritas (LRU, key = hash isi matriks). Cache bisa dipakai bersama oleh
+        banyak objek AHP. Saat cache aktif, power iteration tidak memakai warm start agar hasil dari cache
+        selalu identik dengan hasil perhitungan baru.
+        
+        Args:
+            cache (PriorityCache | int | None): Objek cache, ukuran maksimum cache baru, atau None untuk menonaktifkan.
+        """
+        if cache is None or isinstance(cache, PriorityCache):
+            self.cache = cache
+        else:
+            self.cache = PriorityCache(maxsize=cache)
+        self.mark_dirty()
+    
+    def set_storage(self, storage='packed', dtype=np.float64):
+        """
+        Memilih cara penyimpanan matriks perbandingan alternatif.
+        
+        'packed' menyimpan hanya segitiga atas semua matriks dalam satu buffer kontigu (lihat PackedComparisons),
+        sehingga memori kurang dari setengah matriks lengkap (seperempat dengan float32). Solver 'power' dan
+        'geometric_mean' bekerja langsung pada bentuk packed; matriks lengkap hanya dibentuk saat diminta
+        (misal self.alternative_matrices['kriteria'] atau solver 'eig').
+        
+        Args:
+            storage (str): 'packed' atau 'dense' (dictionary ndarray n x n, default awal).
+            dtype: Tipe data buffer packed, np.float64 atau np.float32.
+        """
+        if storage == 'packed':
+            packed = PackedComparisons(self.criteria, len(self.alternatives), dtype)
+            for name, matrix in self.alternative_matrices.items():
+                packed[name] = matrix
+            self.alternative_matrices = packed
+        elif storage == 'dense':
+            self.alternative_matrices = {name: matrix for name, matrix in self.alternative_matrices.items()}
+        else:
+            raise ValueError(f"Penyimpanan '{storage}' tidak dikenal. Pilihan: packed, dense.")
+        self.owned_buffers.add('alternative_matrices')
+        self.mark_dirty()
+    
+    def _is_packed(self):
+        """
+        True jika matriks alternatif disimpan dalam bentuk packed.
+        """
+        return isinstance(self.alternative_matrices, PackedComparisons)
+    
+    def set_solver(self, solver, **options):
+        """
+        Memilih solver untuk menghitung bobot prioritas.
+        
+        Args:
+            solver (str): 'eig' (eksak, default), 'power' (power iteration) atau 'geometric_mean' (rata-rata geometrik baris).
+            **options: Opsi solver, misal tol dan max_iter untuk 'power'.
+        """
+        if solver not in SOLVERS:
+            raise ValueError(f"Solver '{solver}' tidak dikenal. Pilihan: {', '.join(SOLVERS)}.")
+        self.solver = solver
+        self.solver_options = options
+        self.mark_dirty()  # Solver berbeda: semua bobot harus dihitung ulang
+        self.tracer.emit('step', 'input', "Solver bobot prioritas diatur ke '{solver}'.", solver=solver)
     
     def set_criteria_comparisons(self, comparisons):
         """
@@ -30,12 +137,10 @@ class AHP(BaseMethod):
             comparisons (list of tuples): Daftar tuple dalam format (i, j, value) 
                 dimana 'i' dan 'j' adalah indeks kriteria dan 'value' adalah nilai perbandingan kriteria_i terhadap kriteria_j.
         """
-        n = len(self.criteria)
-        self.criteria_matrix = np.ones((n, n))  # Inisialisasi matriks dengan 1 di diagonal utama
-        for (i, j, value) in comparisons:
-            self.criteria_matrix[i, j] = value              # Menetapkan nilai perbandingan
-            self.criteria_matrix[j, i] = 1 / value          # Menetapkan invers dari nilai perbandingan
-        self.steps.append("Perbandingan kriteria dimasukkan.")  # Menyimpan langkah pengerjaan
+        self._store_matrix('criteria', reciprocal_matrix(len(self.criteria), comparisons))
+        self._drop('sparse_comparisons', 'criteria')
+        self.dirty.add('criteria')
+        self.tracer.emit('step', 'input', "Perbandingan kriteria dimasukkan.", target='criteria')  # Menyimpan langkah pengerjaan
     
     def set_alternative_comparisons(self, criteria, comparisons):
         """
@@ -47,29 +152,369 @@ class AHP(BaseMethod):
                 dimana 'i' dan 'j' adalah indeks alternatif dan 'value' adalah nilai perbandingan alternatif_i terhadap alternatif_j.
         """
         n = len(self.alternatives)
-        if criteria not in self.alternative_matrices:
-            self.alternative_matrices[criteria] = np.ones((n, n))  # Inisialisasi matriks dengan 1 di diagonal utama jika belum ada
-        matrix = self.alternative_matrices[criteria]
-        for (i, j, value) in comparisons:
-            matrix[i, j] = value              # Menetapkan nilai perbandingan
-            matrix[j, i] = 1 / value          # Menetapkan invers dari nilai perbandingan
-        self.steps.append(f"Perbandingan alternatif untuk kriteria '{criteria}' dimasukkan.")  # Menyimpan langkah pengerjaan
+        if self._is_packed():
+            self._own('alternative_matrices').set_comparisons(criteria, comparisons)  # Hanya segitiga atas yang disimpan
+        else:
+            if criteria not in self.alternative_matrices:
+                self._store_matrix(criteria, np.ones((n, n)))  # Inisialisasi matriks dengan 1 di diagonal utama jika belum ada
+            matrix = self._own_matrix(criteria)
+            for (i, j, value) in comparisons:
+                matrix[i, j] = value              # Menetapkan nilai perbandingan
+                matrix[j, i] = 1 / value          # Menetapkan invers dari nilai perbandingan
+        self._drop('sparse_comparisons', criteria)
+        self.dirty.add(criteria)
+        self.tracer.emit('step', 'input', "Perbandingan alternatif untuk kriteria '{target}' dimasukkan.", target=criteria)  # Menyimpan langkah pengerjaan
+    
+    def update_comparison(self, name, i, j, value):
+        """
+        Mengubah satu nilai perbandingan (i, j) tanpa mengatur ulang matriks. Hanya matriks ini yang
+        dihitung ulang pada perform_ahp berikutnya.
+        
+        Args:
+            name (str): 'criteria' untuk matriks kriteria, atau nama kriteria untuk matriks alternatif.
+            i (int): Indeks baris.
+            j (int): Indeks kolom.
+            value (float): Nilai perbandingan item_i terhadap item_j.
+        """
+        n = self._group_size(name)  # Validasi sebelum state apa pun diubah
+        if i == j:
+            raise ValueError("Perbandingan item dengan dirinya sendiri selalu 1.")
+        if not (0 <= i < n and 0 <= j < n):
+            raise ValueError(f"Indeks perbandingan untuk '{name}' harus 0..{n - 1}.")
+        if not value > 0:
+            raise ValueError(f"Nilai perbandingan untuk '{name}' harus > 0.")
+        if name in self.sparse_comparisons:
+            self._update_sparse_comparison(name, i, j, value)
+        elif name != 'criteria' and self._is_packed():
+            if name not in self.alternative_matrices:
+                raise ValueError(f"Perbandingan alternatif untuk kriteria '{name}' belum dimasukkan.")
+            self._own('alternative_matrices').set_value(name, i, j, value)
+        else:
+            matrix = self._own_matrix(name)
+            matrix[i, j] = value
+            matrix[j, i] = 1 / value
+        self.dirty.add(name)
+        self.tracer.emit('step', 'update', "Perbandingan ({i}, {j}) pada '{target}' diubah menjadi {value}.",
+                         target=name, i=i, j=j, value=value)
+    
+    def set_sparse_comparisons(self, name, comparisons):
+        """
+        Mengatur perbandingan berpasangan yang tidak lengkap. Pasangan yang tidak diberikan tidak dianggap 1,
+        melainkan tidak diketahui; bobot dihitung dengan logarithmic least squares di atas graf perbandingan
+        (lihat log_least_squares_priorities) dan konsistensi dilaporkan sebagai Geometric Consistency Index.
+        Perbandingan cukup menghubungkan semua item, misal n - 1 perbandingan dalam bentuk rantai atau pohon.
+        
+        Args:
+            name (str): 'criteria' untuk matriks kriteria, atau nama kriteria untuk matriks alternatif.
+            comparisons (list of tuples): Daftar tuple (i, j, value) seperti pada set_criteria_comparisons.
+        """
+        n = self._group_size(name)
+        comparisons = np.asarray(comparisons, dtype=float).reshape(-1, 3)
+        rows = comparisons[:, 0].astype(np.int64)
+        cols = comparisons[:, 1].astype(np.int64)
+        values = comparisons[:, 2]
+        if np.any((rows < 0) | (rows >= n) | (cols < 0) | (cols >= n)) or np.any(rows == cols):
+            raise ValueError(f"Indeks perbandingan untuk '{name}' harus 0..{n - 1} dan i != j.")
+        if np.any(values <= 0):
+            raise ValueError(f"Nilai perbandingan untuk '{name}' harus > 0.")
+        n_components = len(np.unique(connected_components(n, rows, cols)))
+        if n_components > 1:
+            raise ValueError(f"Perbandingan untuk '{name}' tidak menghubungkan semua item ({n_components} kelompok terpisah).")
+        
+        self._own('sparse_comparisons')[name] = {'rows': rows, 'cols': cols, 'values': values}
+        self.owned_matrices.add(name)
+        if name == 'criteria':
+            self.criteria_matrix = None
+        else:
+            self._drop('alternative_matrices', name)
+        self.dirty.add(name)
+        self.tracer.emit('step', 'input', "Perbandingan tidak lengkap untuk '{target}' dimasukkan ({comparisons} perbandingan).",
+                         target=name, comparisons=len(values))
+    
+    def _update_sparse_comparison(self, name, i, j, value):
+        """
+        Mengganti perbandingan (i, j) atau (j, i) pada perbandingan tidak lengkap, atau menambahkannya jika belum ada.
+        """
+        if name not in self.owned_matrices:
+            # Perbandingan masih dipakai bersama snapshot get_results: disalin sebelum diubah
+            self._own('sparse_comparisons')[name] = {key: array.copy() for key, array in self.sparse_comparisons[name].items()}
+            self.owned_matrices.add(name)
+        sparse = self.sparse_comparisons[name]
+        rows, cols, values = sparse['rows'], sparse['cols'], sparse['values']
+        match = np.flatnonzero(((rows == i) & (cols == j)) | ((rows == j) & (cols == i)))
+        if len(match):
+            k = match[0]
+            values[k] = value if rows[k] == i else 1 / value
+        else:
+            sparse['rows'] = np.append(rows, i)
+            sparse['cols'] = np.append(cols, j)
+            sparse['values'] = np.append(values, value)
+    
+    def _sparse_weights(self, name):
+        """
+        Menghitung bobot dari perbandingan tidak lengkap dan menyimpan diagnostiknya (termasuk GCI).
+        """
+        sparse = self.sparse_comparisons[name]
+        n = self._group_size(name)
+        result = log_least_squares_priorities(n, sparse['rows'], sparse['cols'], sparse['values'])
+        self.last_diagnostics = result
+        diagnostics = {
+            'solver': result['solver'],
+            'iterations': result['iterations'],
+            'converged': result['converged'],
+            'residual': result['residual'],
+            'comparisons': len(sparse['values']),
+            'gci': result['gci'],
+            'gci_threshold': result['gci_threshold'],
+        }
+        if name == 'criteria':
+            self._own('diagnostics')['criteria'] = diagnostics
+            self.consistency_ratios['criteria'] = None
+        else:
+            self._own('diagnostics')['alternatives'][name] = diagnostics
+            self.consistency_ratios['alternatives'][name] = None
+        return result['weights']
+    
+    def _emit_sparse_consistency(self, name, stage):
+        """
+        Mencatat Geometric Consistency Index untuk matriks dengan perbandingan tidak lengkap.
+        """
+        diagnostics = self.diagnostics['criteria'] if name == 'criteria' else self.diagnostics['alternatives'][name]
+        GCI, threshold = diagnostics['gci'], diagnostics['gci_threshold']
+        self.tracer.emit('metric', stage, "Geometric Consistency Index untuk '{target}': {GCI:.4f}", target=name, GCI=GCI)
+        if self.tracer.enabled(DEBUG):
+            self.tracer.emit('diagnostics', stage, target=name, level=DEBUG, **diagnostics)
+        if GCI > threshold:
+            self.tracer.emit('warning', stage,
+                             "Warning: Geometric Consistency Index untuk '{target}' melebihi {threshold}. Pertimbangkan untuk merevisi perbandingan Anda.",
+                             target=name, GCI=GCI, threshold=threshold)
+        else:
+            self.tracer.emit('step', stage, "Geometric Consistency Index untuk '{target}' dapat diterima.", target=name)
+    
+    def set_group_comparisons(self, name, assessors, weights=None, cr_threshold=None, chunk_size=256):
+        """
+        Agregasi penilaian individu (AIJ) untuk keputusan kelompok: matriks perbandingan diisi rata-rata
+        geometrik (berbobot) elemen per elemen dari matriks semua assessor. Assessor diproses per chunk dan
+        diakumulasi di ruang log, sehingga memori tetap O(n^2) berapa pun jumlah assessor.
+        
+        Args:
+            name (str): 'criteria' untuk matriks kriteria, atau nama kriteria untuk matriks alternatif.
+            assessors (iterable): Penilaian per assessor (boleh generator): np.ndarray (n, n) atau list tuple (i, j, value).
+            weights (iterable, optional): Bobot per assessor. Default bobot sama.
+            cr_threshold (float, optional): Assessor dengan CR di atas batas ini diabaikan; CR satu chunk dihitung dalam satu batch.
+            chunk_size (int): Jumlah assessor per chunk.
+        
+        Returns:
+            dict: 'assessors' (jumlah), 'included' (jumlah yang dipakai) dan 'excluded' (indeks assessor yang diabaikan).
+        """
+        n = self._group_size(name)
+        accumulator = GeometricMeanAccumulator((n, n))
+        summary = {'assessors': 0, 'included': 0, 'excluded': []}
+        for matrices, chunk_weights, _ in self._group_chunks(n, assessors, weights, cr_threshold, chunk_size, summary):
+            accumulator.add(matrices, chunk_weights)
+        if accumulator.count == 0:
+            raise ValueError(f"Tidak ada penilaian assessor yang memenuhi syarat untuk '{name}'.")
+        
+        self._store_matrix(name, accumulator.mean())
+        self._drop('sparse_comparisons', name)
+        self.dirty.add(name)
+        self.group_summary[name] = summary
+        self.tracer.emit('step', 'group', "Penilaian {included} dari {assessors} assessor untuk '{target}' diagregasi (AIJ).",
+                         target=name, assessors=summary['assessors'], included=summary['included'])
+        return summary
     
-    def calculate_weights_from_matrix(self, matrix):
+    def group_priorities(self, name, assessors, weights=None, cr_threshold=None, chunk_size=256):
         """
-        Menghitung bobot (prioritas) dari matriks perbandingan berpasangan menggunakan eigenvector utama.
+        Agregasi prioritas individu (AIP): bobot prioritas setiap assessor dihitung per chunk dalam satu batch,
+        lalu digabung dengan rata-rata geometrik berbobot dan dinormalisasi. Matriks model tidak diubah.
+        
+        Args:
+            name (str): 'criteria' atau nama kriteria (menentukan ukuran matriks).
+            assessors (iterable): Penilaian per assessor (lihat set_group_comparisons).
+            weights (iterable, optional): Bobot per assessor. Default bobot sama.
+            cr_threshold (float, optional): Assessor dengan CR di atas batas ini diabaikan.
+            chunk_size (int): Jumlah assessor per chunk.
+        
+        Returns:
+            dict: 'weights' (prioritas kelompok), 'assessors', 'included' dan 'excluded'.
+        """
+        n = self._group_size(name)
+        accumulator = GeometricMeanAccumulator(n)
+        summary = {'assessors': 0, 'included': 0, 'excluded': []}
+        for matrices, chunk_weights, priorities in self._group_chunks(n, assessors, weights, cr_threshold, chunk_size, summary):
+            if priorities is None:
+                priorities = self.calculate_weights_batch(matrices)[0]
+            accumulator.add(priorities, chunk_weights)
+        if accumulator.count == 0:
+            raise ValueError(f"Tidak ada penilaian assessor yang memenuhi syarat untuk '{name}'.")
+        
+        group = accumulator.mean()
+        self.tracer.emit('step', 'group', "Prioritas {included} dari {assessors} assessor untuk '{target}' diagregasi (AIP).",
+                         target=name, assessors=summary['assessors'], included=summary['included'])
+        return {'weights': group / group.sum(), **summary}
+    
+    def _group_size(self, name):
+        """
+        Ukuran matriks perbandingan untuk 'criteria' atau nama kriteria.
+        """
+        if name == 'criteria':
+            return len(self.criteria)
+        if name not in self.criteria:
+            raise ValueError(f"Kriteria '{name}' tidak dikenal.")
+        return len(self.alternatives)
+    
+    def _group_chunks(self, n, assessors, weights, cr_threshold, chunk_size, summary):
+        """
+        Membentuk matriks assessor per chunk dan (opsional) membuang assessor dengan CR di atas batas.
+        
+        Yields:
+            tuple: (matriks (k, n, n), bobot (k,), bobot prioritas (k, n) atau None jika CR tidak dihitung).
+        """
+        for judgments, chunk_weights in iter_chunks(assessors, weights, chunk_size):
+            matrices = comparison_matrices(judgments, n)
+            offset = summary['assessors']
+            summary['assessors'] += len(matrices)
+            if cr_threshold is None:
+                summary['included'] += len(matrices)
+                yield matrices, chunk_weights, None
+                continue
+            priorities, _, CR = self.calculate_weights_batch(matrices)
+            keep = CR <= cr_threshold
+            summary['included'] += int(keep.sum())
+            summary['excluded'].extend((offset + np.flatnonzero(~keep)).tolist())
+            yield matrices[keep], chunk_weights[keep], priorities[keep]
+    
+    def _own(self, name):
+        """
+        Wadah self.<name> ('alternative_matrices', 'sparse_comparisons', 'alternative_weights' atau 'diagnostics')
+        yang boleh diubah. Jika masih dipakai bersama snapshot get_results, wadah disalin lebih dulu (copy-on-write):
+        dictionary disalin dangkal (isinya tetap dipakai bersama), buffer packed disalin utuh.
+        """
+        value = getattr(self, name)
+        if name not in self.owned_buffers:
+            if name == 'alternative_matrices' and self._is_packed():
+                value = value.copy()
+            elif name == 'diagnostics':
+                value = {'criteria': value['criteria'], 'alternatives': dict(value['alternatives'])}
+            else:
+                value = dict(value)
+            setattr(self, name, value)
+            self.owned_buffers.add(name)
+        return value
+    
+    def _own_matrix(self, name):
+        """
+        Matriks dense 'criteria' atau nama kriteria yang boleh diubah di tempat; matriks yang masih dipakai bersama
+        snapshot get_results disalin lebih dulu (copy-on-write), hanya matriks ini saja.
+        """
+        matrix = self._matrix(name)
+        if name not in self.owned_matrices:
+            matrix = matrix.copy()
+            self._store_matrix(name, matrix)
+        return matrix
+    
+    def _store_matrix(self, name, matrix):
+        """
+        Menyimpan matriks baru untuk 'criteria' atau nama kriteria sebagai milik objek ini.
+        """
+        if name == 'criteria':
+            self.criteria_matrix = matrix
+        else:
+            self._own('alternative_matrices')[name] = matrix
+        self.owned_matrices.add(name)
+    
+    def _drop(self, container, name):
+        """
+        Menghapus entri name dari wadah self.<container> jika ada (copy-on-write, lihat _own).
+        """
+        if name in getattr(self, container):
+            del self._own(container)[name]
+    
+    def mark_dirty(self, name=None):
+        """
+        Menandai matriks agar dihitung ulang pada perform_ahp berikutnya. Dipakai jika matriks diubah langsung.
+        
+        Args:
+            name (str, optional): 'criteria' atau nama kriteria. Default semua matriks.
+        """
+        if name is None:
+            self.dirty.update(['criteria'] + list(self.criteria))
+        else:
+            self.dirty.add(name)
+    
+    def _matrix(self, name):
+        """
+        Mengambil matriks perbandingan berdasarkan nama ('criteria' atau nama kriteria).
+        """
+        if name == 'criteria':
+            if self.criteria_matrix is None:
+                raise ValueError("Perbandingan kriteria belum dimasukkan.")
+            return self.criteria_matrix
+        if name not in self.alternative_matrices:
+            raise ValueError(f"Perbandingan alternatif untuk kriteria '{name}' belum dimasukkan.")
+        return self.alternative_matrices[name]
+    
+    def _current_weights(self, name):
+        """
+        Mengambil bobot terakhir dari matriks ('criteria' atau nama kriteria), None jika belum dihitung.
+        """
+        if name == 'criteria':
+            return self.criteria_weights
+        return self.alternative_weights.get(name)
+    
+    def consistency_contributions(self, name='criteria', top=None):
+        """
+        Menunjukkan pasangan perbandingan yang paling menyebabkan inkonsistensi, memakai bobot saat ini (O(n^2),
+        tanpa dekomposisi eigen tambahan).
+        
+        Untuk eigenvector utama w berlaku lambda_max - n = (1/n) * sum_{i<j} (e_ij + 1/e_ij - 2) dengan
+        e_ij = a_ij * w_j / w_i, sehingga kontribusi setiap pasangan terhadap CI adalah
+        (e_ij + 1/e_ij - 2) / (n * (n - 1)).
+        
+        Args:
+            name (str): 'criteria' atau nama kriteria untuk matriks alternatif.
+            top (int, optional): Jumlah pasangan teratas yang dikembalikan. Default semua pasangan.
+        
+        Returns:
+            list of dict: Untuk setiap pasangan (terurut dari kontribusi terbesar): 'i', 'j', 'value',
+                'suggested' (w_i / w_j, nilai yang konsisten dengan bobot) dan 'contribution' (kontribusi ke CI).
+        """
+        matrix = self._matrix(name)
+        weights = self._current_weights(name)
+        if weights is None or name in self.dirty:
+            raise ValueError(f"Bobot '{name}' belum diperbarui. Jalankan perform_ahp terlebih dahulu.")
+        n = matrix.shape[0]
+        if n < 3:
+            return []
+        rows, cols = np.triu_indices(n, 1)
+        values = matrix[rows, cols]
+        suggested = weights[rows] / weights[cols]
+        error = values / suggested                                      # e_ij = a_ij * w_j / w_i
+        contribution = (error + 1 / error - 2) / (n * (n - 1))
+        order = np.argsort(contribution, kind='stable')[::-1]
+        if top is not None:
+            order = order[:top]
+        return [
+            {'i': int(rows[k]), 'j': int(cols[k]), 'value': float(values[k]),
+             'suggested': float(suggested[k]), 'contribution': float(contribution[k])}
+            for k in order
+        ]
+    
+    def calculate_weights_from_matrix(self, matrix, initial=None):
+        """
+        Menghitung bobot (prioritas) dari matriks perbandingan berpasangan menggunakan solver yang dipilih
+        (default eigenvector utama). Diagnostik konvergensi disimpan di self.last_diagnostics.
         
         Args:
             matrix (np.ndarray): Matriks perbandingan berpasangan.
+            initial (np.ndarray, optional): Bobot awal untuk warm start power iteration.
         
         Returns:
             np.ndarray: Bobot yang telah dinormalisasi.
         """
-        eigvals, eigvecs = np.linalg.eig(matrix)             # Menghitung nilai eigen dan vektor eigen
-        max_index = np.argmax(eigvals.real)                  # Menemukan indeks nilai eigen terbesar (principal eigenvalue)
-        principal_eigvec = eigvecs[:, max_index].real        # Mengambil vektor eigen utama
-        normalized_weights = principal_eigvec / principal_eigvec.sum()  # Normalisasi bobot
-        return normalized_weights
+        result = solve_priorities(matrix, self.solver, **self._solver_options(initial))
+        self.last_diagnostics = result
+        return result['weights']
     
     def calculate_consistency_ratio(self, matrix, weights):
         """
@@ -85,70 +530,306 @@ class AHP(BaseMethod):
         n = matrix.shape[0]
         lambda_max = np.dot(matrix, weights).sum() / weights.sum()  # Menghitung lambda_max
         CI = (lambda_max - n) / (n - 1)                              # Menghitung Consistency Index (CI)
-        RI_dict = {1: 0.0, 2: 0.0, 3: 0.58, 4: 0.90, 5: 1.12,
-                   6: 1.24, 7: 1.32, 8: 1.41, 9: 1.45, 10: 1.49}
-        RI = RI_dict.get(n, 1.49)  # Mengambil Random Index (RI) berdasarkan ukuran matriks
+        RI = RANDOM_INDEX.get(n, 1.49)  # Mengambil Random Index (RI) berdasarkan ukuran matriks
         if RI == 0:
             return 0.0  # Menghindari pembagian dengan nol jika RI=0
         CR = CI / RI       # Menghitung Consistency Ratio (CR)
         return CR
     
+    def calculate_weights_batch(self, matrices, initial=None):
+        """
+        Menghitung bobot, lambda_max dan Consistency Ratio untuk banyak matriks perbandingan sekaligus.
+        Hasilnya sama dengan memanggil calculate_weights_from_matrix dan calculate_consistency_ratio
+        untuk setiap matriks, tetapi solver dijalankan dalam satu panggilan ter-vektorisasi.
+        Diagnostik konvergensi disimpan di self.last_diagnostics.
+        
+        Args:
+            matrices (np.ndarray): Tumpukan matriks perbandingan berpasangan berbentuk (k, n, n).
+            initial (np.ndarray, optional): Bobot awal (k, n) untuk warm start power iteration.
+        
+        Returns:
+            tuple: (weights berbentuk (k, n), lambda_max berbentuk (k,), CR berbentuk (k,)).
+        """
+        matrices = np.asarray(matrices, dtype=float)
+        if matrices.ndim != 3 or matrices.shape[1] != matrices.shape[2]:
+            raise ValueError("Matriks harus berbentuk (k, n, n).")
+        k, n, _ = matrices.shape
+        if k == 0:
+            return np.empty((0, n)), np.empty(0), np.empty(0)
+        
+        result = solve_priorities(matrices, self.solver, **self._solver_options(initial))
+        self.last_diagnostics = result
+        return result['weights'], result['lambda_max'], self._batch_consistency_ratios(result['lambda_max'], n)
+    
+    def calculate_weights_packed(self, values, initial=None):
+        """
+        Sama dengan calculate_weights_batch, tetapi untuk matriks alternatif dalam bentuk packed (segitiga atas).
+        
+        Args:
+            values (np.ndarray): Segitiga atas matriks berbentuk (k, n(n-1)/2).
+            initial (np.ndarray, optional): Bobot awal (k, n) untuk warm start power iteration.
+        
+        Returns:
+            tuple: (weights berbentuk (k, n), lambda_max berbentuk (k,), CR berbentuk (k,)).
+        """
+        values = np.asarray(values)
+        n = len(self.alternatives)
+        if len(values) == 0:
+            return np.empty((0, n)), np.empty(0), np.empty(0)
+        result = solve_packed(values, n, self.solver, **self._solver_options(initial))
+        self.last_diagnostics = result
+        return result['weights'], result['lambda_max'], self._batch_consistency_ratios(result['lambda_max'], n)
+    
+    @staticmethod
+    def _batch_consistency_ratios(lambda_max, n):
+        """
+        Consistency Ratio untuk banyak matriks berukuran n sekaligus dari lambda_max (lihat consistency_ratios).
+        """
+        return consistency_ratios(lambda_max, n)
+    
+    @staticmethod
+    def _summarize_diagnostics(result, index=()):
+        """
+        Mengambil diagnostik konvergensi untuk satu matriks dari hasil solver.
+        
+        Args:
+            result (dict): Hasil solve_priorities.
+            index (int | tuple): Indeks matriks pada hasil batch; () untuk hasil satu matriks.
+        
+        Returns:
+            dict: 'solver', 'iterations', 'converged', 'residual' dan 'lambda_max'.
+        """
+        return {
+            'solver': result['solver'],
+            'iterations': int(result['iterations'][index]),
+            'converged': bool(result['converged'][index]),
+            'residual': float(result['residual'][index]),
+            'lambda_max': float(result['lambda_max'][index]),
+        }
+    
+    def _cached_weights_batch(self, matrices, solve=None):
+        """
+        Mengambil bobot dan CR dari cache; matriks yang belum ada di cache dihitung bersama dalam satu batch.
+        
+        Args:
+            matrices (list of np.ndarray): Matriks perbandingan berpasangan (atau baris packed).
+            solve (callable, optional): Fungsi batch (lihat calculate_weights_batch); default calculate_weights_batch.
+        
+        Returns:
+            tuple: (list bobot, list CR, list diagnostik) sesuai urutan matriks.
+        """
+        solve = solve or self.calculate_weights_batch
+        keys = [PriorityCache.make_key(matrix, self.solver, self.solver_options) for matrix in matrices]
+        entries = [self.cache.get(key) for key in keys]
+        diagnostics = [None] * len(matrices)
+        missing = [idx for idx, entry in enumerate(entries) if entry is None]
+        if missing:
+            weights, lambda_max, CR = solve(np.stack([matrices[idx] for idx in missing]))
+            for pos, idx in enumerate(missing):
+                entries[idx] = self.cache.put(keys[idx], weights[pos], lambda_max[pos], CR[pos])
+                diagnostics[idx] = {**self._summarize_diagnostics(self.last_diagnostics, pos), 'cached': False}
+        for idx, entry in enumerate(entries):
+            if diagnostics[idx] is None:
+                diagnostics[idx] = {'solver': self.solver, 'iterations': 0, 'converged': True,
+                                    'residual': None, 'lambda_max': entry['lambda_max'], 'cached': True}
+        return [entry['weights'] for entry in entries], [entry['CR'] for entry in entries], diagnostics
+    
+    def _solver_options(self, initial):
+        """
+        Opsi solver untuk perhitungan ulang; power iteration dimulai dari bobot sebelumnya (warm start).
+        """
+        options = dict(self.solver_options)
+        if self.solver == 'power' and initial is not None:
+            options['initial'] = initial
+        return options
+    
     def perform_ahp(self):
         """
         Melakukan seluruh proses perhitungan AHP, termasuk menghitung bobot kriteria,
         bobot alternatif, serta ranking akhir alternatif.
+        
+        Hanya matriks yang berubah sejak perhitungan terakhir (lihat self.dirty) yang dihitung ulang;
+        bobot dan CR matriks lain dipakai kembali.
         """
         # Hitung bobot kriteria menggunakan matriks perbandingan kriteria
-        self.criteria_weights = self.calculate_weights_from_matrix(self.criteria_matrix)
-        CR = self.calculate_consistency_ratio(self.criteria_matrix, self.criteria_weights)  # Menghitung CR untuk kriteria
-        self.steps.append(f"Consistency Ratio untuk kriteria: {CR:.4f}")  # Menyimpan CR kriteria
-        
-        if CR > 0.1:
-            # Memberikan peringatan jika CR > 0.1
-            self.steps.append("Warning: Consistency Ratio melebihi 0.1. Pertimbangkan untuk merevisi perbandingan Anda.")
+        if 'criteria' in self.dirty or self.criteria_weights is None:
+            if 'criteria' in self.sparse_comparisons:
+                self.criteria_weights = self._sparse_weights('criteria')
+            elif self.cache is None:
+                self.criteria_weights = self.calculate_weights_from_matrix(self.criteria_matrix, initial=self.criteria_weights)
+                self._own('diagnostics')['criteria'] = self._summarize_diagnostics(self.last_diagnostics)
+                self.consistency_ratios['criteria'] = self.calculate_consistency_ratio(self.criteria_matrix, self.criteria_weights)
+            else:
+                weights, CRs, diagnostics = self._cached_weights_batch([self.criteria_matrix])
+                self.criteria_weights = weights[0]
+                self.consistency_ratios['criteria'] = CRs[0]
+                self._own('diagnostics')['criteria'] = diagnostics[0]
+        if 'criteria' in self.sparse_comparisons:
+            self._emit_sparse_consistency('criteria', 'criteria_weights')
         else:
-            self.steps.append("Consistency Ratio dapat diterima.")  # Menyimpan bahwa CR dapat diterima
+            CR = self.consistency_ratios['criteria']  # CR untuk kriteria
+            self.tracer.emit('metric', 'criteria_weights', "Consistency Ratio untuk kriteria: {CR:.4f}", target='criteria', CR=CR)
+            if self.tracer.enabled(DEBUG):
+                self.tracer.emit('diagnostics', 'criteria_weights', target='criteria', level=DEBUG, **self.diagnostics['criteria'])
+            
+            if CR > 0.1:
+                # Memberikan peringatan jika CR > 0.1
+                self.tracer.emit('warning', 'criteria_weights',
+                                 "Warning: Consistency Ratio melebihi 0.1. Pertimbangkan untuk merevisi perbandingan Anda.",
+                                 target='criteria', CR=CR)
+            else:
+                self.tracer.emit('step', 'criteria_weights', "Consistency Ratio dapat diterima.", target='criteria')
+        
+        # Hitung ulang bobot alternatif untuk kriteria yang berubah dalam satu panggilan batch
+        changed = [crit for crit in self.criteria if crit in self.dirty or crit not in self.alternative_weights]
+        for crit in [crit for crit in changed if crit in self.sparse_comparisons]:
+            self._own('alternative_weights')[crit] = self._sparse_weights(crit)
+        changed = [crit for crit in changed if crit not in self.sparse_comparisons]
+        if changed:
+            if self._is_packed():
+                # Solver bekerja langsung pada segitiga atas; matriks lengkap tidak dibentuk
+                stacked = self.alternative_matrices.packed(changed)
+                solve = self.calculate_weights_packed
+            else:
+                stacked = np.stack([self.alternative_matrices[crit] for crit in changed])
+                solve = self.calculate_weights_batch
+            if self.cache is None:
+                initial = None
+                if self.solver == 'power' and all(crit in self.alternative_weights for crit in changed):
+                    initial = np.stack([self.alternative_weights[crit] for crit in changed])
+                batch_weights, _, batch_CR = solve(stacked, initial=initial)
+                batch_diagnostics = [self._summarize_diagnostics(self.last_diagnostics, idx) for idx in range(len(changed))]
+            else:
+                batch_weights, batch_CR, batch_diagnostics = self._cached_weights_batch(list(stacked), solve)
+            alternative_weights = self._own('alternative_weights')
+            diagnostics = self._own('diagnostics')
+            for idx, crit in enumerate(changed):
+                alternative_weights[crit] = batch_weights[idx]
+                self.consistency_ratios['alternatives'][crit] = batch_CR[idx]
+                diagnostics['alternatives'][crit] = batch_diagnostics[idx]
         
-        # Hitung bobot alternatif untuk setiap kriteria
         for crit in self.criteria:
-            weights = self.calculate_weights_from_matrix(self.alternative_matrices[crit])  # Menghitung bobot alternatif
-            self.alternative_weights[crit] = weights
-            CR_alt = self.calculate_consistency_ratio(self.alternative_matrices[crit], weights)  # Menghitung CR untuk alternatif
-            self.steps.append(f"Consistency Ratio untuk alternatif di bawah '{crit}': {CR_alt:.4f}")  # Menyimpan CR alternatif
+            if crit in self.sparse_comparisons:
+                self._emit_sparse_consistency(crit, 'alternative_weights')
+                continue
+            CR_alt = self.consistency_ratios['alternatives'][crit]
+            self.tracer.emit('metric', 'alternative_weights', "Consistency Ratio untuk alternatif di bawah '{target}': {CR:.4f}",
+                             target=crit, CR=CR_alt)
+            if self.tracer.enabled(DEBUG):
+                self.tracer.emit('diagnostics', 'alternative_weights', target=crit, level=DEBUG,
+                                 **self.diagnostics['alternatives'][crit])
             
             if CR_alt > 0.1:
                 # Memberikan peringatan jika CR alternatif > 0.1
-                self.steps.append(f"Warning: Consistency Ratio untuk '{crit}' melebihi 0.1. Pertimbangkan untuk merevisi perbandingan Anda.")
+                self.tracer.emit('warning', 'alternative_weights',
+                                 "Warning: Consistency Ratio untuk '{target}' melebihi 0.1. Pertimbangkan untuk merevisi perbandingan Anda.",
+                                 target=crit, CR=CR_alt)
             else:
-                self.steps.append(f"Consistency Ratio untuk '{crit}' dapat diterima.")  # Menyimpan bahwa CR alternatif dapat diterima
+                self.tracer.emit('step', 'alternative_weights', "Consistency Ratio untuk '{target}' dapat diterima.", target=crit)
+        self.dirty.clear()
         
         # Hitung ranking akhir dengan menjumlahkan bobot alternatif dikalikan bobot kriteria
         self.final_ranking = np.zeros(len(self.alternatives))
         for i, crit in enumerate(self.criteria):
             self.final_ranking += self.criteria_weights[i] * self.alternative_weights[crit]
-        self.steps.append("Ranking akhir dihitung.")  # Menyimpan langkah menghitung ranking akhir
+        self.tracer.emit('step', 'ranking', "Ranking akhir dihitung.")  # Menyimpan langkah menghitung ranking akhir
     
     def get_results(self):
         """
         Mengembalikan semua hasil perhitungan AHP, termasuk matriks, bobot, ranking, dan langkah-langkah pengerjaan.
+        Konversi ke list/dictionary baru dilakukan saat nilai tersebut dibaca, dari snapshot saat get_results
+        dipanggil (update_comparison atau perform_ahp berikutnya tidak mengubah hasil ini). Snapshot tidak menyalin
+        apa pun di awal; matriks dan hasil dipakai bersama dengan copy-on-write (lihat _snapshot).
         
         Returns:
-            dict: Dictionary yang berisi berbagai hasil perhitungan AHP.
-        """
-        # Konversi bobot kriteria dan bobot alternatif ke dalam list untuk kemudahan penggunaan
-        criteria_weights = self.criteria_weights.tolist() if isinstance(self.criteria_weights, np.ndarray) else self.criteria_weights
-        alternative_weights = {k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in self.alternative_weights.items()}
-        
-        # Konversi final_ranking ke dictionary dengan nama alternatif sebagai key dan skor akhir sebagai value
-        final_ranking_dict = {self.alternatives[i]: score for i, score in enumerate(self.final_ranking)}
-        
-        # Menyusun semua hasil ke dalam sebuah dictionary
-        results = {
-            'criteria_matrix': self.criteria_matrix,                     # Matriks perbandingan kriteria
-            'criteria_weights': criteria_weights,                        # Bobot kriteria
-            'alternative_matrices': self.alternative_matrices,           # Matriks perbandingan alternatif per kriteria
-            'alternative_weights': alternative_weights,                   # Bobot alternatif per kriteria
-            'final_ranking': final_ranking_dict,                         # Ranking akhir alternatif
-            'steps': self.steps                                          # Langkah-langkah pengerjaan
-        }
+            LazyResults: Mapping berisi berbagai hasil perhitungan AHP; gunakan to_columnar() untuk ekspor array.
+        """
+        snapshot = self._snapshot()
+        steps = self.steps
+        # Menyusun semua hasil; setiap nilai dibangun saat pertama kali dibaca
+        results = LazyResults({
+            'criteria_matrix': snapshot._criteria_matrix_copy,               # Matriks perbandingan kriteria
+            'criteria_weights': snapshot._criteria_weights_list,             # Bobot kriteria
+            'alternative_matrices': snapshot._alternative_matrices_copy,     # Matriks perbandingan alternatif per kriteria
+            'alternative_weights': snapshot._alternative_weights_lists,      # Bobot alternatif per kriteria
+            'final_ranking': snapshot._final_ranking_dict,                   # Ranking akhir alternatif
+            'diagnostics': lambda: copy.deepcopy(snapshot.diagnostics),      # Diagnostik konvergensi solver
+            'steps': lambda: steps                                           # Langkah-langkah pengerjaan
+        }, columnar=snapshot.get_columnar_results)
         return results
+    
+    def _snapshot(self):
+        """
+        Salinan dangkal objek untuk get_results, O(1). Matriks perbandingan, perbandingan tidak lengkap, bobot
+        alternatif dan diagnostik dipakai bersama; objek asal menyalin wadah atau matriks yang akan diubahnya
+        lebih dulu (copy-on-write, lihat _own dan _own_matrix). Bobot dan ranking akhir selalu diganti array baru.
+        """
+        snapshot = copy.copy(self)
+        self.owned_buffers = set()
+        self.owned_matrices = set()
+        return snapshot
+    
+    def _criteria_matrix_copy(self):
+        """
+        Salinan matriks perbandingan kriteria untuk hasil (matriks snapshot dipakai bersama objek asal).
+        """
+        return None if self.criteria_matrix is None else self.criteria_matrix.copy()
+    
+    def _alternative_matrices_copy(self):
+        """
+        Salinan matriks perbandingan alternatif untuk hasil (PackedComparisons atau dictionary ndarray).
+        """
+        if self._is_packed():
+            return self.alternative_matrices.copy()
+        return {name: matrix.copy() for name, matrix in self.alternative_matrices.items()}
+    
+    def _criteria_weights_list(self):
+        """
+        Konversi bobot kriteria ke dalam list untuk kemudahan penggunaan.
+        """
+        return self.criteria_weights.tolist() if isinstance(self.criteria_weights, np.ndarray) else self.criteria_weights
+    
+    def _alternative_weights_lists(self):
+        """
+        Konversi bobot alternatif per kriteria ke dalam list.
+        """
+        return {k: v.tolist() if isinstance(v, np.ndarray) else v for k, v in self.alternative_weights.items()}
+    
+    def _final_ranking_dict(self):
+        """
+        Konversi final_ranking ke dictionary dengan nama alternatif sebagai key dan skor akhir sebagai value.
+        """
+        return {self.alternatives[i]: score for i, score in enumerate(self.final_ranking)}
+    
+    def get_columnar_results(self):
+        """
+        Mengembalikan hasil AHP dalam bentuk kolumnar: array label dan array nilai tanpa nested dictionary.
+        
+        Returns:
+            dict: 'criteria', 'alternatives', 'criteria_matrix', 'criteria_weights',
+                'alternative_matrices' (k, n, n), 'alternative_weights' (k, n) dan 'scores' (n,).
+        """
+        n = len(self.alternatives)
+        return {
+            'criteria': np.asarray(self.criteria, dtype=object),
+            'alternatives': np.asarray(self.alternatives, dtype=object),
+            'criteria_matrix': self._criteria_matrix_copy() if 'criteria' not in self.sparse_comparisons else self._dense_matrix('criteria'),
+            'criteria_weights': self.criteria_weights,
+            'alternative_matrices': np.stack([self._dense_matrix(crit) for crit in self.criteria]) if self.criteria else np.empty((0, n, n)),
+            'alternative_weights': np.stack([self.alternative_weights[crit] for crit in self.criteria]) if self.criteria else np.empty((0, n)),
+            'scores': self.final_ranking,
+        }
+    
+    def _dense_matrix(self, name):
+        """
+        Matriks perbandingan lengkap untuk ekspor; untuk perbandingan tidak lengkap, pasangan yang tidak diketahui bernilai NaN.
+        """
+        if name not in self.sparse_comparisons:
+            return self.criteria_matrix if name == 'criteria' else self.alternative_matrices[name]
+        sparse = self.sparse_comparisons[name]
+        n = self._group_size(name)
+        matrix = np.full((n, n), np.nan)
+        np.fill_diagonal(matrix, 1.0)
+        matrix[sparse['rows'], sparse['cols']] = sparse['values']
+        matrix[sparse['cols'], sparse['rows']] = 1 / sparse['values']
+        return matrix
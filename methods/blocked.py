@@ -0,0 +1,139 @@
+# methods/blocked.py
+#
+# Utilitas untuk matriks keputusan yang lebih besar dari RAM: matriks dibaca dari file .npy sebagai
+# np.memmap dan diproses per blok baris, skor ditulis ke array output (boleh memmap juga).
+
+import os
+
+import numpy as np
+
+from .results import LazyResults
+from .validation import validate_matrix
+
+
+def open_matrix(source):
+    """
+    Membuka matriks keputusan tanpa memuatnya ke memori.
+
+    Args:
+        source (str | os.PathLike | np.ndarray | None): Path file .npy (dibuka sebagai memmap read-only),
+            atau array yang sudah ada (termasuk np.memmap) yang dikembalikan apa adanya.
+
+    Returns:
+        np.ndarray | None: Matriks berbentuk (n, m).
+    """
+    if source is None:
+        return None
+    if isinstance(source, (str, os.PathLike)):
+        source = np.load(source, mmap_mode='r')
+    if source.ndim != 2:
+        raise ValueError("Matriks keputusan harus 2 dimensi (alternatif x kriteria).")
+    return source
+
+
+def open_output(out, n):
+    """
+    Menyiapkan array output skor berukuran n.
+
+    Args:
+        out (str | os.PathLike | np.ndarray | None): Path file .npy yang dibuat sebagai memmap float64,
+            array yang sudah ada berbentuk (n,), atau None untuk array baru di memori.
+        n (int): Jumlah alternatif.
+
+    Returns:
+        np.ndarray: Array output (n,).
+    """
+    if out is None:
+        return np.empty(n)
+    if isinstance(out, (str, os.PathLike)):
+        return np.lib.format.open_memmap(out, mode='w+', dtype=np.float64, shape=(n,))
+    if out.shape != (n,):
+        raise ValueError(f"Array output harus berbentuk ({n},), bukan {out.shape}.")
+    return out
+
+
+def row_blocks(n, chunk_size):
+    """
+    Membagi n baris menjadi slice berukuran chunk_size.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Ukuran blok harus > 0.")
+    for start in range(0, n, chunk_size):
+        yield slice(start, min(start + chunk_size, n))
+
+
+def read_block(matrix, rows, name, strictly_positive=None):
+    """
+    Membaca satu blok baris ke memori sebagai float64.
+
+    Args:
+        matrix (np.ndarray): Matriks (boleh memmap) atau None.
+        rows (slice): Baris yang dibaca.
+        name (str): Tipe kriteria ('benefit' atau 'cost') untuk pesan error.
+        strictly_positive (bool, optional): Jika diberikan, blok divalidasi seperti validate_matrix.
+            Jika None, nilai kosong (NaN) dianggap 0 seperti pada SAW.create_matrices.
+
+    Returns:
+        np.ndarray | None: Blok berbentuk (jumlah baris, m).
+    """
+    if matrix is None:
+        return None
+    block = np.asarray(matrix[rows], dtype=float)
+    if strictly_positive is None:
+        return np.where(np.isnan(block), 0.0, block)
+    return validate_matrix(block, len(block), matrix.shape[1], name, strictly_positive)
+
+
+def column_bounds(matrix, chunk_size, name, strictly_positive=None):
+    """
+    Menghitung maksimum dan minimum setiap kolom dalam satu pass per blok (sekaligus validasi blok).
+
+    Returns:
+        tuple: (np.ndarray maksimum, np.ndarray minimum), atau (None, None) jika matriks None.
+    """
+    if matrix is None:
+        return None, None
+    column_max = np.full(matrix.shape[1], -np.inf)
+    column_min = np.full(matrix.shape[1], np.inf)
+    for rows in row_blocks(len(matrix), chunk_size):
+        block = read_block(matrix, rows, name, strictly_positive)
+        column_max = np.maximum(column_max, block.max(axis=0))
+        column_min = np.minimum(column_min, block.min(axis=0))
+    return column_max, column_min
+
+
+def matrix_rows(matrix_benefit, matrix_cost, criteria_benefit, criteria_cost):
+    """
+    Memeriksa bentuk matriks benefit dan cost terhadap kriteria, lalu mengembalikan jumlah alternatif.
+    """
+    n = None
+    for matrix, criteria, name in ((matrix_benefit, criteria_benefit, 'benefit'), (matrix_cost, criteria_cost, 'cost')):
+        if not criteria:
+            continue
+        if matrix is None:
+            raise ValueError(f"Matriks {name} wajib diberikan.")
+        if matrix.shape[1] != len(criteria):
+            raise ValueError(f"Matriks {name} harus memiliki {len(criteria)} kolom, bukan {matrix.shape[1]}.")
+        if n is not None and len(matrix) != n:
+            raise ValueError("Jumlah baris matriks benefit dan cost harus sama.")
+        n = len(matrix)
+    if n is None:
+        raise ValueError("Belum ada data matriks kriteria.")
+    return n
+
+
+def blocked_results(criteria_weights, V_scores, ranked_alternatives, ranked_V):
+    """
+    Hasil evaluate_blocked (WP, MAUT) dengan key yang sama seperti get_results, ditambah 'ranked_alternatives'
+    dan 'ranked_V'. Dictionary 'final_ranking' baru dibangun saat dibaca dan berisi satu entri Python per
+    alternatif yang diurutkan (O(n) untuk ranking penuh); untuk jutaan baris gunakan 'ranked_alternatives'
+    (indeks baris np.ndarray jika label tidak diberikan) dan 'ranked_V', atau batasi dengan top_k.
+    """
+    return LazyResults({
+        'criteria_weights': lambda: criteria_weights,
+        'S_scores': lambda: None,
+        'V_scores': lambda: V_scores,
+        'final_ranking': lambda: dict(zip(ranked_alternatives, ranked_V)),
+        'ranked_alternatives': lambda: ranked_alternatives,
+        'ranked_V': lambda: ranked_V,
+    })
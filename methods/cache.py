@@ -0,0 +1,106 @@
+# methods/cache.py
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+
+class PriorityCache:
+    """
+    Cache LRU untuk hasil bobot prioritas AHP, dengan key berupa hash isi matriks (content-addressed).
+
+    Key dibentuk dari solver, opsi solver, dtype, ukuran dan byte mentah matriks, sehingga hanya matriks
+    yang identik bit-per-bit yang dianggap sama (tanpa toleransi). Nilai yang disimpan adalah salinan
+    read-only dari bobot, lambda_max dan CR, sehingga hasil dari cache identik dengan hasil perhitungan awal.
+    Satu cache bisa dipakai bersama oleh banyak objek AHP.
+    """
+
+    def __init__(self, maxsize=1024):
+        """
+        Args:
+            maxsize (int): Jumlah maksimum entri; entri yang paling lama tidak dipakai dibuang lebih dulu.
+        """
+        if maxsize <= 0:
+            raise ValueError("Ukuran cache harus > 0.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def make_key(matrix, solver='eig', options=None):
+        """
+        Membuat key cache dari isi matriks dan konfigurasi solver.
+
+        Args:
+            matrix (np.ndarray): Matriks perbandingan berpasangan.
+            solver (str): Nama solver.
+            options (dict, optional): Opsi solver.
+
+        Returns:
+            bytes: Digest BLAKE2b 32 byte.
+        """
+        matrix = np.ascontiguousarray(matrix)
+        digest = hashlib.blake2b(digest_size=32)
+        digest.update(repr((solver, sorted((options or {}).items()), matrix.dtype.str, matrix.shape)).encode())
+        digest.update(matrix.tobytes())
+        return digest.digest()
+
+    def get(self, key):
+        """
+        Mengambil entri cache dan mencatat hit/miss.
+
+        Returns:
+            dict | None: {'weights', 'lambda_max', 'CR'} atau None jika tidak ada.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, weights, lambda_max, CR):
+        """
+        Menyimpan hasil perhitungan satu matriks.
+
+        Returns:
+            dict: Entri yang disimpan.
+        """
+        weights = np.array(weights, dtype=float)
+        weights.setflags(write=False)
+        entry = {'weights': weights, 'lambda_max': float(lambda_max), 'CR': float(CR)}
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        """
+        Menghapus semua entri dan mereset penghitung hit/miss.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Mengembalikan statistik cache.
+
+        Returns:
+            dict: 'size', 'maxsize', 'hits', 'misses' dan 'hit_rate'.
+        """
+        total = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,302 @@
+# methods/colstats.py
+
+import numpy as np
+
+# Skema normalisasi yang bisa diturunkan dari statistik kolom tanpa memindai ulang matriks
+SCHEMES = ('max', 'min_ratio', 'min_max', 'vector', 'zscore')
+
+
+class ColumnStats:
+    """
+    Statistik per kolom matriks keputusan: jumlah baris, min, max, jumlah, jumlah kuadrat, jumlah ln(x)
+    (hanya x > 0), jumlah nilai bukan nol, serta rata-rata dan M2 (jumlah kuadrat selisih terhadap
+    rata-rata) untuk varians. Semua statistik bisa digabung, sehingga menambah baris hanya memperbarui
+    statistik dengan baris baru (O(jumlah kriteria) per baris) tanpa memindai ulang.
+    """
+
+    def __init__(self, n_columns):
+        """
+        Args:
+            n_columns (int): Jumlah kolom (kriteria).
+        """
+        self.count = 0
+        self.min = np.full(n_columns, np.inf)
+        self.max = np.full(n_columns, -np.inf)
+        self.sum = np.zeros(n_columns)
+        self.sumsq = np.zeros(n_columns)
+        self.logsum = np.zeros(n_columns)
+        self.nnz = np.zeros(n_columns, dtype=np.int64)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """
+        Menghitung statistik semua kolom dalam satu pass.
+
+        Args:
+            matrix (np.ndarray): Matriks berbentuk (jumlah alternatif, jumlah kriteria).
+
+        Returns:
+            ColumnStats: Statistik kolom.
+        """
+        matrix = np.asarray(matrix, dtype=float)
+        stats = cls(matrix.shape[1])
+        stats.append(matrix)
+        return stats
+
+    def append(self, rows):
+        """
+        Memperbarui statistik dengan baris baru.
+
+        Args:
+            rows (np.ndarray): Satu baris (m,) atau beberapa baris (k, m).
+        """
+        rows = np.asarray(rows, dtype=float)
+        if rows.ndim == 1:
+            rows = rows[None]
+        if rows.shape[1] != len(self.sum):
+            raise ValueError(f"Baris harus memiliki {len(self.sum)} kolom, bukan {rows.shape[1]}.")
+        if len(rows) == 0:
+            return
+        # Rata-rata dan M2 digabung dengan rumus Chan (Welford per blok); sumsq / n - mean^2 kehilangan
+        # presisi untuk kolom dengan rata-rata besar dan sebaran kecil
+        k = len(rows)
+        block_mean = rows.mean(axis=0)
+        block_m2 = ((rows - block_mean) ** 2).sum(axis=0)
+        total = self.count + k
+        delta = block_mean - self.mean
+        self.mean = self.mean + delta * (k / total)
+        self.m2 = self.m2 + block_m2 + delta ** 2 * (self.count * k / total)
+        self.count = total
+        self.min = np.minimum(self.min, rows.min(axis=0))
+        self.max = np.maximum(self.max, rows.max(axis=0))
+        self.sum += rows.sum(axis=0)
+        self.sumsq += (rows ** 2).sum(axis=0)
+        positive = rows > 0
+        self.logsum += np.log(np.where(positive, rows, 1.0)).sum(axis=0)
+        self.nnz += (rows != 0).sum(axis=0)
+
+    @property
+    def std(self):
+        """
+        Simpangan baku populasi setiap kolom, dari M2.
+        """
+        return np.sqrt(self.m2 / max(self.count, 1))
+
+    @property
+    def norm(self):
+        """
+        Norma L2 setiap kolom.
+        """
+        return np.sqrt(self.sumsq)
+
+    def normalize(self, matrix, scheme='max', kind='benefit'):
+        """
+        Normalisasi matriks (atau sebagian barisnya) dengan statistik kolom, tanpa memindai ulang kolom.
+
+        Args:
+            matrix (np.ndarray): Matriks dengan kolom yang sama seperti statistik.
+            scheme (str): 'max' (x / max), 'min_ratio' (min / x), 'min_max' ((x - min) / (max - min)),
+                'vector' (x / norma L2) atau 'zscore' ((x - rata-rata) / simpangan baku).
+            kind (str): 'benefit' atau 'cost'. Untuk 'min_max' dan 'zscore' arah kolom cost dibalik
+                (nilai kecil lebih baik); 'max', 'min_ratio' dan 'vector' tidak bergantung pada kind.
+
+        Returns:
+            np.ndarray: Matriks ternormalisasi.
+        """
+        if scheme not in SCHEMES:
+            raise ValueError(f"Skema normalisasi '{scheme}' tidak dikenal. Pilihan: {', '.join(SCHEMES)}.")
+        if kind not in ('benefit', 'cost'):
+            raise ValueError("Tipe kriteria harus 'benefit' atau 'cost'.")
+        matrix = np.asarray(matrix, dtype=float)
+        if scheme == 'max':
+            factor = np.where(self.max == 0, 1.0, self.max)  # Hindari pembagian dengan nol
+            return matrix / factor
+        if scheme == 'min_ratio':
+            factor = np.where(self.min == 0, 1.0, self.min)  # Hindari pembagian dengan nol
+            with np.errstate(divide='ignore', invalid='ignore'):
+                normal = factor / matrix
+            normal[~np.isfinite(normal)] = 1  # Gantikan inf atau NaN dengan 1
+            return normal
+        if scheme == 'min_max':
+            span = self.max - self.min
+            numerator = matrix - self.min if kind == 'benefit' else self.max - matrix
+            return np.divide(numerator, span, out=np.zeros_like(matrix), where=span != 0)
+        if scheme == 'vector':
+            norm = self.norm
+            return np.divide(matrix, norm, out=np.zeros_like(matrix), where=norm != 0)
+        std = self.std
+        normal = np.divide(matrix - self.mean, std, out=np.zeros_like(matrix), where=std != 0)
+        return normal if kind == 'benefit' else -normal
+
+
+def is_frozen(array):
+    """
+    True jika array dan semua array dasarnya (base) read-only, sehingga nilainya tidak bisa berubah lewat
+    referensi lain. View read-only dari array yang bisa ditulis (misal to_numpy() DataFrame) tidak termasuk.
+    """
+    while isinstance(array, np.ndarray):
+        if array.flags.writeable:
+            return False
+        array = array.base
+    return True
+
+
+class ReadOnlyMatrix:
+    """
+    Descriptor untuk atribut matriks (matrix_benefit, matrix_cost) pada objek metode. Matriks yang
+    diberikan disimpan sebagai array read-only (disalin jika masih bisa ditulis, lihat is_frozen), sehingga
+    perubahan di tempat tidak bisa diam-diam membuat statistik kolom usang: perubahan harus lewat pengganti
+    matriks (terdeteksi dari identitas array, lihat StatsIndex) atau write_cell.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.owned = f'_{name}_owned'  # True jika array disalin sendiri (boleh diubah lewat write_cell)
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj.__dict__.get(self.name)
+
+    def __set__(self, obj, value):
+        owned = False
+        if value is not None:
+            if not isinstance(value, np.ndarray) or not is_frozen(value):
+                value = np.array(value, dtype=float)
+                owned = True
+            value.setflags(write=False)
+        obj.__dict__[self.name] = value
+        obj.__dict__[self.owned] = owned
+
+    def adopt(self, obj, value):
+        """
+        Menyimpan array yang baru dibuat di dalam objek (misal hasil np.vstack) tanpa salinan defensif:
+        array dijadikan read-only di tempat dan dianggap milik objek.
+        """
+        value = value.astype(float, copy=False)
+        value.setflags(write=False)
+        obj.__dict__[self.name] = value
+        obj.__dict__[self.owned] = True
+        return value
+
+    def write(self, obj, i, j, value):
+        """
+        Mengubah satu sel. Array milik pemanggil (read-only dari luar) disalin sekali; salinan milik
+        objek diubah di tempat.
+        """
+        matrix = self.__get__(obj)
+        if not obj.__dict__.get(self.owned):
+            matrix = self.adopt(obj, matrix.copy())
+        matrix.setflags(write=True)
+        matrix[i, j] = value
+        matrix.setflags(write=False)
+        return matrix
+
+
+def share_matrix(obj, name):
+    """
+    Menandai matriks obj.<name> sebagai dipakai bersama (misal oleh snapshot hasil): write_cell berikutnya
+    menyalinnya lebih dulu (copy-on-write), sehingga pemakai lain tetap melihat nilai lama.
+
+    Returns:
+        np.ndarray | None: Matriks saat ini.
+    """
+    obj.__dict__[getattr(type(obj), name).owned] = False
+    return getattr(obj, name)
+
+
+def adopt_matrix(obj, name, array):
+    """
+    Menyimpan array yang baru dibuat oleh objek sendiri sebagai obj.<name> tanpa disalin lagi (lihat
+    ReadOnlyMatrix.adopt). Array dari pemanggil tetap harus lewat assignment biasa agar disalin.
+
+    Returns:
+        np.ndarray: Matriks yang tersimpan (read-only).
+    """
+    return getattr(type(obj), name).adopt(obj, array)
+
+
+def write_cell(obj, name, i, j, value):
+    """
+    Mengubah satu sel matriks read-only obj.<name> (lihat ReadOnlyMatrix). Statistik kolom yang terkait
+    dengan matriks ini harus dibuang oleh pemanggil (StatsIndex.invalidate).
+
+    Returns:
+        np.ndarray: Matriks yang sudah diubah.
+    """
+    return getattr(type(obj), name).write(obj, i, j, value)
+
+
+class StatsIndex:
+    """
+    Indeks statistik kolom (dan nilai turunan lain, misal matriks log WP). Setiap nilai disimpan bersama
+    array sumbernya dan hanya dipakai ulang selama sumbernya masih objek array yang sama; matriks yang
+    diganti otomatis membuat nilai lama tidak berlaku. Matriks sumber dijaga read-only (ReadOnlyMatrix),
+    jadi perubahan di tempat hanya terjadi lewat write_cell yang diikuti invalidate.
+    """
+
+    def __init__(self):
+        self.entries = {}  # Nama -> (tuple array sumber, nilai)
+
+    def invalidate(self):
+        """
+        Membuang semua statistik dan nilai turunan (dipanggil setelah matriks diubah di tempat).
+        """
+        self.entries.clear()
+
+    def lookup(self, name, *sources):
+        """
+        Nilai yang tersimpan jika dihitung dari array sumber yang sama persis, selain itu None.
+        """
+        entry = self.entries.get(name)
+        if entry is None or len(entry[0]) != len(sources):
+            return None
+        if any(stored is not source for stored, source in zip(entry[0], sources)):
+            return None
+        return entry[1]
+
+    def store(self, name, value, *sources):
+        """
+        Menyimpan nilai turunan dari array sumber.
+        """
+        self.entries[name] = (sources, value)
+        return value
+
+    def cached(self, name, build, *sources):
+        """
+        Nilai turunan yang dihitung sekali selama array sumbernya tidak berganti.
+
+        Args:
+            name (str): Nama nilai.
+            build (callable): Fungsi tanpa argumen yang menghitung nilai.
+            *sources: Array sumber nilai.
+        """
+        value = self.lookup(name, *sources)
+        if value is None:
+            value = self.store(name, build(), *sources)
+        return value
+
+    def get(self, name, matrix):
+        """
+        Statistik kolom matriks; dihitung sekali selama matriks tidak berganti.
+
+        Args:
+            name (str): Nama matriks, misal 'benefit' atau 'cost'.
+            matrix (np.ndarray): Matriks saat ini.
+
+        Returns:
+            ColumnStats: Statistik kolom.
+        """
+        return self.cached(name, lambda: ColumnStats.from_matrix(matrix), matrix)
+
+    def append(self, name, rows, old_matrix, new_matrix):
+        """
+        Memperbarui statistik matriks dengan baris baru tanpa memindai ulang, lalu mengaitkannya ke
+        matriks baru (matriks lama + rows). Jika statistik matriks lama belum ada, tidak ada yang dilakukan.
+        """
+        stats = self.lookup(name, old_matrix)
+        if stats is not None:
+            stats.append(rows)
+            self.store(name, stats, new_matrix)
@@ -0,0 +1,282 @@
+# methods/consensus.py
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .colstats import is_frozen
+from .maut import MAUT
+from .ranking import rank_indices
+from .saw import SAW
+from .validation import validate_labels, validate_matrix, validate_weights
+from .wp import WP
+
+METHODS = ('saw', 'wp', 'maut', 'ahp')
+AGGREGATIONS = ('borda', 'copeland')
+
+
+def prepare(alternatives, criteria_benefit, criteria_cost, weight_benefit, weight_cost,
+            matrix_benefit=None, matrix_cost=None, methods=METHODS):
+    """
+    Membangun data bersama untuk semua metode sekali saja: validasi, pemisahan benefit/cost, bobot
+    ternormalisasi, max/min kolom dan matriks log. Semua array dibuat read-only karena dibaca
+    bersamaan oleh beberapa thread.
+
+    Args:
+        alternatives (list): Daftar alternatif.
+        criteria_benefit (list): Daftar kriteria benefit.
+        criteria_cost (list): Daftar kriteria cost.
+        weight_benefit (array-like): Bobot kriteria benefit.
+        weight_cost (array-like): Bobot kriteria cost.
+        matrix_benefit (array-like): Matriks (jumlah alternatif, jumlah kriteria benefit).
+        matrix_cost (array-like): Matriks (jumlah alternatif, jumlah kriteria cost).
+        methods (tuple): Metode yang akan dijalankan; WP dan AHP membutuhkan nilai > 0.
+
+    Returns:
+        dict: Data bersama (lihat run_consensus).
+    """
+    alternatives = validate_labels(alternatives, 'alternatif')
+    criteria = validate_labels(list(criteria_benefit) + list(criteria_cost), 'kriteria')
+    criteria_benefit, criteria_cost = criteria[:len(criteria_benefit)], criteria[len(criteria_benefit):]
+    weight_benefit = validate_weights(weight_benefit, len(criteria_benefit), 'benefit')
+    weight_cost = validate_weights(weight_cost, len(criteria_cost), 'cost')
+    total = sum(weight_benefit) + sum(weight_cost)
+    if total == 0:
+        raise ValueError("Total bobot tidak boleh nol.")
+
+    strictly_positive = 'wp' in methods or 'ahp' in methods
+    n = len(alternatives)
+    shared = {
+        'alternatives': alternatives,
+        'criteria_benefit': criteria_benefit,
+        'criteria_cost': criteria_cost,
+        'weight_benefit': [w / total for w in weight_benefit],
+        'weight_cost': [w / total for w in weight_cost],
+        'matrix_benefit': None,
+        'matrix_cost': None,
+        'max_benefit': None,
+        'min_cost': None,
+    }
+    if criteria_benefit:
+        shared['matrix_benefit'] = validate_matrix(matrix_benefit, n, len(criteria_benefit), 'benefit', strictly_positive)
+        shared['max_benefit'] = shared['matrix_benefit'].max(axis=0)
+    if criteria_cost:
+        shared['matrix_cost'] = validate_matrix(matrix_cost, n, len(criteria_cost), 'cost', strictly_positive)
+        shared['min_cost'] = shared['matrix_cost'].min(axis=0)
+    if shared['matrix_benefit'] is None and shared['matrix_cost'] is None:
+        raise ValueError("Belum ada data matriks kriteria.")
+    # ln(x) benefit dan ln(1/x) cost: dipakai WP untuk skor dan AHP untuk bobot alternatif
+    shared['log_matrix'] = WP.log_values(shared['matrix_benefit'], shared['matrix_cost']) if strictly_positive else None
+
+    # validate_matrix bisa mengembalikan array pemanggil apa adanya: salin sekali jika masih bisa berubah,
+    # bukan membekukan array milik pemanggil (salinan read-only dipakai metode tanpa disalin lagi)
+    for key in ('matrix_benefit', 'matrix_cost'):
+        if shared[key] is not None and not is_frozen(shared[key]):
+            shared[key] = shared[key].copy()
+    for value in shared.values():
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+    return shared
+
+
+def _run_saw(shared):
+    """
+    SAW dengan faktor normalisasi bersama (matriks tidak dipindai ulang).
+    """
+    saw = SAW()
+    saw.set_trace('off')
+    saw.set_criteria(shared['criteria_benefit'], shared['criteria_cost'])
+    saw.set_alternatives(shared['alternatives'])
+    saw.set_weights(shared['weight_benefit'], shared['weight_cost'])
+    saw.matrix_benefit = shared['matrix_benefit']
+    saw.matrix_cost = shared['matrix_cost']
+    if saw.matrix_benefit is not None:
+        saw.normal_benefit = saw.normalize_benefit(saw.matrix_benefit, shared['max_benefit'])
+    if saw.matrix_cost is not None:
+        saw.normal_cost = saw.normalize_cost(saw.matrix_cost, shared['min_cost'])
+    saw.calculate_score()
+    return saw.scores
+
+
+def _score_method(method, shared):
+    """
+    Mengisi objek WP/MAUT dari data bersama tanpa validasi dan normalisasi bobot ulang.
+    """
+    method.criteria_benefit = shared['criteria_benefit']
+    method.criteria_cost = shared['criteria_cost']
+    method.alternatives = shared['alternatives']
+    method.weight_benefit = shared['weight_benefit']
+    method.weight_cost = shared['weight_cost']
+    method.matrix_benefit = shared['matrix_benefit']
+    method.matrix_cost = shared['matrix_cost']
+    return method
+
+
+def _run_wp(shared):
+    """
+    WP dengan matriks log bersama.
+    """
+    wp = _score_method(WP(verbose=False), shared)
+    wp.calculate_scores(log_matrix=shared['log_matrix'])
+    if wp.V_scores is None:
+        raise ValueError("Skor V WP tidak dapat dihitung.")
+    return wp.V_scores
+
+
+def _run_maut(shared):
+    """
+    MAUT dengan max/min kolom bersama.
+    """
+    maut = _score_method(MAUT(verbose=False), shared)
+    maut.calculate_scores(max_val=shared['max_benefit'], min_val=shared['min_cost'])
+    if maut.V_scores is None:
+        raise ValueError("Skor V MAUT tidak dapat dihitung.")
+    return maut.V_scores
+
+
+def _run_ahp(shared):
+    """
+    AHP dengan matriks perbandingan yang diturunkan dari data: kriteria w_i / w_j, alternatif x_i / x_j
+    (x_j / x_i untuk cost). Matriks ini konsisten, sehingga vektor prioritasnya (eig maupun geometric_mean)
+    sama dengan satu kolomnya yang dinormalisasi: bobot kriteria w / sum(w) dan bobot alternatif
+    exp(matriks log) / jumlah per kolom. Prioritas dihitung langsung tanpa membentuk matriks n x n,
+    memori O(m n).
+    """
+    weights = np.asarray(shared['weight_benefit'] + shared['weight_cost'])
+    values = np.exp(shared['log_matrix'])
+    alternative_weights = values / values.sum(axis=0)
+    return alternative_weights @ (weights / weights.sum())
+
+
+RUNNERS = {
+    'saw': _run_saw,
+    'wp': _run_wp,
+    'maut': _run_maut,
+    'ahp': _run_ahp,
+}
+
+
+def rank_positions(scores):
+    """
+    Posisi peringkat (0 = terbaik) setiap alternatif per metode, dengan urutan seri sama seperti rank_indices.
+
+    Args:
+        scores (np.ndarray): Skor berbentuk (jumlah metode, n).
+
+    Returns:
+        np.ndarray: Posisi berbentuk (jumlah metode, n).
+    """
+    k, n = scores.shape
+    positions = np.empty((k, n), dtype=np.int64)
+    for idx in range(k):
+        positions[idx, rank_indices(scores[idx])] = np.arange(n)
+    return positions
+
+
+def borda(positions):
+    """
+    Skor Borda: setiap metode memberi n - 1 - posisi poin kepada setiap alternatif.
+
+    Args:
+        positions (np.ndarray): Posisi peringkat (jumlah metode, n), lihat rank_positions.
+
+    Returns:
+        np.ndarray: Skor konsensus (n,).
+    """
+    n = positions.shape[1]
+    return (n - 1 - positions).sum(axis=0).astype(float)
+
+
+def copeland(positions):
+    """
+    Skor Copeland: jumlah kemenangan dikurangi kekalahan head-to-head, di mana alternatif i mengalahkan j
+    jika lebih banyak metode menempatkan i di atas j. Memori O(n^2).
+
+    Args:
+        positions (np.ndarray): Posisi peringkat (jumlah metode, n), lihat rank_positions.
+
+    Returns:
+        np.ndarray: Skor konsensus (n,).
+    """
+    n = positions.shape[1]
+    preferred = np.zeros((n, n), dtype=np.int64)  # preferred[i, j] = jumlah metode yang menempatkan i di atas j
+    for position in positions:
+        preferred += position[:, None] < position[None, :]
+    return np.sign(preferred - preferred.T).sum(axis=1).astype(float)
+
+
+def run_consensus(alternatives, criteria_benefit, criteria_cost, weight_benefit, weight_cost,
+                  matrix_benefit=None, matrix_cost=None, methods=METHODS, aggregation='borda', max_workers=None):
+    """
+    Menjalankan beberapa metode (SAW, WP, MAUT, AHP) pada data yang sama secara paralel dan menggabungkan
+    peringkatnya menjadi peringkat konsensus.
+
+    Matriks keputusan, bobot ternormalisasi, max/min kolom dan matriks log dibangun sekali (lihat prepare)
+    lalu dibaca bersama oleh semua metode di thread pool; operasi numpy melepas GIL sehingga metode
+    berjalan bersamaan.
+
+    Args:
+        alternatives (list): Daftar alternatif.
+        criteria_benefit (list): Daftar kriteria benefit.
+        criteria_cost (list): Daftar kriteria cost.
+        weight_benefit (array-like): Bobot kriteria benefit.
+        weight_cost (array-like): Bobot kriteria cost.
+        matrix_benefit (array-like): Matriks (jumlah alternatif, jumlah kriteria benefit).
+        matrix_cost (array-like): Matriks (jumlah alternatif, jumlah kriteria cost).
+        methods (tuple): Metode yang dijalankan, subset dari METHODS.
+        aggregation (str): 'borda' atau 'copeland'.
+        max_workers (int, optional): Jumlah thread. Default satu thread per metode.
+
+    Returns:
+        dict: 'methods' (per metode: 'scores', 'ranking', 'time_s'), 'consensus' ('aggregation',
+            'scores', 'ranking') dan 'timings' ('prepare_s', 'methods_s', 'aggregation_s', 'total_s').
+    """
+    methods = tuple(methods)
+    unknown = [name for name in methods if name not in RUNNERS]
+    if unknown or not methods:
+        raise ValueError(f"Metode {', '.join(unknown) or '(kosong)'} tidak dikenal. Pilihan: {', '.join(METHODS)}.")
+    if aggregation not in AGGREGATIONS:
+        raise ValueError(f"Agregasi '{aggregation}' tidak dikenal. Pilihan: {', '.join(AGGREGATIONS)}.")
+
+    start = time.perf_counter()
+    shared = prepare(alternatives, criteria_benefit, criteria_cost, weight_benefit, weight_cost,
+                     matrix_benefit, matrix_cost, methods)
+    prepared = time.perf_counter()
+
+    def timed(name):
+        begin = time.perf_counter()
+        scores = RUNNERS[name](shared)
+        return np.asarray(scores, dtype=float), time.perf_counter() - begin
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(methods)) as pool:
+        futures = {name: pool.submit(timed, name) for name in methods}
+        outputs = {name: future.result() for name, future in futures.items()}
+    finished = time.perf_counter()
+
+    labels = shared['alternatives']
+    results = {}
+    for name, (scores, elapsed) in outputs.items():
+        results[name] = {
+            'scores': scores,
+            'ranking': [labels[i] for i in rank_indices(scores)],
+            'time_s': elapsed,
+        }
+
+    positions = rank_positions(np.stack([outputs[name][0] for name in methods]))
+    consensus_scores = borda(positions) if aggregation == 'borda' else copeland(positions)
+    end = time.perf_counter()
+    return {
+        'methods': results,
+        'consensus': {
+            'aggregation': aggregation,
+            'scores': consensus_scores,
+            'ranking': [labels[i] for i in rank_indices(consensus_scores)],
+        },
+        'timings': {
+            'prepare_s': prepared - start,
+            'methods_s': finished - prepared,
+            'aggregation_s': end - finished,
+            'total_s': end - start,
+        },
+    }
@@ -0,0 +1,135 @@
+# methods/group.py
+
+import itertools
+
+import numpy as np
+
+
+class GeometricMeanAccumulator:
+    """
+    Rata-rata geometrik berbobot yang diakumulasi di ruang log: hanya jumlah w * log(x) dan jumlah bobot
+    yang disimpan, sehingga memori tetap sebesar satu item berapa pun jumlah item yang ditambahkan.
+    Dipakai untuk agregasi penilaian individu (AIJ, item = matriks) dan prioritas individu (AIP, item = vektor).
+    """
+
+    def __init__(self, shape):
+        """
+        Args:
+            shape (tuple | int): Ukuran satu item, misal (n, n) untuk matriks atau n untuk vektor.
+        """
+        self.shape = tuple(np.atleast_1d(shape))
+        self.log_sum = np.zeros(self.shape)
+        self.total_weight = 0.0
+        self.count = 0
+
+    def add(self, values, weights=None):
+        """
+        Menambahkan satu item atau tumpukan item.
+
+        Args:
+            values (np.ndarray): Item berbentuk shape atau (k,) + shape, semua nilai > 0.
+            weights (array-like, optional): Bobot per item (k,). Default bobot 1.
+        """
+        values = np.asarray(values, dtype=float)
+        if values.shape == self.shape:
+            values = values[None]
+        if values.shape[1:] != self.shape:
+            raise ValueError(f"Ukuran item harus {self.shape}, bukan {values.shape[1:]}.")
+        if np.any(values <= 0):
+            raise ValueError("Semua nilai harus > 0 untuk rata-rata geometrik.")
+        k = len(values)
+        if weights is None:
+            weights = np.ones(k)
+        weights = np.asarray(weights, dtype=float).reshape(k)
+        if np.any(weights < 0):
+            raise ValueError("Bobot tidak boleh negatif.")
+        self.log_sum += np.tensordot(weights, np.log(values), axes=1)
+        self.total_weight += float(weights.sum())
+        self.count += k
+
+    def mean(self):
+        """
+        Mengembalikan rata-rata geometrik berbobot dari semua item yang sudah ditambahkan.
+        """
+        if self.total_weight <= 0:
+            raise ValueError("Belum ada item dengan bobot > 0 yang ditambahkan.")
+        return np.exp(self.log_sum / self.total_weight)
+
+
+def comparison_matrices(assessors, n):
+    """
+    Membentuk tumpukan matriks perbandingan berpasangan dari penilaian beberapa assessor.
+
+    Args:
+        assessors (list): Per assessor: np.ndarray (n, n) berupa matriks lengkap, atau list tuple (i, j, value)
+            seperti pada AHP.set_criteria_comparisons.
+        n (int): Ukuran matriks.
+
+    Returns:
+        np.ndarray: Matriks berbentuk (k, n, n).
+    """
+    matrices = np.ones((len(assessors), n, n))
+    for idx, judgments in enumerate(assessors):
+        if isinstance(judgments, np.ndarray):
+            if judgments.shape != (n, n):
+                raise ValueError(f"Matriks assessor ke-{idx} harus berukuran ({n}, {n}).")
+            matrices[idx] = judgments
+            continue
+        if len(judgments) == 0:
+            continue
+        comparisons = np.asarray(judgments, dtype=float)
+        i = comparisons[:, 0].astype(int)
+        j = comparisons[:, 1].astype(int)
+        matrices[idx, i, j] = comparisons[:, 2]          # Nilai perbandingan
+        matrices[idx, j, i] = 1 / comparisons[:, 2]      # Invers nilai perbandingan
+    return matrices
+
+
+_MISSING = object()  # Penanda pasangan yang kurang pada iter_chunks
+
+
+def iter_chunks(assessors, weights=None, chunk_size=256):
+    """
+    Membagi penilaian assessor (boleh generator) menjadi potongan berukuran chunk_size.
+
+    Args:
+        assessors (iterable): Penilaian per assessor (lihat comparison_matrices).
+        weights (iterable, optional): Bobot per assessor, jumlahnya harus sama dengan assessor. Default bobot 1.
+        chunk_size (int): Jumlah assessor per potongan.
+
+    Yields:
+        tuple: (list penilaian, np.ndarray bobot).
+    """
+    if weights is None:
+        pairs = zip(assessors, itertools.repeat(1.0))
+    else:
+        pairs = itertools.zip_longest(assessors, weights, fillvalue=_MISSING)  # zip(strict=True) baru ada di Python 3.10
+    while True:
+        chunk = list(itertools.islice(pairs, chunk_size))
+        if not chunk:
+            return
+        if any(judgment is _MISSING or weight is _MISSING for judgment, weight in chunk):
+            raise ValueError("Jumlah bobot harus sama dengan jumlah assessor.")
+        judgments, chunk_weights = zip(*chunk)
+        yield list(judgments), np.asarray(chunk_weights, dtype=float)
+
+
+def aggregate_priorities(priorities, weights=None):
+    """
+    Agregasi prioritas individu (AIP): rata-rata geometrik berbobot dari vektor prioritas setiap assessor,
+    lalu dinormalisasi agar berjumlah 1.
+
+    Args:
+        priorities (array-like): Vektor prioritas per assessor berbentuk (k, n).
+        weights (array-like, optional): Bobot assessor (k,). Default bobot sama.
+
+    Returns:
+        np.ndarray: Prioritas kelompok berbentuk (n,).
+    """
+    priorities = np.asarray(priorities, dtype=float)
+    if priorities.ndim != 2:
+        raise ValueError("Prioritas harus berbentuk (jumlah assessor, jumlah item).")
+    accumulator = GeometricMeanAccumulator(priorities.shape[1])
+    accumulator.add(priorities, weights)
+    group = accumulator.mean()
+    return group / group.sum()
@@ -0,0 +1,252 @@
+# methods/hierarchy.py
+
+import copy
+from collections import defaultdict
+
+import numpy as np
+
+from .ahp import consistency_ratios, reciprocal_matrix
+from .priority import SOLVERS, solve_priorities
+from .results import LazyResults
+from .trace import Traceable, Tracer
+
+GOAL = 'goal'  # Nama node akar (tujuan keputusan)
+
+
+class HierarchyAHP(Traceable):
+    """
+    AHP dengan hierarki kriteria bertingkat: tujuan -> kriteria -> sub-kriteria -> ... -> alternatif.
+
+    Setiap node memiliki matriks perbandingan atas anak-anaknya; node daun membandingkan alternatif.
+    Prioritas subtree (vektor skor alternatif) setiap node disimpan dan hanya dihitung ulang jika ada
+    perubahan di dalam subtree tersebut, sehingga mengubah satu matriks daun hanya menghitung ulang
+    jalur dari daun itu ke akar.
+    """
+
+    def __init__(self, alternatives):
+        """
+        Args:
+            alternatives (list): Daftar nama alternatif.
+        """
+        self.alternatives = alternatives
+        self.parent = {GOAL: None}         # Node induk setiap node
+        self.children = {GOAL: []}         # Anak setiap node, sesuai urutan penambahan
+        self.matrices = {}                 # Matriks perbandingan per node
+        self.local_weights = {}            # Bobot lokal per node (atas anak atau alternatif)
+        self.consistency_ratios = {}       # CR per node
+        self.subtree_priorities = {}       # Skor alternatif dari subtree setiap node
+        self.dirty = set()                 # Node yang matriksnya berubah (bobot lokal harus dihitung ulang)
+        self.stale = set()                 # Node yang prioritas subtree-nya harus disusun ulang
+        self.solver = 'eig'
+        self.solver_options = {}
+        self.final_ranking = None
+        self.tracer = Tracer()             # Langkah-langkah pengerjaan (lihat set_trace dan self.steps)
+
+    def set_solver(self, solver, **options):
+        """
+        Memilih solver bobot prioritas (lihat AHP.set_solver). Semua node dihitung ulang.
+        """
+        if solver not in SOLVERS:
+            raise ValueError(f"Solver '{solver}' tidak dikenal. Pilihan: {', '.join(SOLVERS)}.")
+        self.solver = solver
+        self.solver_options = options
+        for node in self.parent:
+            self._invalidate(node)
+
+    def add_criterion(self, name, parent=GOAL):
+        """
+        Menambahkan kriteria atau sub-kriteria sebagai anak dari node lain.
+
+        Args:
+            name (str): Nama kriteria (unik di seluruh hierarki).
+            parent (str): Node induk. Default tujuan (kriteria level pertama).
+        """
+        if name in self.parent:
+            raise ValueError(f"Node '{name}' sudah ada di hierarki.")
+        if parent not in self.parent:
+            raise ValueError(f"Node induk '{parent}' tidak dikenal.")
+        self.parent[name] = parent
+        self.children[name] = []
+        self.children[parent].append(name)
+        # Ukuran matriks induk berubah; perbandingan lama tidak berlaku lagi
+        self.matrices.pop(parent, None)
+        self.local_weights.pop(parent, None)
+        self._invalidate(parent)
+        self._invalidate(name)  # Node baru belum punya bobot lokal; perbandingannya diperiksa saat compute
+        self.tracer.emit('step', 'input', "Kriteria '{target}' ditambahkan di bawah '{parent}'.", target=name, parent=parent)
+
+    def _size(self, node):
+        """
+        Ukuran matriks perbandingan node: jumlah anak, atau jumlah alternatif untuk node daun.
+        """
+        if node not in self.parent:
+            raise ValueError(f"Node '{node}' tidak dikenal.")
+        children = self.children[node]
+        return len(children) if children else len(self.alternatives)
+
+    def _invalidate(self, node):
+        """
+        Menandai bobot lokal node dan prioritas subtree di sepanjang jalur node -> akar untuk dihitung ulang.
+        """
+        self.dirty.add(node)
+        while node is not None:
+            self.stale.add(node)
+            node = self.parent[node]
+
+    def set_comparisons(self, node, comparisons):
+        """
+        Mengatur matriks perbandingan berpasangan sebuah node.
+
+        Args:
+            node (str): 'goal' atau nama kriteria. Node dengan anak membandingkan anaknya (urutan add_criterion),
+                node daun membandingkan alternatif.
+            comparisons (list of tuples): Daftar tuple (i, j, value) seperti pada AHP.set_criteria_comparisons.
+        """
+        self.matrices[node] = reciprocal_matrix(self._size(node), comparisons)
+        self._invalidate(node)
+        self.tracer.emit('step', 'input', "Perbandingan untuk '{target}' dimasukkan.", target=node)
+
+    def update_comparison(self, node, i, j, value):
+        """
+        Mengubah satu nilai perbandingan; hanya jalur node -> akar yang dihitung ulang pada compute berikutnya.
+        """
+        if node not in self.matrices:
+            raise ValueError(f"Perbandingan untuk '{node}' belum dimasukkan.")
+        n = self._size(node)
+        if i == j:
+            raise ValueError("Perbandingan item dengan dirinya sendiri selalu 1.")
+        if not (0 <= i < n and 0 <= j < n):
+            raise ValueError(f"Indeks perbandingan untuk '{node}' harus 0..{n - 1}.")
+        if not value > 0:
+            raise ValueError(f"Nilai perbandingan untuk '{node}' harus > 0.")
+        matrix = self.matrices[node]
+        matrix[i, j] = value
+        matrix[j, i] = 1 / value
+        self._invalidate(node)
+        self.tracer.emit('step', 'update', "Perbandingan ({i}, {j}) pada '{target}' diubah menjadi {value}.",
+                         target=node, i=i, j=j, value=value)
+
+    def _depths(self):
+        """
+        Kedalaman setiap node (akar = 0).
+        """
+        depths = {GOAL: 0}
+        queue = [GOAL]
+        for node in queue:
+            for child in self.children[node]:
+                depths[child] = depths[node] + 1
+                queue.append(child)
+        return depths
+
+    def _solve_local(self, nodes):
+        """
+        Menghitung bobot lokal dan CR untuk node-node yang berubah; matriks berukuran sama diselesaikan dalam satu batch.
+        """
+        by_size = defaultdict(list)
+        for node in nodes:
+            if node not in self.matrices:
+                if self._size(node) == 1:
+                    self.matrices[node] = np.ones((1, 1))  # Satu anak: bobot lokal selalu 1
+                else:
+                    raise ValueError(f"Perbandingan untuk '{node}' belum dimasukkan.")
+            by_size[self._size(node)].append(node)
+
+        for n, group in by_size.items():
+            result = solve_priorities(np.stack([self.matrices[node] for node in group]), self.solver, **self.solver_options)
+            CR = consistency_ratios(result['lambda_max'], n)
+            for idx, node in enumerate(group):
+                self.local_weights[node] = result['weights'][idx]
+                self.consistency_ratios[node] = float(CR[idx])
+
+    def _compose(self, nodes):
+        """
+        Menyusun prioritas subtree dari bawah ke atas. Node pada kedalaman yang sama dengan jumlah anak
+        yang sama digabung dalam satu perkalian matriks batch (b, n, k) @ (b, k).
+        """
+        depths = self._depths()
+        by_level = defaultdict(list)
+        for node in nodes:
+            by_level[depths[node]].append(node)
+
+        for depth in sorted(by_level, reverse=True):
+            groups = defaultdict(list)
+            for node in by_level[depth]:
+                groups[len(self.children[node])].append(node)
+            for k, group in groups.items():
+                if k == 0:
+                    # Node daun: prioritas subtree = bobot lokal atas alternatif
+                    for node in group:
+                        self.subtree_priorities[node] = self.local_weights[node]
+                    continue
+                children = np.stack([
+                    np.column_stack([self.subtree_priorities[child] for child in self.children[node]])
+                    for node in group
+                ])                                                              # (b, n, k)
+                weights = np.stack([self.local_weights[node] for node in group])  # (b, k)
+                composed = np.matmul(children, weights[..., None])[..., 0]        # (b, n)
+                for idx, node in enumerate(group):
+                    self.subtree_priorities[node] = composed[idx]
+
+    def compute(self):
+        """
+        Menghitung prioritas global alternatif. Hanya node yang berubah dan leluhurnya yang dihitung ulang.
+
+        Returns:
+            np.ndarray: Skor akhir setiap alternatif.
+        """
+        if not self.children[GOAL]:
+            raise ValueError("Hierarki belum memiliki kriteria.")
+        recomputed = len(self.stale)
+        order = {node: k for k, node in enumerate(self.parent)}  # Urutan penambahan node
+        self._solve_local(sorted(self.dirty, key=order.get))
+        self._compose(self.stale)
+        self.dirty.clear()
+        self.stale.clear()
+
+        for node, CR in self.consistency_ratios.items():
+            if CR > 0.1:
+                self.tracer.emit('warning', 'consistency',
+                                 "Warning: Consistency Ratio untuk '{target}' melebihi 0.1. Pertimbangkan untuk merevisi perbandingan Anda.",
+                                 target=node, CR=CR)
+        self.final_ranking = self.subtree_priorities[GOAL]
+        self.tracer.emit('step', 'ranking', "Ranking akhir dihitung ({nodes} node dihitung ulang).", nodes=recomputed)
+        return self.final_ranking
+
+    def global_weights(self):
+        """
+        Bobot global setiap kriteria: perkalian bobot lokal di sepanjang jalur dari akar.
+
+        Returns:
+            dict: Nama kriteria -> bobot global.
+        """
+        weights = {GOAL: 1.0}
+        queue = [GOAL]
+        for node in queue:
+            for idx, child in enumerate(self.children[node]):
+                weights[child] = weights[node] * float(self.local_weights[node][idx])
+                queue.append(child)
+        del weights[GOAL]
+        return weights
+
+    def get_results(self):
+        """
+        Mengembalikan hasil perhitungan hierarki AHP, dibangun saat dibaca dari snapshot saat get_results
+        dipanggil (add_criterion atau compute berikutnya tidak mengubah hasil ini).
+
+        Returns:
+            LazyResults: 'hierarchy', 'local_weights', 'global_weights', 'consistency_ratios',
+                'final_ranking' dan 'steps'.
+        """
+        snapshot = copy.copy(self)
+        snapshot.children = {node: list(children) for node, children in self.children.items()}
+        snapshot.local_weights = dict(self.local_weights)
+        snapshot.consistency_ratios = dict(self.consistency_ratios)
+        steps = self.steps
+        return LazyResults({
+            'hierarchy': lambda: snapshot.children,
+            'local_weights': lambda: {node: weights.tolist() for node, weights in snapshot.local_weights.items()},
+            'global_weights': snapshot.global_weights,
+            'consistency_ratios': lambda: snapshot.consistency_ratios,
+            'final_ranking': lambda: {snapshot.alternatives[i]: score for i, score in enumerate(snapshot.final_ranking)},
+            'steps': lambda: steps,
+        })
@@ -0,0 +1,167 @@
+# methods/inputs.py
+
+import numpy as np
+import pandas as pd
+
+from .validation import validate_labels, validate_matrix, validate_weights
+
+
+class DecisionInput:
+    """
+    Mixin setter data keputusan untuk metode berbasis tabel (SAW, TOPSIS) yang mencatat langkah melalui
+    self.tracer (lihat Traceable).
+    """
+
+    def set_criteria(self, criteria_benefit, criteria_cost):
+        """
+        Mengatur kriteria benefit dan cost.
+
+        Args:
+            criteria_benefit (list): Daftar kriteria benefit.
+            criteria_cost (list): Daftar kriteria cost.
+        """
+        self.criteria_benefit = criteria_benefit
+        self.criteria_cost = criteria_cost
+        self.tracer.emit('step', 'input', "Kriteria Benefit dan Cost telah diatur.",
+                         n_benefit=len(criteria_benefit), n_cost=len(criteria_cost))
+
+    def set_alternatives(self, alternatives):
+        """
+        Mengatur alternatif yang akan dievaluasi.
+
+        Args:
+            alternatives (list): Daftar alternatif.
+        """
+        self.alternatives = alternatives
+        self.tracer.emit('step', 'input', "Alternatif telah diatur.", n_alternatives=len(alternatives))
+
+    def set_weights(self, weight_benefit, weight_cost):
+        """
+        Mengatur bobot untuk kriteria benefit dan cost.
+
+        Args:
+            weight_benefit (list): Daftar bobot untuk kriteria benefit.
+            weight_cost (list): Daftar bobot untuk kriteria cost.
+        """
+        self.weight_benefit = weight_benefit
+        self.weight_cost = weight_cost
+        self.tracer.emit('step', 'input', "Bobot kriteria Benefit dan Cost telah diatur.")
+
+    def set_alternative_scores(self, criteria, scores):
+        """
+        Mengatur nilai alternatif untuk setiap kriteria.
+
+        Args:
+            criteria (str): Nama kriteria.
+            scores (dict): Dictionary dengan key sebagai alternatif dan value sebagai nilai.
+        """
+        self.alternative_scores[criteria] = scores
+        self.tracer.emit('step', 'input', "Nilai alternatif untuk kriteria '{target}' telah diatur.", target=criteria)
+
+    def set_decision_matrix(self, data, alternatives=None, criteria=None):
+        """
+        Mengatur nilai semua alternatif sekaligus dalam bentuk tabel (pengganti set_alternative_scores).
+
+        Args:
+            data (pd.DataFrame | np.ndarray): Tabel nilai dengan baris sebagai alternatif dan kolom sebagai kriteria.
+            alternatives (list, optional): Label alternatif. Wajib untuk ndarray; untuk DataFrame default index.
+            criteria (list, optional): Label kriteria. Wajib untuk ndarray; untuk DataFrame default kolom.
+        """
+        if isinstance(data, pd.DataFrame):
+            frame = data.copy()  # Disalin karena tabel bisa diubah metode (misal SAW.update_score)
+            if alternatives is not None or criteria is not None:
+                frame = frame.set_axis(alternatives if alternatives is not None else frame.index, axis=0)
+                frame = frame.set_axis(criteria if criteria is not None else frame.columns, axis=1)
+        else:
+            values = np.asarray(data, dtype=float)
+            if values.ndim != 2:
+                raise ValueError("Matriks keputusan harus 2 dimensi (alternatif x kriteria).")
+            if alternatives is None or criteria is None:
+                raise ValueError("Label alternatif dan kriteria wajib diberikan untuk ndarray.")
+            frame = pd.DataFrame(values, index=alternatives, columns=criteria)
+        self.decision_matrix = frame
+        self.alternatives = list(frame.index)
+        self.tracer.emit('step', 'input', "Matriks keputusan telah diatur.", shape=frame.shape)
+
+
+class HeadlessInput:
+    """
+    Mixin setter tanpa input interaktif untuk WP dan MAUT. Kelas turunan menentukan strictly_positive
+    (validasi nilai matriks) dan clear_results (hasil yang dihapus saat matriks diganti).
+    """
+    strictly_positive = False
+
+    def set_criteria(self, criteria_benefit, criteria_cost):
+        """
+        Mengatur kriteria benefit dan cost sekaligus tanpa input interaktif.
+
+        Parameters:
+            criteria_benefit (list): Daftar kriteria benefit.
+            criteria_cost (list): Daftar kriteria cost.
+        """
+        criteria = validate_labels(list(criteria_benefit) + list(criteria_cost), 'kriteria')
+        self.criteria_benefit = criteria[:len(criteria_benefit)]
+        self.criteria_cost = criteria[len(criteria_benefit):]
+
+    def set_alternatives(self, alternatives):
+        """
+        Mengatur alternatif sekaligus tanpa input interaktif.
+
+        Parameters:
+            alternatives (list): Daftar alternatif.
+        """
+        self.alternatives = validate_labels(alternatives, 'alternatif')
+
+    def set_weights(self, weight_benefit, weight_cost, normalize=True):
+        """
+        Mengatur bobot kriteria benefit dan cost sekaligus tanpa input interaktif.
+
+        Parameters:
+            weight_benefit (array-like): Bobot kriteria benefit.
+            weight_cost (array-like): Bobot kriteria cost.
+            normalize (bool): Normalisasi bobot agar total bobot sama dengan 1.
+        """
+        self.weight_benefit = validate_weights(weight_benefit, len(self.criteria_benefit), 'benefit')
+        self.weight_cost = validate_weights(weight_cost, len(self.criteria_cost), 'cost')
+        if normalize:
+            self.normalize_weights()
+
+    def set_matrices(self, matrix_benefit=None, matrix_cost=None):
+        """
+        Mengatur matriks benefit dan cost sekaligus dari ndarray dengan validasi ter-vektorisasi.
+        Skor dan ranking sebelumnya dihapus.
+
+        Parameters:
+            matrix_benefit (array-like): Matriks (jumlah alternatif, jumlah kriteria benefit).
+            matrix_cost (array-like): Matriks (jumlah alternatif, jumlah kriteria cost).
+        """
+        n = len(self.alternatives)
+        self.matrix_benefit = None
+        self.matrix_cost = None
+        if self.criteria_benefit:
+            self.matrix_benefit = validate_matrix(matrix_benefit, n, len(self.criteria_benefit), 'benefit',
+                                                  strictly_positive=self.strictly_positive)
+        if self.criteria_cost:
+            self.matrix_cost = validate_matrix(matrix_cost, n, len(self.criteria_cost), 'cost',
+                                               strictly_positive=self.strictly_positive)
+        self.clear_results()
+
+    def normalize_weights(self):
+        """
+        Normalisasi bobot kriteria agar total bobot sama dengan 1.
+        """
+        total_benefit = sum(self.weight_benefit)
+        total_cost = sum(self.weight_cost)
+        total = total_benefit + total_cost
+        if total == 0:
+            raise ValueError("Total bobot tidak boleh nol.")
+        # Normalisasi
+        self.weight_benefit = [w / total for w in self.weight_benefit]
+        self.weight_cost = [w / total for w in self.weight_cost]
+        self._log("\nBobot telah dinormalisasi.")
+
+    def clear_results(self):
+        """
+        Menghapus skor dan ranking sebelumnya.
+        """
+        raise NotImplementedError
@@ -1,10 +1,26 @@
 import numpy as np
 
-class MAUT:
-    def __init__(self):
+from .blocked import blocked_results, column_bounds, matrix_rows, open_matrix, open_output, read_block, row_blocks
+from .colstats import ReadOnlyMatrix, StatsIndex, adopt_matrix
+from .inputs import HeadlessInput
+from .ranking import rank_indices, ranked_labels
+from .sensitivity import weight_sensitivity
+from .utility import apply_utilities, make_utility
+from .validation import validate_labels, validate_matrix
+
+class MAUT(HeadlessInput):
+    strictly_positive = False  # Validasi nilai matriks pada set_matrices
+    matrix_benefit = ReadOnlyMatrix()  # Disimpan read-only; statistik kolom mengikuti identitas array
+    matrix_cost = ReadOnlyMatrix()
+
+    def __init__(self, verbose=True):
         """
         Inisialisasi objek MAUT tanpa kriteria dan alternatif awal.
+        
+        Parameters:
+            verbose (bool): Jika False, perhitungan tidak mencetak pesan apa pun (mode headless).
         """
+        self.verbose = verbose
         self.criteria_benefit = []
         self.criteria_cost = []
         self.weight_benefit = []
@@ -12,10 +28,14 @@ class MAUT:
         self.alternatives = []
         self.matrix_benefit = None
         self.matrix_cost = None
+        self.normal_benefit = None  # Matriks utilitas benefit (setelah normalisasi)
+        self.normal_cost = None     # Matriks utilitas cost (setelah normalisasi)
         self.S_scores = None
         self.V_scores = None
         self.ranked_alternatives = None
         self.ranked_V = None
+        self.utility_functions = {}  # Fungsi utilitas per kriteria (default linear)
+        self.stats_index = StatsIndex()  # Statistik kolom dan nilai turunan, dikaitkan ke array matriks
 
     def add_criteria(self, criteria_type='benefit'):
         """
@@ -121,7 +141,7 @@ class MAUT:
         length_alternative = len(self.alternatives)
 
         if self.criteria_benefit:
-            self.matrix_benefit = np.zeros((length_alternative, len(self.criteria_benefit)))
+            matrix_benefit = np.zeros((length_alternative, len(self.criteria_benefit)))
             print("\n=== Masukkan nilai untuk Matriks Benefit ===")
             for i, alternative in enumerate(self.alternatives):
                 for j, criteria in enumerate(self.criteria_benefit):
@@ -132,15 +152,16 @@ class MAUT:
                             if value < 0:
                                 print("Nilai benefit tidak boleh negatif. Silakan masukkan kembali.")
                                 continue
-                            self.matrix_benefit[i][j] = value
+                            matrix_benefit[i][j] = value
                             break
                         except ValueError:
                             print("Nilai harus berupa angka. Silakan masukkan kembali.")
+            self.matrix_benefit = matrix_benefit
         else:
             self.matrix_benefit = None
 
         if self.criteria_cost:
-            self.matrix_cost = np.zeros((length_alternative, len(self.criteria_cost)))
+            matrix_cost = np.zeros((length_alternative, len(self.criteria_cost)))
             print("\n=== Masukkan nilai untuk Matriks Cost ===")
             for i, alternative in enumerate(self.alternatives):
                 for j, criteria in enumerate(self.criteria_cost):
@@ -151,30 +172,163 @@ class MAUT:
                             if value < 0:
                                 print("Nilai cost tidak boleh negatif. Silakan masukkan kembali.")
                                 continue
-                            self.matrix_cost[i][j] = value
+                            matrix_cost[i][j] = value
                             break
                         except ValueError:
                             print("Nilai harus berupa angka. Silakan masukkan kembali.")
+            self.matrix_cost = matrix_cost
         else:
             self.matrix_cost = None
 
         print("Matriks telah dibuat.")
 
-    def normalize_weights(self):
+    def _log(self, message):
+        """
+        Mencetak pesan proses hanya jika verbose aktif.
+        """
+        if self.verbose:
+            print(message)
+
+    def clear_results(self):
+        """
+        Menghapus skor dan ranking sebelumnya.
+        """
+        self.normal_benefit = None
+        self.normal_cost = None
+        self.S_scores = None
+        self.V_scores = None
+        self.ranked_alternatives = None
+        self.ranked_V = None
+
+    def append_alternatives(self, alternatives, matrix_benefit=None, matrix_cost=None):
+        """
+        Menambahkan alternatif baru beserta nilainya ke matriks yang sudah diatur. Statistik kolom
+        diperbarui hanya dengan baris baru (tanpa memindai ulang); skor dan ranking sebelumnya dihapus.
+        
+        Parameters:
+            alternatives (list): Daftar alternatif baru.
+            matrix_benefit (array-like): Nilai benefit alternatif baru (jumlah alternatif baru, jumlah kriteria benefit).
+            matrix_cost (array-like): Nilai cost alternatif baru (jumlah alternatif baru, jumlah kriteria cost).
+        """
+        alternatives = validate_labels(list(self.alternatives) + list(alternatives), 'alternatif')[len(self.alternatives):]
+        k = len(alternatives)
+        if self.criteria_benefit:
+            if self.matrix_benefit is None:
+                raise ValueError("Matriks benefit belum diatur.")
+            rows = validate_matrix(matrix_benefit, k, len(self.criteria_benefit), 'benefit', strictly_positive=False)
+            old_matrix = self.matrix_benefit
+            matrix = adopt_matrix(self, 'matrix_benefit', np.vstack((old_matrix, rows)))  # Tanpa salinan kedua
+            self.stats_index.append('benefit', rows, old_matrix, matrix)
+        if self.criteria_cost:
+            if self.matrix_cost is None:
+                raise ValueError("Matriks cost belum diatur.")
+            rows = validate_matrix(matrix_cost, k, len(self.criteria_cost), 'cost', strictly_positive=False)
+            old_matrix = self.matrix_cost
+            matrix = adopt_matrix(self, 'matrix_cost', np.vstack((old_matrix, rows)))  # Tanpa salinan kedua
+            self.stats_index.append('cost', rows, old_matrix, matrix)
+        self.alternatives = list(self.alternatives) + alternatives
+        self.clear_results()
+
+    def column_stats(self, kind):
+        """
+        Statistik kolom matriks benefit atau cost (lihat ColumnStats), dihitung sekali selama matriks tidak berganti.
+        
+        Parameters:
+            kind (str): 'benefit' atau 'cost'.
+        
+        Returns:
+            ColumnStats: Statistik kolom.
+        """
+        matrix = self.matrix_benefit if kind == 'benefit' else self.matrix_cost
+        if matrix is None:
+            raise ValueError(f"Matriks {kind} belum diatur.")
+        return self.stats_index.get(kind, matrix)
+
+    def evaluate(self, matrix_benefit=None, matrix_cost=None, top_k=None):
         """
-        Normalisasi bobot kriteria agar total bobot sama dengan 1.
+        Menghitung skor dan ranking untuk satu dataset tanpa input/output interaktif.
+        Kriteria, alternatif dan bobot dipakai ulang sehingga banyak dataset bisa dinilai berurutan.
+        
+        Parameters:
+            matrix_benefit (array-like): Matriks benefit.
+            matrix_cost (array-like): Matriks cost.
+            top_k (int, optional): Hanya mengurutkan k alternatif teratas.
+        
+        Returns:
+            dict: Hasil perhitungan (lihat get_results).
         """
-        total_benefit = sum(self.weight_benefit)
-        total_cost = sum(self.weight_cost)
-        total = total_benefit + total_cost
-        if total == 0:
-            raise ValueError("Total bobot tidak boleh nol.")
-        # Normalisasi
-        self.weight_benefit = [w / total for w in self.weight_benefit]
-        self.weight_cost = [w / total for w in self.weight_cost]
-        print("\nBobot telah dinormalisasi.")
+        self.set_matrices(matrix_benefit, matrix_cost)
+        self.calculate_scores()
+        if self.V_scores is None:
+            raise ValueError("Skor V tidak dapat dihitung.")
+        self.rank_alternatives(top_k)
+        return self.get_results()
 
-    def calculate_scores(self):
+    def get_results(self):
+        """
+        Mengembalikan hasil perhitungan MAUT dalam format dictionary.
+        
+        Returns:
+            dict: Bobot kriteria, skor S, skor V dan ranking akhir.
+        """
+        ranking = {}
+        if self.ranked_alternatives is not None:
+            ranking = dict(zip(self.ranked_alternatives, self.ranked_V))
+        return {
+            'criteria_weights': self.weight_benefit + self.weight_cost,
+            'S_scores': self.S_scores,
+            'V_scores': self.V_scores,
+            'final_ranking': ranking,
+        }
+
+    def set_utility(self, criteria, shape='linear', **params):
+        """
+        Mengatur fungsi utilitas untuk satu kriteria. Nilai ternormalisasi x (0..1) diubah menjadi utilitas u(x).
+        
+        Parameters:
+            criteria (str): Nama kriteria (benefit atau cost).
+            shape (str): 'linear', 'exponential', 'logarithmic' atau 'piecewise'.
+            **params: 'alpha' untuk exponential/logarithmic, 'points' (list (x, u)) untuk piecewise.
+        """
+        if criteria not in self.criteria_benefit + self.criteria_cost:
+            raise ValueError(f"Kriteria '{criteria}' tidak ditemukan.")
+        self.utility_functions[criteria] = make_utility(shape, **params)
+
+    def apply_utility(self, norm_matrix, criteria):
+        """
+        Menerapkan fungsi utilitas kriteria pada matriks ternormalisasi.
+        Jika semua kriteria linear, matriks dikembalikan apa adanya.
+        
+        Parameters:
+            norm_matrix (np.ndarray): Matriks ternormalisasi.
+            criteria (list): Nama kriteria untuk setiap kolom.
+        
+        Returns:
+            np.ndarray: Matriks utilitas.
+        """
+        specs = [self.utility_functions.get(crit, ('linear', {})) for crit in criteria]
+        if all(shape == 'linear' for shape, _ in specs):
+            return norm_matrix
+        return apply_utilities(norm_matrix, specs)
+
+    def sensitivity(self, weights):
+        """
+        Analisis sensitivitas bobot MAUT: utilitas total semua skenario dihitung sekaligus sebagai matriks utilitas @ weights.
+        
+        Parameters:
+            weights (array-like): Skenario bobot berbentuk (s, jumlah kriteria), urutan kriteria benefit lalu cost.
+        
+        Returns:
+            dict: Skor S, peringkat per skenario dan ringkasan stabilitas peringkat (lihat weight_sensitivity).
+        """
+        if self.normal_benefit is None and self.normal_cost is None:
+            self.calculate_scores()
+        parts = [part for part in (self.normal_benefit, self.normal_cost) if part is not None]
+        if not parts:
+            raise ValueError("Matriks utilitas belum dihitung.")
+        return weight_sensitivity(np.hstack(parts), weights, self.weight_benefit + self.weight_cost, self.alternatives)
+
+    def calculate_scores(self, max_val=None, min_val=None):
         """
         Hitung skor MAUT untuk setiap alternatif.
         
@@ -182,36 +336,23 @@ class MAUT:
         1. Normalisasi nilai kriteria (benefit dan cost).
         2. Hitung utilitas total S_i = sum (U_j(x_ij) * w_j) untuk semua j.
         3. Hitung skor V_i = S_i / sum(S_i).
+        
+        Parameters:
+            max_val (np.ndarray, optional): Maksimum setiap kolom benefit yang sudah dihitung sebelumnya.
+            min_val (np.ndarray, optional): Minimum setiap kolom cost yang sudah dihitung sebelumnya.
         """
         if not self.weight_benefit and not self.weight_cost:
-            print("Belum ada bobot yang diinput.")
+            self._log("Belum ada bobot yang diinput.")
             return
 
-        # Normalisasi matriks kriteria benefit
-        if self.matrix_benefit is not None:
-            norm_matrix_benefit = np.zeros_like(self.matrix_benefit)
-            for j in range(self.matrix_benefit.shape[1]):
-                column = self.matrix_benefit[:, j]
-                max_val = column.max()
-                if max_val == 0:
-                    norm_matrix_benefit[:, j] = 0
-                else:
-                    norm_matrix_benefit[:, j] = column / max_val
-        else:
-            norm_matrix_benefit = None
+        if max_val is None and self.matrix_benefit is not None:
+            max_val = self.column_stats('benefit').max
+        if min_val is None and self.matrix_cost is not None:
+            min_val = self.column_stats('cost').min
+        norm_matrix_benefit, norm_matrix_cost = self.utility_values(self.matrix_benefit, self.matrix_cost, max_val, min_val)
 
-        # Normalisasi matriks kriteria cost
-        if self.matrix_cost is not None:
-            norm_matrix_cost = np.zeros_like(self.matrix_cost)
-            for j in range(self.matrix_cost.shape[1]):
-                column = self.matrix_cost[:, j]
-                min_val = column.min()
-                if min_val == 0:
-                    norm_matrix_cost[:, j] = 0
-                else:
-                    norm_matrix_cost[:, j] = min_val / column
-        else:
-            norm_matrix_cost = None
+        self.normal_benefit = norm_matrix_benefit
+        self.normal_cost = norm_matrix_cost
 
         # Hitung utilitas total S_i
         S = np.zeros(len(self.alternatives))
@@ -231,28 +372,130 @@ class MAUT:
         # Hitung sum S_i
         sum_S = S.sum()
         if sum_S == 0:
-            print("Jumlah total skor S adalah nol. Tidak dapat menghitung skor V.")
+            self._log("Jumlah total skor S adalah nol. Tidak dapat menghitung skor V.")
             self.V_scores = None
             return
 
         # Hitung skor V_i
         V = S / sum_S
         self.V_scores = V
-        print("Skor S dan V telah dihitung.")
+        self._log("Skor S dan V telah dihitung.")
 
-    def rank_alternatives(self):
+    def utility_values(self, matrix_benefit, matrix_cost, max_val, min_val):
+        """
+        Normalisasi matriks benefit dan cost (atau sebagian barisnya) lalu menerapkan fungsi utilitas.
+        
+        Parameters:
+            matrix_benefit (np.ndarray): Matriks benefit atau None.
+            matrix_cost (np.ndarray): Matriks cost atau None.
+            max_val (np.ndarray): Nilai maksimum setiap kolom benefit (dari seluruh alternatif).
+            min_val (np.ndarray): Nilai minimum setiap kolom cost (dari seluruh alternatif).
+        
+        Returns:
+            tuple: (matriks utilitas benefit, matriks utilitas cost); None untuk matriks yang tidak ada.
+        """
+        # Normalisasi matriks kriteria benefit (x / max kolom, kolom dengan max 0 bernilai 0)
+        if matrix_benefit is not None:
+            norm_matrix_benefit = np.divide(matrix_benefit, max_val,
+                                            out=np.zeros_like(matrix_benefit), where=max_val != 0)
+            norm_matrix_benefit = self.apply_utility(norm_matrix_benefit, self.criteria_benefit)
+        else:
+            norm_matrix_benefit = None
+
+        # Normalisasi matriks kriteria cost (min kolom / x, kolom dengan min 0 bernilai 0)
+        if matrix_cost is not None:
+            norm_matrix_cost = np.divide(min_val, matrix_cost,
+                                         out=np.zeros_like(matrix_cost), where=min_val != 0)
+            norm_matrix_cost = self.apply_utility(norm_matrix_cost, self.criteria_cost)
+        else:
+            norm_matrix_cost = None
+        return norm_matrix_benefit, norm_matrix_cost
+
+    def evaluate_blocked(self, matrix_benefit=None, matrix_cost=None, out=None, alternatives=None, top_k=None,
+                         chunk_size=100_000):
+        """
+        Menghitung skor dan ranking MAUT per blok baris untuk matriks yang lebih besar dari RAM
+        (file .npy dibuka sebagai np.memmap).
+        
+        Pass pertama memvalidasi blok dan menghitung max (benefit) dan min (cost) setiap kolom. Pass kedua
+        menghitung utilitas total S per blok, menulisnya ke out dan menjumlahkan S. Pass ketiga membagi out
+        dengan jumlah S sehingga out berisi V. Memori tambahan sebanding dengan chunk_size x jumlah kriteria.
+        V dan ranking sama dengan evaluate; S_scores dan matriks utilitas tidak disimpan.
+        
+        Parameters:
+            matrix_benefit (str | np.ndarray): Path .npy atau matriks (n, jumlah kriteria benefit).
+            matrix_cost (str | np.ndarray): Path .npy atau matriks (n, jumlah kriteria cost).
+            out (str | np.ndarray, optional): Path .npy (dibuat sebagai memmap) atau array (n,) untuk skor V.
+            alternatives (list, optional): Label alternatif. Default self.alternatives, atau indeks baris (np.arange).
+            top_k (int, optional): Hanya mengurutkan k alternatif teratas. Default semua alternatif (O(n)).
+            chunk_size (int): Jumlah baris per blok.
+        
+        Returns:
+            LazyResults: Hasil perhitungan (lihat blocked_results); 'final_ranking' dibangun saat dibaca.
+        """
+        if not self.weight_benefit and not self.weight_cost:
+            raise ValueError("Belum ada bobot yang diinput.")
+        matrix_benefit = open_matrix(matrix_benefit) if self.criteria_benefit else None
+        matrix_cost = open_matrix(matrix_cost) if self.criteria_cost else None
+        n = matrix_rows(matrix_benefit, matrix_cost, self.criteria_benefit, self.criteria_cost)
+        if alternatives is not None:
+            self.alternatives = validate_labels(alternatives, 'alternatif')
+        elif len(self.alternatives) != n:
+            self.alternatives = np.arange(n)  # Tanpa list Python berisi jutaan label
+        self.matrix_benefit = None
+        self.matrix_cost = None
+        self.normal_benefit = None
+        self.normal_cost = None
+        self.S_scores = None
+
+        # Pass 1: statistik kolom
+        max_val, _ = column_bounds(matrix_benefit, chunk_size, 'benefit', strictly_positive=False)
+        _, min_val = column_bounds(matrix_cost, chunk_size, 'cost', strictly_positive=False)
+
+        # Pass 2: utilitas total S per blok
+        scores = open_output(out, n)
+        sum_S = 0.0
+        for rows in row_blocks(n, chunk_size):
+            benefit = read_block(matrix_benefit, rows, 'benefit')
+            cost = read_block(matrix_cost, rows, 'cost')
+            norm_benefit, norm_cost = self.utility_values(benefit, cost, max_val, min_val)
+            S = np.zeros(rows.stop - rows.start)
+            if norm_benefit is not None:
+                S += (norm_benefit * self.weight_benefit).sum(axis=1)
+            if norm_cost is not None:
+                S += (norm_cost * self.weight_cost).sum(axis=1)
+            scores[rows] = S
+            sum_S += S.sum()
+        if sum_S == 0:
+            raise ValueError("Jumlah total skor S adalah nol. Tidak dapat menghitung skor V.")
+
+        # Pass 3: V = S / sum S
+        for rows in row_blocks(n, chunk_size):
+            scores[rows] /= sum_S
+        if isinstance(scores, np.memmap):
+            scores.flush()
+        self.V_scores = scores
+        self._log("Skor V telah dihitung per blok.")
+        self.rank_alternatives(top_k)
+        return blocked_results(self.weight_benefit + self.weight_cost, self.V_scores, self.ranked_alternatives,
+                               self.ranked_V)
+
+    def rank_alternatives(self, top_k=None):
         """
         Mengurutkan alternatif berdasarkan nilai V (tertinggi ke terendah).
+        
+        Parameters:
+            top_k (int, optional): Hanya mengurutkan k alternatif teratas (seleksi parsial). Default semua alternatif.
         """
         if self.V_scores is None:
             self.calculate_scores()
         if self.V_scores is None:
-            print("Tidak dapat melakukan ranking karena skor V belum tersedia.")
+            self._log("Tidak dapat melakukan ranking karena skor V belum tersedia.")
             return
-        ranked_indices = np.argsort(self.V_scores)[::-1]
-        self.ranked_alternatives = [self.alternatives[i] for i in ranked_indices]
+        ranked_indices = rank_indices(self.V_scores, top_k)
+        self.ranked_alternatives = ranked_labels(self.alternatives, ranked_indices)
         self.ranked_V = self.V_scores[ranked_indices]
-        print("Alternatif telah diurutkan berdasarkan skor V.")
+        self._log("Alternatif telah diurutkan berdasarkan skor V.")
 
     def display(self):
         """
@@ -0,0 +1,285 @@
+# methods/packed.py
+
+from collections.abc import MutableMapping
+from functools import lru_cache
+
+import numpy as np
+
+from .priority import solve_priorities
+
+
+@lru_cache(maxsize=32)
+def upper_indices(n):
+    """
+    Indeks baris dan kolom segitiga atas (tanpa diagonal) matriks n x n, urutan baris demi baris.
+    """
+    rows, cols = np.triu_indices(n, 1)
+    rows.setflags(write=False)
+    cols.setflags(write=False)
+    return rows, cols
+
+
+def pack(matrices, dtype=float):
+    """
+    Mengambil segitiga atas (tanpa diagonal) dari matriks perbandingan resiprokal.
+
+    Args:
+        matrices (np.ndarray): Matriks berbentuk (n, n) atau (k, n, n).
+        dtype: Tipe data hasil (np.float32 atau np.float64).
+
+    Returns:
+        np.ndarray: Nilai segitiga atas berbentuk (m,) atau (k, m) dengan m = n(n-1)/2.
+    """
+    matrices = np.asarray(matrices)
+    rows, cols = upper_indices(matrices.shape[-1])
+    return matrices[..., rows, cols].astype(dtype)
+
+
+def unpack(values, n):
+    """
+    Membentuk matriks perbandingan lengkap dari segitiga atas: a_ji = 1 / a_ij dan diagonal 1.
+
+    Args:
+        values (np.ndarray): Nilai segitiga atas berbentuk (m,) atau (k, m).
+        n (int): Ukuran matriks.
+
+    Returns:
+        np.ndarray: Matriks float64 berbentuk (n, n) atau (k, n, n).
+    """
+    values = np.asarray(values, dtype=float)
+    rows, cols = upper_indices(n)
+    matrices = np.ones(values.shape[:-1] + (n, n))
+    matrices[..., rows, cols] = values
+    matrices[..., cols, rows] = 1 / values
+    return matrices
+
+
+def packed_matvec(values, weights, n):
+    """
+    Menghitung A @ w untuk banyak matriks langsung dari segitiga atas, tanpa membentuk matriks lengkap:
+    (Aw)_i = w_i + sum_{j>i} a_ij w_j + sum_{j<i} w_j / a_ji.
+
+    Args:
+        values (np.ndarray): Nilai segitiga atas berbentuk (k, m), float64.
+        weights (np.ndarray): Vektor berbentuk (k, n).
+        n (int): Ukuran matriks.
+
+    Returns:
+        np.ndarray: Hasil perkalian berbentuk (k, n).
+    """
+    rows, cols = upper_indices(n)
+    k = len(values)
+    offset = (np.arange(k) * n)[:, None]
+    upper = np.bincount((offset + rows).ravel(), (values * weights[:, cols]).ravel(), minlength=k * n)
+    lower = np.bincount((offset + cols).ravel(), (weights[:, rows] / values).ravel(), minlength=k * n)
+    return weights + (upper + lower).reshape(k, n)
+
+
+def _packed_diagnostics(values, weights, n, solver, iterations, converged):
+    """
+    Sama dengan priority._diagnostics, tetapi Aw dihitung dari bentuk packed.
+    """
+    product = packed_matvec(values, weights, n)
+    lambda_max = product.sum(axis=-1) / weights.sum(axis=-1)
+    residual = np.abs(product - lambda_max[..., None] * weights).max(axis=-1)
+    return {
+        'weights': weights,
+        'lambda_max': lambda_max,
+        'residual': residual,
+        'iterations': iterations,
+        'converged': converged,
+        'solver': solver,
+    }
+
+
+def packed_power_priorities(values, n, tol=1e-10, max_iter=1000, initial=None):
+    """
+    Power iteration langsung pada bentuk packed (lihat priority.power_priorities).
+    """
+    k = len(values)
+    if initial is None:
+        weights = np.full((k, n), 1.0 / n)
+    else:
+        weights = np.broadcast_to(np.asarray(initial, dtype=float), (k, n)).copy()
+        weights /= weights.sum(axis=-1, keepdims=True)
+    converged = np.zeros(k, dtype=bool)
+    iterations = np.zeros(k, dtype=np.int64)
+    active = np.arange(k)
+    for _ in range(max_iter):
+        new_weights = packed_matvec(values[active], weights[active], n)
+        new_weights /= new_weights.sum(axis=-1, keepdims=True)
+        done = np.abs(new_weights - weights[active]).max(axis=-1) < tol
+        weights[active] = new_weights
+        iterations[active] += 1
+        converged[active] = done
+        active = active[~done]
+        if len(active) == 0:
+            break
+    return _packed_diagnostics(values, weights, n, 'power', iterations, converged)
+
+
+def packed_geometric_mean_priorities(values, n):
+    """
+    Rata-rata geometrik baris langsung pada bentuk packed: sum_j log a_ij = sum_{j>i} log a_ij - sum_{j<i} log a_ji.
+    """
+    rows, cols = upper_indices(n)
+    k = len(values)
+    offset = (np.arange(k) * n)[:, None]
+    logs = np.log(values)
+    log_sum = (np.bincount((offset + rows).ravel(), logs.ravel(), minlength=k * n)
+               - np.bincount((offset + cols).ravel(), logs.ravel(), minlength=k * n)).reshape(k, n)
+    log_mean = log_sum / n
+    weights = np.exp(log_mean - log_mean.max(axis=-1, keepdims=True))  # Digeser agar exp tidak overflow
+    weights /= weights.sum(axis=-1, keepdims=True)
+    converged = np.ones(k, dtype=bool)
+    iterations = np.zeros(k, dtype=np.int64)
+    return _packed_diagnostics(values, weights, n, 'geometric_mean', iterations, converged)
+
+
+def solve_packed(values, n, solver='eig', **options):
+    """
+    Menghitung bobot prioritas dari bentuk packed. 'power' dan 'geometric_mean' bekerja langsung pada
+    segitiga atas; 'eig' membutuhkan matriks lengkap, sehingga matriks dibentuk sementara di dalam solver.
+
+    Args:
+        values (np.ndarray): Nilai segitiga atas berbentuk (k, m).
+        n (int): Ukuran matriks.
+        solver (str): 'eig', 'power' atau 'geometric_mean'.
+        **options: Opsi solver (lihat solve_priorities).
+
+    Returns:
+        dict: Bobot dan diagnostik konvergensi (lihat priority._diagnostics).
+    """
+    values = np.asarray(values, dtype=float)  # Perhitungan selalu float64, berapa pun dtype penyimpanan
+    if solver == 'power':
+        return packed_power_priorities(values, n, **options)
+    if solver == 'geometric_mean':
+        return packed_geometric_mean_priorities(values, n, **options)
+    return solve_priorities(unpack(values, n), solver, **options)
+
+
+class PackedComparisons(MutableMapping):
+    """
+    Penyimpanan matriks perbandingan resiprokal untuk banyak kriteria dalam satu buffer kontigu
+    berbentuk (jumlah kriteria, n(n-1)/2): hanya segitiga atas yang disimpan, bagian resiprokal dan
+    diagonal diturunkan saat dibutuhkan. Sebagai Mapping, item['kriteria'] mengembalikan matriks lengkap
+    (salinan baru); perubahan pada salinan itu tidak tersimpan, gunakan set_value atau set_comparisons.
+    """
+
+    def __init__(self, names, n, dtype=np.float64):
+        """
+        Args:
+            names (list): Nama matriks (kriteria), menentukan urutan baris buffer.
+            n (int): Ukuran setiap matriks (jumlah alternatif).
+            dtype: np.float64 (default) atau np.float32 (setengah memori, presisi ~7 digit).
+        """
+        self.names = list(names)
+        self.index = {name: k for k, name in enumerate(self.names)}
+        self.n = n
+        self.buffer = np.ones((len(self.names), n * (n - 1) // 2), dtype=dtype)
+        self.present = set()  # Nama matriks yang sudah diisi
+
+    def _row(self, name):
+        if name not in self.index:
+            raise KeyError(name)
+        return self.index[name]
+
+    def __getitem__(self, name):
+        if name not in self.present:
+            raise KeyError(name)
+        return unpack(self.buffer[self.index[name]], self.n)
+
+    def __setitem__(self, name, matrix):
+        matrix = np.asarray(matrix)
+        if matrix.shape != (self.n, self.n):
+            raise ValueError(f"Matriks '{name}' harus berukuran ({self.n}, {self.n}).")
+        self.buffer[self._row(name)] = pack(matrix, self.buffer.dtype)
+        self.present.add(name)
+
+    def __delitem__(self, name):
+        if name not in self.present:
+            raise KeyError(name)
+        self.buffer[self.index[name]] = 1
+        self.present.discard(name)
+
+    def __iter__(self):
+        return (name for name in self.names if name in self.present)
+
+    def __len__(self):
+        return len(self.present)
+
+    def __contains__(self, name):
+        return name in self.present
+
+    def _position(self, i, j):
+        """
+        Posisi (i, j) dengan i < j pada baris packed.
+        """
+        n = self.n
+        return i * n - i * (i + 1) // 2 + (j - i - 1)
+
+    def set_value(self, name, i, j, value):
+        """
+        Mengubah satu perbandingan a_ij (nilai a_ji otomatis 1 / value).
+        """
+        if i == j:
+            raise ValueError("Perbandingan item dengan dirinya sendiri selalu 1.")
+        if not (0 <= i < self.n and 0 <= j < self.n):
+            raise ValueError(f"Indeks perbandingan untuk '{name}' harus 0..{self.n - 1}.")
+        if i > j:
+            i, j, value = j, i, 1 / value
+        self.buffer[self._row(name), self._position(i, j)] = value
+        self.present.add(name)
+
+    def set_comparisons(self, name, comparisons, reset=False):
+        """
+        Mengisi perbandingan (i, j, value) sekaligus; perbandingan yang tidak diberikan tetap seperti sebelumnya
+        (1 untuk matriks baru atau jika reset=True).
+        """
+        row = self._row(name)
+        comparisons = np.asarray(comparisons, dtype=float).reshape(-1, 3)
+        i = comparisons[:, 0].astype(np.int64)
+        j = comparisons[:, 1].astype(np.int64)
+        values = comparisons[:, 2]
+        n = self.n
+        if np.any((i < 0) | (i >= n) | (j < 0) | (j >= n)) or np.any(i == j):
+            raise ValueError(f"Indeks perbandingan untuk '{name}' harus 0..{n - 1} dan i != j.")
+        if reset or name not in self.present:
+            self.buffer[row] = 1
+        swap = i > j
+        i, j = np.where(swap, j, i), np.where(swap, i, j)
+        values = np.where(swap, 1 / values, values)
+        self.buffer[row, self._position(i, j)] = values
+        self.present.add(name)
+
+    def copy(self):
+        """
+        Salinan dengan buffer sendiri.
+        """
+        other = PackedComparisons(self.names, self.n, self.buffer.dtype)
+        other.buffer[:] = self.buffer
+        other.present = set(self.present)
+        return other
+
+    def packed(self, names=None):
+        """
+        Salinan baris packed untuk nama-nama matriks, berbentuk (k, m) dengan dtype penyimpanan.
+        """
+        if names is None:
+            names = list(self)
+        return self.buffer[[self._row(name) for name in names]]
+
+    def dense(self, names=None):
+        """
+        Membentuk matriks lengkap (k, n, n) float64 untuk nama-nama matriks. Hanya dipanggil jika dibutuhkan.
+        """
+        if names is None:
+            names = list(self)
+        return unpack(self.packed(names), self.n)
+
+    @property
+    def nbytes(self):
+        """
+        Ukuran buffer dalam byte.
+        """
+        return self.buffer.nbytes
@@ -0,0 +1,277 @@
+# methods/priority.py
+
+import time
+
+import numpy as np
+
+
+def _diagnostics(matrices, weights, solver, iterations, converged):
+    """
+    Menyusun hasil solver beserta diagnostik konvergensi.
+
+    Args:
+        matrices (np.ndarray): Matriks perbandingan berbentuk (n, n) atau (k, n, n).
+        weights (np.ndarray): Bobot ternormalisasi berbentuk (n,) atau (k, n).
+        solver (str): Nama solver.
+        iterations (int | np.ndarray): Jumlah iterasi yang dijalankan per matriks.
+        converged (np.ndarray): Status konvergensi per matriks.
+
+    Returns:
+        dict: 'weights', 'lambda_max', 'residual', 'iterations', 'converged' dan 'solver'.
+    """
+    product = np.matmul(matrices, weights[..., None])[..., 0]
+    lambda_max = product.sum(axis=-1) / weights.sum(axis=-1)           # Sama dengan rumus pada calculate_consistency_ratio
+    residual = np.abs(product - lambda_max[..., None] * weights).max(axis=-1)  # ||Aw - lambda_max w||_inf
+    return {
+        'weights': weights,
+        'lambda_max': lambda_max,
+        'residual': residual,
+        'iterations': iterations,
+        'converged': converged,
+        'solver': solver,
+    }
+
+
+def eig_priorities(matrices):
+    """
+    Menghitung bobot dengan dekomposisi eigen penuh (np.linalg.eig) dan mengambil eigenvector utama.
+
+    Args:
+        matrices (np.ndarray): Matriks perbandingan berbentuk (n, n) atau (k, n, n).
+
+    Returns:
+        dict: Bobot dan diagnostik (lihat _diagnostics).
+    """
+    eigvals, eigvecs = np.linalg.eig(matrices)                          # Menghitung semua nilai dan vektor eigen
+    max_index = np.argmax(eigvals.real, axis=-1)                        # Indeks nilai eigen terbesar (principal eigenvalue)
+    principal_eigvecs = np.take_along_axis(eigvecs, max_index[..., None, None], axis=-1)[..., 0].real
+    weights = principal_eigvecs / principal_eigvecs.sum(axis=-1, keepdims=True)  # Normalisasi bobot
+    converged = np.ones(matrices.shape[:-2], dtype=bool)
+    iterations = np.ones(matrices.shape[:-2], dtype=np.int64)
+    return _diagnostics(matrices, weights, 'eig', iterations, converged)
+
+
+def power_priorities(matrices, tol=1e-10, max_iter=1000, initial=None):
+    """
+    Menghitung bobot dengan power iteration: w <- Aw / sum(Aw) sampai perubahan bobot < tol.
+
+    Args:
+        matrices (np.ndarray): Matriks perbandingan berbentuk (n, n) atau (k, n, n).
+        tol (float): Toleransi perubahan bobot maksimum antar iterasi.
+        max_iter (int): Batas jumlah iterasi.
+        initial (np.ndarray, optional): Bobot awal (warm start). Default vektor seragam.
+
+    Returns:
+        dict: Bobot dan diagnostik (lihat _diagnostics).
+    """
+    n = matrices.shape[-1]
+    if initial is None:
+        weights = np.full(matrices.shape[:-1], 1.0 / n)
+    else:
+        weights = np.broadcast_to(np.asarray(initial, dtype=float), matrices.shape[:-1]).copy()
+        weights /= weights.sum(axis=-1, keepdims=True)
+
+    # Matriks yang sudah konvergen dibekukan, sehingga hasil setiap matriks tidak bergantung pada isi batch
+    batch_shape = matrices.shape[:-2]
+    flat_matrices = matrices.reshape(-1, n, n)
+    weights = weights.reshape(-1, n)
+    converged = np.zeros(len(flat_matrices), dtype=bool)
+    iterations = np.zeros(len(flat_matrices), dtype=np.int64)
+    active = np.arange(len(flat_matrices))
+    for _ in range(max_iter):
+        if len(active) == len(flat_matrices):
+            current_matrices, current_weights = flat_matrices, weights
+        else:
+            current_matrices, current_weights = flat_matrices[active], weights[active]
+        new_weights = np.matmul(current_matrices, current_weights[..., None])[..., 0]
+        new_weights /= new_weights.sum(axis=-1, keepdims=True)
+        done = np.abs(new_weights - current_weights).max(axis=-1) < tol
+        weights[active] = new_weights
+        iterations[active] += 1
+        converged[active] = done
+        active = active[~done]
+        if len(active) == 0:
+            break
+    weights = weights.reshape(batch_shape + (n,))
+    converged = converged.reshape(batch_shape)
+    iterations = iterations.reshape(batch_shape)
+    return _diagnostics(matrices, weights, 'power', iterations, converged)
+
+
+def geometric_mean_priorities(matrices):
+    """
+    Menghitung bobot dengan rata-rata geometrik baris (logarithmic least squares).
+
+    Args:
+        matrices (np.ndarray): Matriks perbandingan berbentuk (n, n) atau (k, n, n).
+
+    Returns:
+        dict: Bobot dan diagnostik (lihat _diagnostics).
+    """
+    log_mean = np.log(matrices).mean(axis=-1)
+    weights = np.exp(log_mean - log_mean.max(axis=-1, keepdims=True))  # Digeser agar exp tidak overflow
+    weights /= weights.sum(axis=-1, keepdims=True)
+    converged = np.ones(matrices.shape[:-2], dtype=bool)
+    iterations = np.zeros(matrices.shape[:-2], dtype=np.int64)
+    return _diagnostics(matrices, weights, 'geometric_mean', iterations, converged)
+
+
+# Batas Geometric Consistency Index (Aguaron & Moreno-Jimenez) berdasarkan jumlah item
+GCI_THRESHOLD = {3: 0.31, 4: 0.35}
+GCI_THRESHOLD_DEFAULT = 0.37
+
+
+def connected_components(n, rows, cols):
+    """
+    Memberi label komponen terhubung pada graf perbandingan (item = node, perbandingan = edge).
+
+    Args:
+        n (int): Jumlah item.
+        rows (np.ndarray): Indeks item i setiap perbandingan.
+        cols (np.ndarray): Indeks item j setiap perbandingan.
+
+    Returns:
+        np.ndarray: Label komponen per item (label = indeks terkecil di komponen).
+    """
+    labels = np.arange(n)
+    while True:
+        # Setiap edge menyebarkan label terkecil dari kedua ujungnya sampai tidak ada perubahan
+        smallest = np.minimum(labels[rows], labels[cols])
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, rows, smallest)
+        np.minimum.at(new_labels, cols, smallest)
+        new_labels = new_labels[new_labels]  # Lompat langsung ke label dari label (mempercepat konvergensi)
+        if np.array_equal(new_labels, labels):
+            return labels
+        labels = new_labels
+
+
+def log_least_squares_priorities(n, rows, cols, values, tol=1e-12, max_iter=None):
+    """
+    Menghitung bobot dari perbandingan berpasangan yang tidak lengkap dengan logarithmic least squares:
+    meminimalkan sum (log a_ij - (x_i - x_j))^2 dengan w = exp(x) / sum(exp(x)).
+
+    Persamaan normalnya adalah sistem Laplacian graf perbandingan L x = b, yang diselesaikan dengan
+    conjugate gradient (preconditioner Jacobi) langsung di atas daftar edge. Setiap iterasi O(jumlah
+    perbandingan), tanpa membentuk matriks n x n. Graf perbandingan harus terhubung.
+
+    Args:
+        n (int): Jumlah item.
+        rows (np.ndarray): Indeks item i setiap perbandingan.
+        cols (np.ndarray): Indeks item j setiap perbandingan.
+        values (np.ndarray): Nilai perbandingan a_ij (> 0).
+        tol (float): Toleransi norma residual relatif.
+        max_iter (int, optional): Batas iterasi CG. Default 10 * n.
+
+    Returns:
+        dict: 'weights', 'log_residuals' (per perbandingan), 'gci' (Geometric Consistency Index),
+            'gci_threshold', 'iterations', 'converged', 'residual' dan 'solver'.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    logs = np.log(np.asarray(values, dtype=float))
+    degree = np.bincount(rows, minlength=n) + np.bincount(cols, minlength=n)
+    b = np.bincount(rows, logs, minlength=n) - np.bincount(cols, logs, minlength=n)
+
+    def laplacian(x):
+        diff = x[rows] - x[cols]
+        return np.bincount(rows, diff, minlength=n) - np.bincount(cols, diff, minlength=n)
+
+    # Conjugate gradient dengan preconditioner Jacobi (diagonal Laplacian = derajat node)
+    inverse_degree = 1.0 / np.maximum(degree, 1)
+    x = np.zeros(n)
+    r = b.copy()
+    z = r * inverse_degree
+    p = z.copy()
+    rz = r @ z
+    b_norm = np.linalg.norm(b)
+    max_iter = max_iter or 10 * n
+    iterations = 0
+    converged = b_norm == 0
+    while not converged and iterations < max_iter:
+        Lp = laplacian(p)
+        alpha = rz / (p @ Lp)
+        x += alpha * p
+        r -= alpha * Lp
+        iterations += 1
+        if np.linalg.norm(r) <= tol * b_norm:
+            converged = True
+            break
+        z = r * inverse_degree
+        rz_new = r @ z
+        p = z + (rz_new / rz) * p
+        rz = rz_new
+
+    x -= x.mean()                                       # Solusi unik hingga konstanta; pilih rata-rata 0
+    weights = np.exp(x - x.max())
+    weights /= weights.sum()
+    log_residuals = logs - (x[rows] - x[cols])
+    dof = len(logs) - (n - 1)                           # Perbandingan di luar spanning tree
+    gci = float(log_residuals @ log_residuals / dof) if dof > 0 else 0.0
+    return {
+        'weights': weights,
+        'log_residuals': log_residuals,
+        'gci': gci,
+        'gci_threshold': GCI_THRESHOLD.get(n, GCI_THRESHOLD_DEFAULT),
+        'iterations': iterations,
+        'converged': bool(converged),
+        'residual': float(np.linalg.norm(b - laplacian(x))),
+        'solver': 'log_least_squares',
+    }
+
+
+SOLVERS = {
+    'eig': eig_priorities,
+    'power': power_priorities,
+    'geometric_mean': geometric_mean_priorities,
+}
+
+
+def solve_priorities(matrices, solver='eig', **options):
+    """
+    Menghitung bobot prioritas dengan solver yang dipilih.
+
+    Args:
+        matrices (np.ndarray): Matriks perbandingan berbentuk (n, n) atau (k, n, n).
+        solver (str): 'eig', 'power' atau 'geometric_mean'.
+        **options: Opsi tambahan untuk solver (misal tol dan max_iter untuk 'power').
+
+    Returns:
+        dict: Bobot dan diagnostik konvergensi.
+    """
+    if solver not in SOLVERS:
+        raise ValueError(f"Solver '{solver}' tidak dikenal. Pilihan: {', '.join(SOLVERS)}.")
+    matrices = np.asarray(matrices, dtype=float)
+    if matrices.ndim < 2 or matrices.shape[-1] != matrices.shape[-2]:
+        raise ValueError("Matriks harus berbentuk (n, n) atau (k, n, n).")
+    return SOLVERS[solver](matrices, **options)
+
+
+def compare_solvers(matrices, solvers=None, **options):
+    """
+    Membandingkan waktu dan selisih bobot setiap solver terhadap solver eksak ('eig').
+
+    Args:
+        matrices (np.ndarray): Matriks perbandingan berbentuk (n, n) atau (k, n, n).
+        solvers (list, optional): Daftar solver yang dibandingkan. Default semua solver.
+        **options: Opsi untuk solver 'power'.
+
+    Returns:
+        dict: Untuk setiap solver: 'time', 'max_abs_diff', 'iterations', 'converged' dan 'residual'.
+    """
+    solvers = list(solvers or SOLVERS)
+    exact = solve_priorities(matrices, 'eig')['weights']
+    report = {}
+    for solver in solvers:
+        solver_options = options if solver == 'power' else {}
+        start = time.perf_counter()
+        result = solve_priorities(matrices, solver, **solver_options)
+        elapsed = time.perf_counter() - start
+        report[solver] = {
+            'time': elapsed,
+            'max_abs_diff': float(np.abs(result['weights'] - exact).max()),
+            'iterations': int(np.max(result['iterations'])),
+            'converged': bool(np.all(result['converged'])),
+            'residual': float(np.max(result['residual'])),
+        }
+    return report
@@ -0,0 +1,71 @@
+# methods/ranking.py
+
+import numpy as np
+
+
+def rank_indices(scores, top_k=None):
+    """
+    Mengembalikan indeks alternatif terurut dari skor tertinggi.
+
+    Urutannya sama dengan np.argsort(scores, kind='stable')[::-1]: skor yang sama diurutkan
+    dari indeks terbesar, kecuali skor NaN yang selalu ditempatkan paling akhir (juga dari indeks
+    terbesar). Jika top_k diberikan, hanya k indeks teratas yang dihitung dengan seleksi parsial
+    (np.partition) lalu mengurutkan kandidatnya saja; hasilnya selalu awalan dari ranking penuh.
+
+    Args:
+        scores (np.ndarray): Skor setiap alternatif.
+        top_k (int, optional): Jumlah alternatif teratas. Default semua alternatif.
+
+    Returns:
+        np.ndarray: Indeks alternatif terurut.
+    """
+    scores = np.asarray(scores)
+    if scores.dtype.kind == 'f':
+        missing = np.isnan(scores)
+        if missing.any():
+            # NaN dipisahkan agar urutannya tidak bergantung pada jalur (partisi atau sort penuh)
+            valid = np.flatnonzero(~missing)
+            ranked = valid[rank_indices(scores[valid], top_k)]
+            rest = np.flatnonzero(missing)[::-1]
+            if top_k is not None:
+                rest = rest[:max(top_k - len(ranked), 0)]
+            return np.concatenate((ranked, rest))
+    n = len(scores)
+    if top_k is None or top_k >= n:
+        return np.argsort(scores, kind='stable')[::-1]
+    if top_k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    threshold = np.partition(scores, n - top_k)[n - top_k]  # Skor ke-k tertinggi
+    candidates = np.flatnonzero(scores >= threshold)            # Termasuk semua skor yang sama dengan ambang
+    order = np.lexsort((candidates, scores[candidates]))[::-1][:top_k]
+    return candidates[order]
+
+
+def ranked_labels(alternatives, ranked):
+    """
+    Label alternatif untuk indeks terurut hasil rank_indices.
+
+    Jika alternatives berupa np.ndarray (misal indeks baris np.arange(n) pada perhitungan per blok),
+    hasilnya tetap np.ndarray tanpa objek Python per baris; selain itu dikembalikan sebagai list.
+
+    Args:
+        alternatives (list | np.ndarray): Label setiap alternatif.
+        ranked (np.ndarray): Indeks alternatif terurut.
+
+    Returns:
+        list | np.ndarray: Label alternatif terurut.
+    """
+    if isinstance(alternatives, np.ndarray):
+        return alternatives[ranked]
+    return [alternatives[i] for i in ranked]
+
+
+def label_array(labels):
+    """
+    Array label untuk ekspor kolumnar: np.ndarray (misal indeks baris) dipakai apa adanya, list diubah
+    menjadi array object.
+    """
+    if isinstance(labels, np.ndarray):
+        return labels
+    return np.asarray(labels, dtype=object)
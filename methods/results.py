@@ -0,0 +1,61 @@
+# methods/results.py
+
+from collections.abc import Mapping
+
+
+class LazyResults(Mapping):
+    """
+    Hasil perhitungan yang dibangun saat dibaca (lazy).
+
+    Berperilaku seperti dictionary hasil get_results sebelumnya, tetapi setiap nilai baru
+    dihitung saat key-nya pertama kali dibaca lalu disimpan. Tampilan nested dictionary
+    (misal {kriteria: {alternatif: nilai}}) tidak dibuat jika tidak pernah dibaca.
+    """
+
+    def __init__(self, loaders, columnar=None):
+        """
+        Args:
+            loaders (dict): Key hasil -> fungsi tanpa argumen yang menghitung nilainya.
+            columnar (callable, optional): Fungsi yang mengembalikan ekspor kolumnar (lihat to_columnar).
+        """
+        self._loaders = loaders
+        self._cache = {}
+        self._columnar = columnar
+
+    def __getitem__(self, key):
+        if key not in self._cache:
+            self._cache[key] = self._loaders[key]()
+        return self._cache[key]
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+    def __repr__(self):
+        loaded = ', '.join(repr(key) for key in self._cache)
+        return f"LazyResults(keys={list(self._loaders)}, loaded=[{loaded}])"
+
+    def is_loaded(self, key):
+        """
+        Mengecek apakah nilai sebuah key sudah dihitung.
+        """
+        return key in self._cache
+
+    def to_dict(self):
+        """
+        Menghitung semua nilai dan mengembalikannya sebagai dictionary biasa.
+        """
+        return {key: self[key] for key in self}
+
+    def to_columnar(self):
+        """
+        Mengembalikan ekspor kolumnar yang ringkas: array label dan array nilai tanpa nested dictionary.
+
+        Returns:
+            dict: Array label (alternatif, kriteria) dan array nilai (bobot, skor, matriks).
+        """
+        if self._columnar is None:
+            raise ValueError("Ekspor kolumnar tidak tersedia untuk hasil ini.")
+        return self._columnar()
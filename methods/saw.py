@@ -1,8 +1,23 @@
 # methods/saw.py
 
+import copy
+import heapq
+
 import numpy as np
+import pandas as pd
+
+from .blocked import column_bounds, matrix_rows, open_matrix, open_output, read_block, row_blocks
+from .colstats import ReadOnlyMatrix, StatsIndex, share_matrix, write_cell
+from .inputs import DecisionInput
+from .ranking import label_array, rank_indices, ranked_labels
+from .results import LazyResults
+from .sensitivity import weight_sensitivity
+from .trace import Traceable, Tracer
+
+class SAW(DecisionInput, Traceable):
+    matrix_benefit = ReadOnlyMatrix()  # Disimpan read-only; statistik kolom mengikuti identitas array
+    matrix_cost = ReadOnlyMatrix()
 
-class SAW:
     def __init__(self):
         """
         Inisialisasi objek SAW tanpa kriteria dan alternatif awal.
@@ -13,6 +28,7 @@ class SAW:
         self.weight_cost = []
         self.alternatives = []
         self.alternative_scores = {}  # Dictionary untuk menyimpan nilai alternatif per kriteria
+        self.decision_matrix = None   # DataFrame nilai alternatif (baris) per kriteria (kolom)
         self.matrix_benefit = None
         self.matrix_cost = None
         self.normal_benefit = None  # Matriks benefit yang dinormalisasi
@@ -20,149 +36,474 @@ class SAW:
         self.scores = None          # Skor untuk setiap alternatif
         self.ranked_alternatives = None  # Alternatif yang telah diurutkan
         self.ranked_scores = None        # Skor yang telah diurutkan
-        self.steps = []                # Langkah-langkah pengerjaan SAW
-
-    def set_criteria(self, criteria_benefit, criteria_cost):
-        """
-        Mengatur kriteria benefit dan cost.
-
-        Args:
-            criteria_benefit (list): Daftar kriteria benefit.
-            criteria_cost (list): Daftar kriteria cost.
-        """
-        self.criteria_benefit = criteria_benefit
-        self.criteria_cost = criteria_cost
-        self.steps.append("Kriteria Benefit dan Cost telah diatur.")
+        self.tracer = Tracer()         # Langkah-langkah pengerjaan SAW (lihat set_trace dan self.steps)
+        self.incremental_state = None  # Faktor normalisasi, indeks dan urutan ranking untuk update_score
+        self.top_k = None              # Jumlah alternatif teratas pada ranking (None = semua)
+        self.stats_index = StatsIndex()  # Statistik kolom matriks benefit/cost, dikaitkan ke array matriks
 
-    def set_alternatives(self, alternatives):
-        """
-        Mengatur alternatif yang akan dievaluasi.
-
-        Args:
-            alternatives (list): Daftar alternatif.
-        """
-        self.alternatives = alternatives
-        self.steps.append("Alternatif telah diatur.")
-
-    def set_weights(self, weight_benefit, weight_cost):
-        """
-        Mengatur bobot untuk kriteria benefit dan cost.
-
-        Args:
-            weight_benefit (list): Daftar bobot untuk kriteria benefit.
-            weight_cost (list): Daftar bobot untuk kriteria cost.
+    def perform_saw(self, top_k=None):
         """
-        self.weight_benefit = weight_benefit
-        self.weight_cost = weight_cost
-        self.steps.append("Bobot kriteria Benefit dan Cost telah diatur.")
-
-    def set_alternative_scores(self, criteria, scores):
-        """
-        Mengatur nilai alternatif untuk setiap kriteria.
+        Melakukan seluruh proses SAW: membuat matriks, normalisasi, perhitungan skor, dan ranking.
 
         Args:
-            criteria (str): Nama kriteria.
-            scores (dict): Dictionary dengan key sebagai alternatif dan value sebagai nilai.
-        """
-        self.alternative_scores[criteria] = scores
-        self.steps.append(f"Nilai alternatif untuk kriteria '{criteria}' telah diatur.")
-
-    def perform_saw(self):
-        """
-        Melakukan seluruh proses SAW: membuat matriks, normalisasi, perhitungan skor, dan ranking.
+            top_k (int, optional): Hanya mengurutkan k alternatif teratas. Default semua alternatif.
         """
-        self.steps.append("Proses SAW dimulai.")
+        self.tracer.emit('step', 'perform', "Proses SAW dimulai.")
+        self.incremental_state = None
+        self.top_k = top_k
         self.create_matrices()
         self.normalization()
         self.calculate_score()
-        self.rank_alternative()
-        self.steps.append("Proses SAW selesai.")
+        self.rank_alternative(top_k)
+        self.tracer.emit('step', 'perform', "Proses SAW selesai.")
 
     def create_matrices(self):
         """
         Membuat matriks benefit dan cost berdasarkan nilai alternatif yang telah diatur.
         """
-        self.steps.append("Membuat matriks Benefit dan Cost.")
-        length_alternative = len(self.alternatives)
+        self.tracer.emit('step', 'create_matrices', "Membuat matriks Benefit dan Cost.")
+        if self.decision_matrix is not None:
+            frame = self.decision_matrix
+        else:
+            frame = pd.DataFrame(self.alternative_scores)  # Kolom = kriteria, index = alternatif
+        if not frame.index.equals(pd.Index(self.alternatives)):
+            frame = frame.reindex(index=self.alternatives)
 
+        # Nilai yang tidak diisi dianggap 0, sama seperti sebelumnya
         if self.criteria_benefit:
-            self.matrix_benefit = np.zeros((length_alternative, len(self.criteria_benefit)))
-            for i, alternative in enumerate(self.alternatives):
-                for j, criteria in enumerate(self.criteria_benefit):
-                    self.matrix_benefit[i][j] = self.alternative_scores.get(criteria, {}).get(alternative, 0)
+            self.matrix_benefit = frame.reindex(columns=self.criteria_benefit).fillna(0).to_numpy(dtype=float)
 
         if self.criteria_cost:
-            self.matrix_cost = np.zeros((length_alternative, len(self.criteria_cost)))
-            for i, alternative in enumerate(self.alternatives):
-                for j, criteria in enumerate(self.criteria_cost):
-                    self.matrix_cost[i][j] = self.alternative_scores.get(criteria, {}).get(alternative, 0)
+            self.matrix_cost = frame.reindex(columns=self.criteria_cost).fillna(0).to_numpy(dtype=float)
+
+    def column_stats(self, kind):
+        """
+        Statistik kolom matriks benefit atau cost (lihat ColumnStats), dihitung sekali selama matriks tidak berganti.
+
+        Args:
+            kind (str): 'benefit' atau 'cost'.
+
+        Returns:
+            ColumnStats: Statistik kolom.
+        """
+        matrix = self.matrix_benefit if kind == 'benefit' else self.matrix_cost
+        if matrix is None:
+            raise ValueError(f"Matriks {kind} belum dibuat.")
+        return self.stats_index.get(kind, matrix)
 
     def normalization(self):
         """
         Normalisasi matriks kriteria benefit dan cost.
         """
-        self.steps.append("Melakukan normalisasi matriks Benefit dan Cost.")
+        self.tracer.emit('step', 'normalization', "Melakukan normalisasi matriks Benefit dan Cost.")
         self.normal_benefit = None
         self.normal_cost = None
 
         if self.matrix_benefit is not None:
             # Normalisasi Benefit (max normalization)
-            max_benefit = self.matrix_benefit.max(axis=0)
-            max_benefit[max_benefit == 0] = 1  # Hindari pembagian dengan nol
-            self.normal_benefit = self.matrix_benefit / max_benefit
-            self.steps.append("Matriks Benefit telah dinormalisasi.")
+            self.normal_benefit = self.normalize_benefit(self.matrix_benefit, self.column_stats('benefit').max)
+            self.tracer.emit('step', 'normalization', "Matriks Benefit telah dinormalisasi.", target='benefit')
 
         if self.matrix_cost is not None:
             # Normalisasi Cost (min normalization)
-            min_cost = self.matrix_cost.min(axis=0)
-            min_cost[min_cost == 0] = 1  # Hindari pembagian dengan nol
-            self.normal_cost = min_cost / self.matrix_cost
-            self.normal_cost[~np.isfinite(self.normal_cost)] = 1  # Gantikan inf atau NaN dengan 1
-            self.steps.append("Matriks Cost telah dinormalisasi.")
+            self.normal_cost = self.normalize_cost(self.matrix_cost, self.column_stats('cost').min)
+            self.tracer.emit('step', 'normalization', "Matriks Cost telah dinormalisasi.", target='cost')
+
+    @staticmethod
+    def normalize_benefit(matrix, max_benefit):
+        """
+        Normalisasi benefit: x / max kolom.
+
+        Args:
+            matrix (np.ndarray): Matriks benefit (atau sebagian barisnya).
+            max_benefit (np.ndarray): Nilai maksimum setiap kolom benefit.
+
+        Returns:
+            np.ndarray: Matriks benefit yang dinormalisasi.
+        """
+        max_benefit = np.array(max_benefit, dtype=float)
+        max_benefit[max_benefit == 0] = 1  # Hindari pembagian dengan nol
+        return matrix / max_benefit
+
+    @staticmethod
+    def normalize_cost(matrix, min_cost):
+        """
+        Normalisasi cost: min kolom / x.
+
+        Args:
+            matrix (np.ndarray): Matriks cost (atau sebagian barisnya).
+            min_cost (np.ndarray): Nilai minimum setiap kolom cost.
+
+        Returns:
+            np.ndarray: Matriks cost yang dinormalisasi.
+        """
+        min_cost = np.array(min_cost, dtype=float)
+        min_cost[min_cost == 0] = 1  # Hindari pembagian dengan nol
+        with np.errstate(divide='ignore', invalid='ignore'):
+            normal_cost = min_cost / matrix
+        normal_cost[~np.isfinite(normal_cost)] = 1  # Gantikan inf atau NaN dengan 1
+        return normal_cost
 
     def calculate_score(self):
         """
         Menghitung skor total untuk setiap alternatif dengan bobot.
         """
-        self.steps.append("Menghitung skor total untuk setiap alternatif.")
+        self.tracer.emit('step', 'calculate_score', "Menghitung skor total untuk setiap alternatif.")
         if self.normal_benefit is None and self.normal_cost is None:
             raise ValueError("Matriks normalisasi belum dibuat.")
 
         benefit_scores = self.normal_benefit @ self.weight_benefit if self.normal_benefit is not None else 0
         cost_scores = self.normal_cost @ self.weight_cost if self.normal_cost is not None else 0
         self.scores = benefit_scores + cost_scores
-        self.steps.append("Skor total telah dihitung.")
+        self.tracer.emit('step', 'calculate_score', "Skor total telah dihitung.", n_alternatives=len(self.scores))
 
-    def rank_alternative(self):
+    def rank_alternative(self, top_k=None):
         """
         Mengurutkan alternatif berdasarkan skor tertinggi.
+
+        Args:
+            top_k (int, optional): Hanya mengurutkan k alternatif teratas (seleksi parsial). Default semua alternatif.
         """
-        self.steps.append("Mengurutkan alternatif berdasarkan skor.")
+        self.tracer.emit('step', 'ranking', "Mengurutkan alternatif berdasarkan skor.", top_k=top_k)
         if self.scores is None:
             raise ValueError("Skor belum dihitung.")
 
-        ranked_indices = np.argsort(self.scores)[::-1]  # Urutkan skor dari yang tertinggi
-        self.ranked_alternatives = [self.alternatives[i] for i in ranked_indices]
+        # Urutkan skor dari yang tertinggi; skor yang sama diurutkan dari indeks terbesar
+        ranked_indices = rank_indices(self.scores, top_k)
+        self.ranked_alternatives = ranked_labels(self.alternatives, ranked_indices)
         self.ranked_scores = self.scores[ranked_indices]
-        self.steps.append("Alternatif telah diurutkan.")
+        self.tracer.emit('step', 'ranking', "Alternatif telah diurutkan.")
+
+    def perform_saw_stream(self, path, top_k=10, chunksize=100_000, alternative_column=None):
+        """
+        Melakukan SAW secara streaming dari file CSV tanpa memuat seluruh data ke memori.
+
+        Pass pertama membaca file per chunk untuk mencari nilai max (benefit) dan min (cost) setiap kolom.
+        Pass kedua menghitung skor per chunk dan hanya menyimpan top-k alternatif terbaik.
+        Ranking yang dihasilkan sama dengan perform_saw (termasuk urutan skor yang sama).
+
+        Args:
+            path (str): Path file CSV dengan satu kolom label alternatif dan satu kolom per kriteria.
+            top_k (int): Jumlah alternatif terbaik yang disimpan (>= 1).
+            chunksize (int): Jumlah baris per chunk.
+            alternative_column (str, optional): Nama kolom label alternatif. Default kolom pertama.
+        """
+        if top_k < 1:
+            raise ValueError("top_k harus >= 1.")
+        self.tracer.emit('step', 'stream', "Proses SAW streaming dimulai.", chunksize=chunksize, top_k=top_k)
+        if alternative_column is None:
+            alternative_column = pd.read_csv(path, nrows=0).columns[0]
+        usecols = [alternative_column] + list(self.criteria_benefit) + list(self.criteria_cost)
+
+        def read_chunks():
+            return pd.read_csv(path, usecols=usecols, chunksize=chunksize)
+
+        # Pass 1: faktor normalisasi per kolom
+        max_benefit = np.full(len(self.criteria_benefit), -np.inf)
+        min_cost = np.full(len(self.criteria_cost), np.inf)
+        for chunk in read_chunks():
+            if self.criteria_benefit:
+                benefit = chunk[self.criteria_benefit].fillna(0).to_numpy(dtype=float)
+                max_benefit = np.maximum(max_benefit, benefit.max(axis=0))
+            if self.criteria_cost:
+                cost = chunk[self.criteria_cost].fillna(0).to_numpy(dtype=float)
+                min_cost = np.minimum(min_cost, cost.min(axis=0))
+        self.tracer.emit('step', 'stream', "Faktor normalisasi Benefit dan Cost telah dihitung.")
+
+        # Pass 2: skor per chunk, simpan hanya top-k dalam heap (skor, indeks, alternatif)
+        heap = []
+        offset = 0
+        for chunk in read_chunks():
+            scores = np.zeros(len(chunk))
+            if self.criteria_benefit:
+                benefit = chunk[self.criteria_benefit].fillna(0).to_numpy(dtype=float)
+                scores = scores + self.normalize_benefit(benefit, max_benefit) @ self.weight_benefit
+            if self.criteria_cost:
+                cost = chunk[self.criteria_cost].fillna(0).to_numpy(dtype=float)
+                scores = scores + self.normalize_cost(cost, min_cost) @ self.weight_cost
+            labels = chunk[alternative_column].to_numpy()
+
+            # Hanya kandidat yang bisa masuk top-k yang diproses dengan heap
+            candidates = np.arange(len(scores))
+            if len(scores) > top_k:
+                threshold = np.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+                candidates = np.flatnonzero(scores >= threshold)
+            for i in candidates:
+                item = (scores[i], offset + int(i), labels[i])
+                if len(heap) < top_k:
+                    heapq.heappush(heap, item)
+                elif item[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, item)
+            offset += len(chunk)
+
+        best = sorted(heap, key=lambda item: item[:2], reverse=True)
+        self.ranked_alternatives = [label for _, _, label in best]
+        self.ranked_scores = np.array([score for score, _, _ in best])
+        self.tracer.emit('step', 'stream', "Top-{top_k} alternatif dari {rows} baris telah diurutkan.", top_k=top_k, rows=offset)
+        self.tracer.emit('step', 'stream', "Proses SAW streaming selesai.")
+
+    def perform_saw_blocked(self, matrix_benefit=None, matrix_cost=None, out=None, alternatives=None, top_k=None,
+                            chunk_size=100_000):
+        """
+        Melakukan SAW per blok baris untuk matriks yang lebih besar dari RAM (file .npy dibuka sebagai np.memmap).
+
+        Pass pertama menghitung max (benefit) dan min (cost) setiap kolom. Pass kedua menghitung skor per blok
+        dan menulisnya ke out. Memori tambahan sebanding dengan chunk_size x jumlah kriteria; matriks
+        ternormalisasi tidak disimpan. Skor dan ranking sama dengan perform_saw.
+
+        Args:
+            matrix_benefit (str | np.ndarray, optional): Path .npy atau matriks (n, jumlah kriteria benefit).
+            matrix_cost (str | np.ndarray, optional): Path .npy atau matriks (n, jumlah kriteria cost).
+            out (str | np.ndarray, optional): Path .npy (dibuat sebagai memmap) atau array (n,) untuk skor.
+            alternatives (list, optional): Label alternatif. Default self.alternatives, atau indeks baris (np.arange).
+            top_k (int, optional): Hanya mengurutkan k alternatif teratas. Default semua alternatif; ranking penuh
+                berukuran O(n), tetapi tanpa label ranked_alternatives berupa indeks baris np.ndarray.
+            chunk_size (int): Jumlah baris per blok.
+        """
+        self.tracer.emit('step', 'blocked', "Proses SAW per blok dimulai.", chunk_size=chunk_size)
+        self.incremental_state = None
+        self.top_k = top_k
+        matrix_benefit = open_matrix(matrix_benefit) if self.criteria_benefit else None
+        matrix_cost = open_matrix(matrix_cost) if self.criteria_cost else None
+        n = matrix_rows(matrix_benefit, matrix_cost, self.criteria_benefit, self.criteria_cost)
+        if alternatives is not None:
+            self.alternatives = list(alternatives)
+        elif len(self.alternatives) != n:
+            self.alternatives = np.arange(n)  # Tanpa list Python berisi jutaan label
+
+        # Pass 1: faktor normalisasi per kolom
+        max_benefit, _ = column_bounds(matrix_benefit, chunk_size, 'benefit')
+        _, min_cost = column_bounds(matrix_cost, chunk_size, 'cost')
+        self.tracer.emit('step', 'blocked', "Faktor normalisasi Benefit dan Cost telah dihitung.")
+
+        # Pass 2: skor per blok
+        scores = open_output(out, n)
+        for rows in row_blocks(n, chunk_size):
+            block_scores = 0
+            if matrix_benefit is not None:
+                block = read_block(matrix_benefit, rows, 'benefit')
+                block_scores = block_scores + self.normalize_benefit(block, max_benefit) @ self.weight_benefit
+            if matrix_cost is not None:
+                block = read_block(matrix_cost, rows, 'cost')
+                block_scores = block_scores + self.normalize_cost(block, min_cost) @ self.weight_cost
+            scores[rows] = block_scores
+        if isinstance(scores, np.memmap):
+            scores.flush()
+        self.scores = scores
+        self.matrix_benefit = None
+        self.matrix_cost = None
+        self.normal_benefit = None
+        self.normal_cost = None
+
+        self.rank_alternative(top_k)
+        self.tracer.emit('step', 'blocked', "Proses SAW per blok selesai.", rows=n)
+
+    def sensitivity(self, weights):
+        """
+        Analisis sensitivitas bobot: menilai banyak skenario bobot sekaligus dengan matriks ternormalisasi.
+
+        Args:
+            weights (array-like): Skenario bobot berbentuk (s, jumlah kriteria), urutan kriteria benefit lalu cost.
+
+        Returns:
+            dict: Skor, peringkat per skenario dan ringkasan stabilitas peringkat (lihat weight_sensitivity).
+        """
+        if self.normal_benefit is None and self.normal_cost is None:
+            raise ValueError("Matriks normalisasi belum dibuat.")
+        parts = [part for part in (self.normal_benefit, self.normal_cost) if part is not None]
+        self.tracer.emit('step', 'sensitivity', "Analisis sensitivitas bobot dilakukan.")
+        return weight_sensitivity(np.hstack(parts), weights, self.weight_benefit + self.weight_cost, self.alternatives)
+
+    def init_incremental(self):
+        """
+        Menyiapkan state untuk update_score: faktor normalisasi per kolom, indeks alternatif/kriteria
+        dan urutan ranking naik (skor, indeks). Dipanggil otomatis saat update_score pertama.
+        """
+        if self.scores is None:
+            raise ValueError("Skor belum dihitung. Jalankan perform_saw terlebih dahulu.")
+        criteria_index = {crit: ('benefit', j) for j, crit in enumerate(self.criteria_benefit)}
+        criteria_index.update({crit: ('cost', j) for j, crit in enumerate(self.criteria_cost)})
+        self.incremental_state = {
+            'alternatives': {alt: i for i, alt in enumerate(self.alternatives)},
+            'criteria': criteria_index,
+            'max_benefit': self.column_stats('benefit').max.copy() if self.normal_benefit is not None else None,
+            'min_cost': self.column_stats('cost').min.copy() if self.normal_cost is not None else None,
+            'weight_benefit': np.asarray(self.weight_benefit, dtype=float),
+            'weight_cost': np.asarray(self.weight_cost, dtype=float),
+            'labels': np.asarray(self.alternatives, dtype=object),
+            'order': np.argsort(self.scores, kind='stable'),  # Urutan naik; ranking = urutan dibalik
+        }
+
+    def update_score(self, alternative, criteria, value):
+        """
+        Mengubah satu nilai alternatif lalu memperbarui skor dan ranking secara inkremental,
+        tanpa membangun ulang matriks seperti perform_saw.
+
+        Jika faktor normalisasi kolom (max benefit / min cost) tidak berubah, hanya skor alternatif
+        tersebut yang dihitung ulang (O(m)) dan posisinya di ranking dipindahkan (O(n)). Jika faktor
+        berubah, kolom tersebut diskalakan ulang dan skor semua alternatif disesuaikan dengan selisihnya;
+        karena urutan semua alternatif bisa berubah, ranking diurutkan ulang penuh (O(n log n)).
+        Kolom hanya dipindai ulang jika nilai ekstrem saat ini yang diubah.
+
+        Args:
+            alternative (str): Nama alternatif.
+            criteria (str): Nama kriteria.
+            value (float): Nilai baru.
+        """
+        if self.incremental_state is None:
+            self.init_incremental()
+        state = self.incremental_state
+        if alternative not in state['alternatives']:
+            raise ValueError(f"Alternatif '{alternative}' tidak ditemukan.")
+        if criteria not in state['criteria']:
+            raise ValueError(f"Kriteria '{criteria}' tidak ditemukan.")
+        i = state['alternatives'][alternative]
+        kind, j = state['criteria'][criteria]
+        value = float(value)
+
+        if kind == 'benefit':
+            matrix, normal, factors = self.matrix_benefit, self.normal_benefit, state['max_benefit']
+            weight, normalize = state['weight_benefit'][j], self.normalize_benefit
+            old = matrix[i, j]
+            matrix = write_cell(self, 'matrix_benefit', i, j, value)
+            if value > factors[j]:
+                new_factor = value
+            elif old == factors[j] and value < old:
+                new_factor = matrix[:, j].max()  # Nilai maksimum lama diubah: pindai ulang kolom
+            else:
+                new_factor = factors[j]
+        else:
+            matrix, normal, factors = self.matrix_cost, self.normal_cost, state['min_cost']
+            weight, normalize = state['weight_cost'][j], self.normalize_cost
+            old = matrix[i, j]
+            matrix = write_cell(self, 'matrix_cost', i, j, value)
+            if value < factors[j]:
+                new_factor = value
+            elif old == factors[j] and value > old:
+                new_factor = matrix[:, j].min()  # Nilai minimum lama diubah: pindai ulang kolom
+            else:
+                new_factor = factors[j]
+
+        self.stats_index.invalidate()  # Matriks diubah di tempat; statistik kolom dihitung ulang saat dibutuhkan
+
+        # Simpan juga ke data sumber agar perform_saw berikutnya memberi hasil yang sama
+        if self.decision_matrix is not None:
+            self.decision_matrix.at[alternative, criteria] = value
+        else:
+            self.alternative_scores.setdefault(criteria, {})[alternative] = value
+
+        if new_factor != factors[j]:
+            # Faktor normalisasi berubah: skalakan ulang seluruh kolom dan sesuaikan semua skor (O(n))
+            factors[j] = new_factor
+            old_column = normal[:, j].copy()
+            normal[:, j] = normalize(matrix[:, [j]], factors[[j]])[:, 0]
+            self.scores += weight * (normal[:, j] - old_column)
+            state['order'] = np.argsort(self.scores, kind='stable')  # Semua skor bergeser: urutkan ulang O(n log n)
+            self.tracer.emit('step', 'update', "Kolom '{target}' dinormalisasi ulang.", target=criteria, factor=new_factor)
+        else:
+            # Hanya satu sel berubah: hitung ulang skor alternatif dan pindahkan posisinya di ranking
+            normal[i, j] = normalize(matrix[i:i + 1, [j]], factors[[j]])[0, 0]
+            score = 0.0
+            if self.normal_benefit is not None:
+                score = score + self.normal_benefit[i] @ state['weight_benefit']
+            if self.normal_cost is not None:
+                score = score + self.normal_cost[i] @ state['weight_cost']
+            self.scores[i] = score
+            self._reposition(i)
+
+        ranked_indices = state['order'][::-1]
+        if self.top_k is not None:
+            ranked_indices = ranked_indices[:self.top_k]
+        self.ranked_alternatives = state['labels'][ranked_indices].tolist()
+        self.ranked_scores = self.scores[ranked_indices]
+        self.tracer.emit('step', 'update', "Nilai '{alternative}' pada kriteria '{target}' diperbarui.",
+                         target=criteria, alternative=alternative, value=value)
+
+    def _reposition(self, i):
+        """
+        Memindahkan alternatif i ke posisi yang benar pada urutan naik (skor, indeks) dengan pencarian biner.
+
+        Args:
+            i (int): Indeks alternatif yang skornya berubah.
+        """
+        state = self.incremental_state
+        order = state['order']
+        order = np.delete(order, np.flatnonzero(order == i)[0])
+        sorted_scores = self.scores[order]
+        lo = np.searchsorted(sorted_scores, self.scores[i], side='left')
+        hi = np.searchsorted(sorted_scores, self.scores[i], side='right')
+        position = lo + np.searchsorted(order[lo:hi], i)  # Skor sama diurutkan berdasarkan indeks
+        state['order'] = np.insert(order, position, i)
 
     def get_results(self):
         """
         Mengembalikan hasil perhitungan SAW dalam format dictionary.
+        Setiap nilai baru dibangun saat dibaca, sehingga matriks nested yang tidak dipakai tidak pernah disalin.
+        Nilai dibangun dari snapshot saat get_results dipanggil; update_score atau perform_saw berikutnya
+        tidak mengubah hasil yang sudah diambil.
 
         Returns:
-            dict: Dictionary berisi hasil perhitungan SAW.
-        """
-        results = {
-            'steps': self.steps,
-            'criteria_matrix': self.combine_matrices(),
-            'criteria_weights': self.weight_benefit + self.weight_cost,
-            'normalization_factors': self.get_normalization_factors(),
-            'normalized_matrix': self.get_normalized_matrix(),
-            'final_ranking': dict(zip(self.ranked_alternatives, self.ranked_scores))
-        }
+            LazyResults: Mapping berisi hasil perhitungan SAW; gunakan to_columnar() untuk ekspor array.
+        """
+        snapshot = self._snapshot()
+        steps = self.steps
+        results = LazyResults({
+            'steps': lambda: steps,
+            'criteria_matrix': snapshot.combine_matrices,
+            'criteria_weights': lambda: snapshot.weight_benefit + snapshot.weight_cost,
+            'normalization_factors': snapshot.get_normalization_factors,
+            'normalized_matrix': snapshot.get_normalized_matrix,
+            'final_ranking': lambda: dict(zip(snapshot.ranked_alternatives, snapshot.ranked_scores))
+        }, columnar=snapshot.get_columnar_results)
         return results
 
+    def _snapshot(self):
+        """
+        Salinan dangkal objek untuk get_results. Matriks keputusan dibagi dengan copy-on-write (lihat
+        share_matrix); array yang diubah di tempat oleh update_score (matriks normalisasi, skor) disalin.
+        """
+        snapshot = copy.copy(self)
+        for name in ('matrix_benefit', 'matrix_cost'):
+            share_matrix(self, name)
+        for name in ('normal_benefit', 'normal_cost', 'scores', 'ranked_scores'):
+            value = getattr(self, name)
+            setattr(snapshot, name, None if value is None else value.copy())
+        if isinstance(self.alternatives, np.ndarray):
+            snapshot.alternatives = self.alternatives.copy()  # Indeks baris (perform_saw_blocked): tetap array
+        else:
+            snapshot.alternatives = list(self.alternatives)
+        return snapshot
+
+    def get_columnar_results(self):
+        """
+        Mengembalikan hasil SAW dalam bentuk kolumnar: array label dan array nilai (kolom benefit lalu cost).
+
+        Returns:
+            dict: 'alternatives', 'criteria', 'criteria_types', 'criteria_weights', 'matrix',
+                'normalization_factors', 'normalized_matrix', 'scores', 'ranked_alternatives' dan 'ranked_scores'.
+        """
+        def stack(benefit, cost):
+            parts = [part for part in (benefit, cost) if part is not None]
+            return np.hstack(parts) if parts else np.empty((len(self.alternatives), 0))
+
+        factors = []
+        if self.matrix_benefit is not None:
+            factors.append(self.column_stats('benefit').max)
+        if self.matrix_cost is not None:
+            factors.append(self.column_stats('cost').min)
+        return {
+            'alternatives': label_array(self.alternatives),
+            'criteria': np.asarray(self.criteria_benefit + self.criteria_cost, dtype=object),
+            'criteria_types': np.array(['benefit'] * len(self.criteria_benefit) + ['cost'] * len(self.criteria_cost)),
+            'criteria_weights': np.asarray(self.weight_benefit + self.weight_cost, dtype=float),
+            'matrix': stack(self.matrix_benefit, self.matrix_cost),
+            'normalization_factors': np.concatenate(factors) if factors else np.empty(0),
+            'normalized_matrix': stack(self.normal_benefit, self.normal_cost),
+            'scores': self.scores,
+            'ranked_alternatives': label_array(self.ranked_alternatives),
+            'ranked_scores': self.ranked_scores,
+        }
+
     def combine_matrices(self):
         """
         Menggabungkan matriks benefit dan cost menjadi satu matriks kriteria.
@@ -187,10 +528,10 @@ class SAW:
             dict: Dictionary dengan key sebagai kriteria dan value sebagai faktor normalisasi.
         """
         factors = {}
-        for idx, criteria in enumerate(self.criteria_benefit):
-            factors[criteria] = self.matrix_benefit[:, idx].max()
-        for idx, criteria in enumerate(self.criteria_cost):
-            factors[criteria] = self.matrix_cost[:, idx].min()
+        if self.criteria_benefit:
+            factors.update(zip(self.criteria_benefit, self.column_stats('benefit').max))
+        if self.criteria_cost:
+            factors.update(zip(self.criteria_cost, self.column_stats('cost').min))
         return factors
 
     def get_normalized_matrix(self):
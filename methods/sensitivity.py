@@ -0,0 +1,111 @@
+# methods/sensitivity.py
+
+import numpy as np
+
+
+def weight_grid(base_weights, deltas):
+    """
+    Membuat skenario bobot one-at-a-time: setiap bobot kriteria j diubah menjadi w_j * (1 + delta)
+    lalu bobot lain diskalakan proporsional agar total bobot tetap 1.
+
+    Args:
+        base_weights (array-like): Bobot dasar (m,).
+        deltas (array-like): Perubahan relatif, misal np.linspace(-0.5, 0.5, 21).
+
+    Returns:
+        np.ndarray: Matriks bobot berbentuk (m * len(deltas), m).
+    """
+    base = np.asarray(base_weights, dtype=float)
+    base = base / base.sum()
+    deltas = np.asarray(deltas, dtype=float)
+    m = len(base)
+
+    changed = np.clip(base[:, None] * (1 + deltas[None, :]), 0, 1)      # (m, d): bobot baru kriteria j
+    rest = 1 - base                                                      # Total bobot kriteria lain
+    scale = np.divide(1 - changed, rest[:, None], out=np.zeros_like(changed), where=rest[:, None] > 0)
+    weights = base[None, None, :] * scale[:, :, None]                    # (m, d, m): bobot lain diskalakan
+    idx = np.arange(m)
+    weights[idx, :, idx] = changed
+    return weights.reshape(-1, m)
+
+
+def random_weights(n_scenarios, n_criteria, seed=None, concentration=1.0):
+    """
+    Membuat skenario bobot acak dari distribusi Dirichlet (total setiap baris 1).
+
+    Args:
+        n_scenarios (int): Jumlah skenario.
+        n_criteria (int): Jumlah kriteria.
+        seed (int, optional): Seed generator acak.
+        concentration (float | array-like): Parameter Dirichlet; 1.0 = seragam di simplex.
+
+    Returns:
+        np.ndarray: Matriks bobot berbentuk (n_scenarios, n_criteria).
+    """
+    rng = np.random.default_rng(seed)
+    alpha = np.broadcast_to(np.asarray(concentration, dtype=float), (n_criteria,))
+    return rng.dirichlet(alpha, size=n_scenarios)
+
+
+def scenario_ranks(scores):
+    """
+    Menghitung peringkat (1 = terbaik) setiap alternatif pada setiap skenario.
+    Skor yang sama diurutkan seperti rank_indices (indeks terbesar lebih dulu).
+
+    Args:
+        scores (np.ndarray): Skor berbentuk (s, n).
+
+    Returns:
+        np.ndarray: Peringkat berbentuk (s, n).
+    """
+    s, n = scores.shape
+    order = np.argsort(scores, axis=1, kind='stable')[:, ::-1]
+    ranks = np.empty((s, n), dtype=np.int64)
+    np.put_along_axis(ranks, order, np.broadcast_to(np.arange(1, n + 1), (s, n)), axis=1)
+    return ranks
+
+
+def weight_sensitivity(matrix, weights, baseline_weights=None, alternatives=None):
+    """
+    Menilai semua skenario bobot sekaligus dengan satu perkalian matriks (weights @ matrix.T)
+    lalu merangkum stabilitas peringkat setiap alternatif.
+
+    Args:
+        matrix (np.ndarray): Matriks ternormalisasi (SAW/MAUT) atau matriks log (WP), berbentuk (n, m).
+        weights (array-like): Skenario bobot berbentuk (s, m).
+        baseline_weights (array-like, optional): Bobot dasar untuk peringkat acuan.
+        alternatives (list, optional): Nama alternatif.
+
+    Returns:
+        dict: 'scores' (s, n), 'ranks' (s, n), 'baseline_ranks' (n,) dan 'summary'
+            (per alternatif: mean_rank, std_rank, best_rank, worst_rank, first_share, stable_share).
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    weights = np.atleast_2d(np.asarray(weights, dtype=float))
+    if weights.shape[1] != matrix.shape[1]:
+        raise ValueError(f"Jumlah bobot per skenario ({weights.shape[1]}) tidak sama dengan jumlah kriteria ({matrix.shape[1]}).")
+
+    scores = weights @ matrix.T                                   # (s, n) dalam satu perkalian matriks
+    ranks = scenario_ranks(scores)
+
+    if baseline_weights is not None:
+        baseline_scores = np.asarray(baseline_weights, dtype=float)[None, :] @ matrix.T
+        baseline_ranks = scenario_ranks(baseline_scores)[0]
+    else:
+        baseline_ranks = np.rint(np.median(ranks, axis=0)).astype(np.int64)
+
+    summary = {
+        'alternatives': list(alternatives) if alternatives is not None else list(range(matrix.shape[0])),
+        'mean_rank': ranks.mean(axis=0),
+        'std_rank': ranks.std(axis=0),
+        'best_rank': ranks.min(axis=0),
+        'worst_rank': ranks.max(axis=0),
+        'first_share': (ranks == 1).mean(axis=0),                      # Proporsi skenario menjadi peringkat 1
+        'stable_share': (ranks == baseline_ranks[None, :]).mean(axis=0),  # Proporsi skenario dengan peringkat acuan
+    }
+    return {
+        'scores': scores,
+        'ranks': ranks,
+        'baseline_ranks': baseline_ranks,
+        'summary': summary,
+    }
@@ -0,0 +1,199 @@
+# methods/smaa.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .saw import SAW
+from .sensitivity import scenario_ranks
+
+# Data model yang dipakai bersama oleh semua chunk di satu proses (diisi oleh _init_context)
+_CONTEXT = None
+
+
+def _init_context(context):
+    """
+    Menyimpan data model di proses worker agar tidak dikirim ulang untuk setiap chunk.
+    """
+    global _CONTEXT
+    _CONTEXT = context
+
+
+def _sample_chunk(seed_sequence, size):
+    """
+    Membuat dan menilai satu chunk sampel: bobot dari distribusi Dirichlet dan (opsional) nilai
+    alternatif yang dikalikan noise log-normal. Hanya ringkasan chunk yang dikembalikan.
+
+    Args:
+        seed_sequence (np.random.SeedSequence): Seed khusus chunk ini.
+        size (int): Jumlah sampel di chunk ini.
+
+    Returns:
+        tuple: (jumlah per alternatif x peringkat (n, n), jumlah bobot saat peringkat 1 (n, m)).
+    """
+    context = _CONTEXT
+    rng = np.random.default_rng(seed_sequence)
+    benefit, cost = context['benefit'], context['cost']
+    n, m = context['n'], context['m']
+
+    # Sampel bobot: seragam di simplex atau Dirichlet di sekitar bobot dasar
+    if context['weight_concentration'] is None:
+        weights = rng.dirichlet(np.ones(m), size=size)
+    else:
+        weights = rng.dirichlet(context['weight_concentration'] * context['base_weights'], size=size)
+
+    noise = context['value_noise']
+    if noise == 0:
+        scores = weights @ context['normalized'].T                          # (size, n)
+    else:
+        parts = []
+        if benefit is not None:
+            values = benefit[None] * np.exp(noise * rng.standard_normal((size,) + benefit.shape))
+            if context['kind'] == 'saw':
+                parts.append(SAW.normalize_benefit(values, values.max(axis=1, keepdims=True)))
+            else:
+                parts.append(values / values.sum(axis=1, keepdims=True))    # Prioritas AHP per kriteria berjumlah 1
+        if cost is not None:
+            values = cost[None] * np.exp(noise * rng.standard_normal((size,) + cost.shape))
+            parts.append(SAW.normalize_cost(values, values.min(axis=1, keepdims=True)))
+        normalized = np.concatenate(parts, axis=2) if len(parts) > 1 else parts[0]
+        scores = np.einsum('snm,sm->sn', normalized, weights)
+
+    ranks = scenario_ranks(scores)                                          # (size, n), 1 = terbaik
+    alternative_index = np.broadcast_to(np.arange(n), (size, n))
+    counts = np.bincount((alternative_index * n + ranks - 1).ravel(), minlength=n * n).reshape(n, n)
+    first_weight_sums = (ranks == 1).T.astype(float) @ weights              # (n, m)
+    return counts, first_weight_sums
+
+
+def run_smaa(context, n_samples=100_000, chunk_size=10_000, seed=0, n_workers=1):
+    """
+    Menjalankan Monte Carlo SMAA per chunk, secara paralel di process pool jika n_workers > 1.
+
+    Setiap chunk memakai SeedSequence turunan dari seed, sehingga hasilnya sama untuk seed yang sama
+    berapa pun jumlah worker. Memori dibatasi oleh chunk_size, bukan oleh n_samples.
+
+    Args:
+        context (dict): Data model (lihat smaa_saw dan smaa_ahp).
+        n_samples (int): Jumlah sampel total.
+        chunk_size (int): Jumlah sampel per chunk.
+        seed (int): Seed generator acak.
+        n_workers (int, optional): Jumlah proses; None = jumlah CPU, 1 = tanpa process pool.
+
+    Returns:
+        dict: 'alternatives', 'rank_acceptability' (n x n, baris alternatif, kolom peringkat),
+            'central_weights' (n x m, NaN jika tidak pernah peringkat 1) dan 'n_samples'.
+    """
+    sizes = [min(chunk_size, n_samples - start) for start in range(0, n_samples, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    n, m = context['n'], context['m']
+    counts = np.zeros((n, n), dtype=np.int64)
+    first_weight_sums = np.zeros((n, m))
+
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers == 1:
+        _init_context(context)
+        chunks = map(_sample_chunk, seeds, sizes)
+        for chunk_counts, chunk_sums in chunks:
+            counts += chunk_counts
+            first_weight_sums += chunk_sums
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_context, initargs=(context,)) as executor:
+            # Hasil digabung sesuai urutan chunk agar penjumlahan float selalu sama
+            for chunk_counts, chunk_sums in executor.map(_sample_chunk, seeds, sizes):
+                counts += chunk_counts
+                first_weight_sums += chunk_sums
+
+    first_counts = counts[:, 0]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        central_weights = first_weight_sums / first_counts[:, None]
+    return {
+        'alternatives': context['alternatives'],
+        'criteria': context['criteria'],
+        'rank_acceptability': counts / n_samples,
+        'central_weights': central_weights,
+        'n_samples': n_samples,
+    }
+
+
+def smaa_saw(saw, n_samples=100_000, chunk_size=10_000, weight_concentration=None, value_noise=0.0, seed=0, n_workers=1):
+    """
+    Analisis SMAA untuk model SAW: peluang setiap alternatif menempati setiap peringkat
+    jika bobot dan nilai alternatif tidak pasti.
+
+    Args:
+        saw (SAW): Objek SAW yang matriksnya sudah dibuat (create_matrices atau perform_saw).
+        n_samples (int): Jumlah sampel Monte Carlo.
+        chunk_size (int): Jumlah sampel per chunk.
+        weight_concentration (float, optional): None = bobot seragam di simplex (tanpa informasi preferensi);
+            angka = Dirichlet(weight_concentration * bobot SAW), makin besar makin dekat ke bobot SAW.
+        value_noise (float): Standar deviasi noise log-normal pada nilai alternatif (0 = nilai pasti).
+        seed (int): Seed generator acak.
+        n_workers (int, optional): Jumlah proses; None = jumlah CPU.
+
+    Returns:
+        dict: Lihat run_smaa.
+    """
+    if saw.matrix_benefit is None and saw.matrix_cost is None:
+        saw.create_matrices()
+    benefit = saw.matrix_benefit if saw.criteria_benefit else None
+    cost = saw.matrix_cost if saw.criteria_cost else None
+    normalized = []
+    if benefit is not None:
+        normalized.append(SAW.normalize_benefit(benefit, benefit.max(axis=0)))
+    if cost is not None:
+        normalized.append(SAW.normalize_cost(cost, cost.min(axis=0)))
+    base_weights = np.asarray(saw.weight_benefit + saw.weight_cost, dtype=float)
+    context = {
+        'kind': 'saw',
+        'alternatives': list(saw.alternatives),
+        'criteria': saw.criteria_benefit + saw.criteria_cost,
+        'n': len(saw.alternatives),
+        'm': len(base_weights),
+        'benefit': benefit,
+        'cost': cost,
+        'normalized': np.hstack(normalized),
+        'base_weights': base_weights / base_weights.sum(),
+        'weight_concentration': weight_concentration,
+        'value_noise': float(value_noise),
+    }
+    return run_smaa(context, n_samples, chunk_size, seed, n_workers)
+
+
+def smaa_ahp(ahp, n_samples=100_000, chunk_size=10_000, weight_concentration=None, value_noise=0.0, seed=0, n_workers=1):
+    """
+    Analisis SMAA untuk model AHP: bobot kriteria dan prioritas alternatif per kriteria diberi ketidakpastian,
+    skor = prioritas alternatif @ bobot kriteria seperti pada perform_ahp.
+
+    Args:
+        ahp (AHP): Objek AHP yang sudah menjalankan perform_ahp.
+        n_samples (int): Jumlah sampel Monte Carlo.
+        chunk_size (int): Jumlah sampel per chunk.
+        weight_concentration (float, optional): None = bobot seragam di simplex;
+            angka = Dirichlet(weight_concentration * bobot kriteria AHP).
+        value_noise (float): Standar deviasi noise log-normal pada prioritas alternatif (0 = pasti).
+        seed (int): Seed generator acak.
+        n_workers (int, optional): Jumlah proses; None = jumlah CPU.
+
+    Returns:
+        dict: Lihat run_smaa.
+    """
+    if ahp.criteria_weights is None:
+        raise ValueError("Bobot AHP belum dihitung. Jalankan perform_ahp terlebih dahulu.")
+    priorities = np.column_stack([ahp.alternative_weights[crit] for crit in ahp.criteria])  # (n, m)
+    base_weights = np.asarray(ahp.criteria_weights, dtype=float)
+    context = {
+        'kind': 'ahp',
+        'alternatives': list(ahp.alternatives),
+        'criteria': list(ahp.criteria),
+        'n': len(ahp.alternatives),
+        'm': len(ahp.criteria),
+        'benefit': priorities,
+        'cost': None,
+        'normalized': priorities,
+        'base_weights': base_weights / base_weights.sum(),
+        'weight_concentration': weight_concentration,
+        'value_noise': float(value_noise),
+    }
+    return run_smaa(context, n_samples, chunk_size, seed, n_workers)
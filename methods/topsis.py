@@ -0,0 +1,273 @@
+# methods/topsis.py
+
+import copy
+
+import numpy as np
+import pandas as pd
+
+from .inputs import DecisionInput
+from .ranking import label_array, rank_indices, ranked_labels
+from .results import LazyResults
+from .trace import Traceable, Tracer
+
+class TOPSIS(DecisionInput, Traceable):
+    def __init__(self):
+        """
+        Inisialisasi objek TOPSIS tanpa kriteria dan alternatif awal.
+        """
+        self.criteria_benefit = []
+        self.criteria_cost = []
+        self.weight_benefit = []
+        self.weight_cost = []
+        self.alternatives = []
+        self.alternative_scores = {}  # Dictionary untuk menyimpan nilai alternatif per kriteria
+        self.decision_matrix = None   # DataFrame nilai alternatif (baris) per kriteria (kolom)
+        self.matrix = None            # Matriks nilai (kolom benefit lalu cost)
+        self.norms = None             # Panjang vektor setiap kolom (faktor normalisasi)
+        self.weighted_matrix = None   # Matriks ternormalisasi yang sudah dikalikan bobot
+        self.ideal = None             # Solusi ideal positif
+        self.anti_ideal = None        # Solusi ideal negatif
+        self.distance_ideal = None    # Jarak setiap alternatif ke solusi ideal positif
+        self.distance_anti_ideal = None  # Jarak setiap alternatif ke solusi ideal negatif
+        self.scores = None            # Nilai kedekatan relatif (closeness) setiap alternatif
+        self.ranked_alternatives = None  # Alternatif yang telah diurutkan
+        self.ranked_scores = None        # Skor yang telah diurutkan
+        self.tracer = Tracer()        # Langkah-langkah pengerjaan TOPSIS (lihat set_trace dan self.steps)
+
+    def perform_topsis(self, top_k=None):
+        """
+        Melakukan seluruh proses TOPSIS: membuat matriks, normalisasi vektor, solusi ideal,
+        jarak, nilai kedekatan relatif dan ranking.
+
+        Args:
+            top_k (int, optional): Hanya mengurutkan k alternatif teratas. Default semua alternatif.
+        """
+        self.tracer.emit('step', 'perform', "Proses TOPSIS dimulai.")
+        self.create_matrix()
+        self.normalization()
+        self.ideal_solutions()
+        self.calculate_score()
+        self.rank_alternative(top_k)
+        self.tracer.emit('step', 'perform', "Proses TOPSIS selesai.")
+
+    def create_matrix(self):
+        """
+        Membuat matriks nilai (kolom benefit lalu cost) berdasarkan nilai alternatif yang telah diatur.
+        """
+        self.tracer.emit('step', 'create_matrices', "Membuat matriks keputusan.")
+        if self.decision_matrix is not None:
+            frame = self.decision_matrix
+        else:
+            frame = pd.DataFrame(self.alternative_scores)  # Kolom = kriteria, index = alternatif
+        if not frame.index.equals(pd.Index(self.alternatives)):
+            frame = frame.reindex(index=self.alternatives)
+
+        # Nilai yang tidak diisi dianggap 0, sama seperti pada SAW
+        criteria = list(self.criteria_benefit) + list(self.criteria_cost)
+        self.matrix = frame.reindex(columns=criteria).fillna(0).to_numpy(dtype=float)
+
+    def _weights(self):
+        """
+        Bobot semua kriteria (benefit lalu cost) sebagai array.
+        """
+        return np.asarray(list(self.weight_benefit) + list(self.weight_cost), dtype=float)
+
+    @staticmethod
+    def normalize(matrix, norms, weights):
+        """
+        Normalisasi vektor lalu dikalikan bobot: w * x / ||x_kolom||.
+
+        Args:
+            matrix (np.ndarray): Matriks nilai (atau sebagian barisnya).
+            norms (np.ndarray): Panjang vektor setiap kolom.
+            weights (np.ndarray): Bobot setiap kolom.
+
+        Returns:
+            np.ndarray: Matriks ternormalisasi terbobot.
+        """
+        norms = np.array(norms, dtype=float)
+        norms[norms == 0] = 1  # Hindari pembagian dengan nol
+        return matrix / norms * weights
+
+    def normalization(self):
+        """
+        Normalisasi vektor matriks nilai dan perkalian dengan bobot.
+        """
+        self.tracer.emit('step', 'normalization', "Melakukan normalisasi vektor dan pembobotan.")
+        if self.matrix is None:
+            raise ValueError("Matriks keputusan belum dibuat.")
+        self.norms = np.sqrt((self.matrix ** 2).sum(axis=0))
+        self.weighted_matrix = self.normalize(self.matrix, self.norms, self._weights())
+
+    def _ideal_from_bounds(self, column_max, column_min, norms):
+        """
+        Solusi ideal positif dan negatif dari nilai maksimum/minimum kolom matriks asli. Karena normalisasi
+        terbobot monoton naik (bobot >= 0), hasilnya sama dengan max/min kolom matriks terbobot.
+        """
+        weights = self._weights()
+        weighted_max = self.normalize(column_max, norms, weights)
+        weighted_min = self.normalize(column_min, norms, weights)
+        n_benefit = len(self.criteria_benefit)
+        ideal = np.concatenate([weighted_max[:n_benefit], weighted_min[n_benefit:]])
+        anti_ideal = np.concatenate([weighted_min[:n_benefit], weighted_max[n_benefit:]])
+        return ideal, anti_ideal
+
+    def ideal_solutions(self):
+        """
+        Menentukan solusi ideal positif (benefit maksimum, cost minimum) dan negatif (sebaliknya).
+        """
+        self.tracer.emit('step', 'ideal', "Menentukan solusi ideal positif dan negatif.")
+        if self.weighted_matrix is None:
+            raise ValueError("Matriks normalisasi belum dibuat.")
+        weighted_max = self.weighted_matrix.max(axis=0)
+        weighted_min = self.weighted_matrix.min(axis=0)
+        n_benefit = len(self.criteria_benefit)
+        self.ideal = np.concatenate([weighted_max[:n_benefit], weighted_min[n_benefit:]])
+        self.anti_ideal = np.concatenate([weighted_min[:n_benefit], weighted_max[n_benefit:]])
+
+    @staticmethod
+    def closeness(weighted_matrix, ideal, anti_ideal):
+        """
+        Menghitung jarak Euclidean ke solusi ideal positif/negatif dan nilai kedekatan relatif.
+
+        Args:
+            weighted_matrix (np.ndarray): Matriks ternormalisasi terbobot (atau sebagian barisnya).
+            ideal (np.ndarray): Solusi ideal positif.
+            anti_ideal (np.ndarray): Solusi ideal negatif.
+
+        Returns:
+            tuple: (jarak ke ideal, jarak ke anti-ideal, closeness), masing-masing berbentuk (n,).
+        """
+        distance_ideal = np.sqrt(((weighted_matrix - ideal) ** 2).sum(axis=1))
+        distance_anti_ideal = np.sqrt(((weighted_matrix - anti_ideal) ** 2).sum(axis=1))
+        total = distance_ideal + distance_anti_ideal
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = distance_anti_ideal / total
+        scores[total == 0] = 0  # Semua alternatif identik pada kolom terbobot
+        return distance_ideal, distance_anti_ideal, scores
+
+    def calculate_score(self):
+        """
+        Menghitung jarak ke solusi ideal dan nilai kedekatan relatif setiap alternatif.
+        """
+        self.tracer.emit('step', 'calculate_score', "Menghitung jarak ke solusi ideal dan nilai kedekatan relatif.")
+        if self.ideal is None:
+            raise ValueError("Solusi ideal belum ditentukan.")
+        self.distance_ideal, self.distance_anti_ideal, self.scores = self.closeness(
+            self.weighted_matrix, self.ideal, self.anti_ideal)
+        self.tracer.emit('step', 'calculate_score', "Nilai kedekatan relatif telah dihitung.", n_alternatives=len(self.scores))
+
+    def rank_alternative(self, top_k=None):
+        """
+        Mengurutkan alternatif berdasarkan nilai kedekatan relatif tertinggi.
+
+        Args:
+            top_k (int, optional): Hanya mengurutkan k alternatif teratas (seleksi parsial). Default semua alternatif.
+        """
+        self.tracer.emit('step', 'ranking', "Mengurutkan alternatif berdasarkan skor.", top_k=top_k)
+        if self.scores is None:
+            raise ValueError("Skor belum dihitung.")
+
+        # Urutkan skor dari yang tertinggi; skor yang sama diurutkan dari indeks terbesar
+        ranked_indices = rank_indices(self.scores, top_k)
+        self.ranked_alternatives = ranked_labels(self.alternatives, ranked_indices)
+        self.ranked_scores = self.scores[ranked_indices]
+        self.tracer.emit('step', 'ranking', "Alternatif telah diurutkan.")
+
+    def perform_topsis_chunked(self, matrix, alternatives=None, top_k=None, chunk_size=100_000):
+        """
+        Melakukan TOPSIS per blok baris, untuk jutaan alternatif (misal matriks np.memmap).
+
+        Pass pertama menghitung jumlah kuadrat, maksimum dan minimum setiap kolom. Pass kedua menghitung
+        jarak dan closeness per blok. Memori tambahan sebanding dengan chunk_size x jumlah kriteria;
+        hanya skor (n,) yang disimpan untuk seluruh alternatif. Matriks terbobot dan jarak tidak disimpan.
+
+        Args:
+            matrix (np.ndarray): Matriks nilai (n, m) dengan kolom kriteria benefit lalu cost.
+            alternatives (list, optional): Label alternatif. Default self.alternatives, atau indeks baris (np.arange).
+            top_k (int, optional): Hanya mengurutkan k alternatif teratas. Default semua alternatif; ranking penuh
+                berukuran O(n), tetapi tanpa label ranked_alternatives berupa indeks baris np.ndarray.
+            chunk_size (int): Jumlah baris per blok.
+        """
+        self.tracer.emit('step', 'chunked', "Proses TOPSIS per blok dimulai.", chunk_size=chunk_size)
+        n, m = matrix.shape
+        if m != len(self.criteria_benefit) + len(self.criteria_cost):
+            raise ValueError("Jumlah kolom matriks harus sama dengan jumlah kriteria benefit dan cost.")
+        if alternatives is not None:
+            self.alternatives = list(alternatives)
+        elif len(self.alternatives) != n:
+            self.alternatives = np.arange(n)  # Tanpa list Python berisi jutaan label
+
+        # Pass 1: statistik kolom
+        sum_squares = np.zeros(m)
+        column_max = np.full(m, -np.inf)
+        column_min = np.full(m, np.inf)
+        for start in range(0, n, chunk_size):
+            block = np.asarray(matrix[start:start + chunk_size], dtype=float)
+            sum_squares += (block ** 2).sum(axis=0)
+            column_max = np.maximum(column_max, block.max(axis=0))
+            column_min = np.minimum(column_min, block.min(axis=0))
+        self.norms = np.sqrt(sum_squares)
+        self.ideal, self.anti_ideal = self._ideal_from_bounds(column_max, column_min, self.norms)
+        self.tracer.emit('step', 'chunked', "Faktor normalisasi dan solusi ideal telah dihitung.")
+
+        # Pass 2: closeness per blok
+        weights = self._weights()
+        self.scores = np.empty(n)
+        for start in range(0, n, chunk_size):
+            block = np.asarray(matrix[start:start + chunk_size], dtype=float)
+            weighted = self.normalize(block, self.norms, weights)
+            self.scores[start:start + len(block)] = self.closeness(weighted, self.ideal, self.anti_ideal)[2]
+        self.matrix = None
+        self.weighted_matrix = None
+        self.distance_ideal = None
+        self.distance_anti_ideal = None
+
+        self.rank_alternative(top_k)
+        self.tracer.emit('step', 'chunked', "Proses TOPSIS per blok selesai.", rows=n)
+
+    def get_results(self):
+        """
+        Mengembalikan hasil perhitungan TOPSIS dalam format dictionary.
+        Setiap nilai baru dibangun saat dibaca, dari hasil saat get_results dipanggil (perform_topsis
+        berikutnya mengganti array hasil dengan array baru, bukan mengubahnya di tempat).
+
+        Returns:
+            LazyResults: Mapping berisi hasil perhitungan TOPSIS; gunakan to_columnar() untuk ekspor array.
+        """
+        snapshot = copy.copy(self)
+        steps = self.steps
+        criteria = list(self.criteria_benefit) + list(self.criteria_cost)
+        results = LazyResults({
+            'steps': lambda: steps,
+            'criteria_weights': lambda: snapshot.weight_benefit + snapshot.weight_cost,
+            'normalization_factors': lambda: dict(zip(criteria, snapshot.norms.tolist())),
+            'ideal_solution': lambda: dict(zip(criteria, snapshot.ideal.tolist())),
+            'anti_ideal_solution': lambda: dict(zip(criteria, snapshot.anti_ideal.tolist())),
+            'final_ranking': lambda: dict(zip(snapshot.ranked_alternatives, snapshot.ranked_scores))
+        }, columnar=snapshot.get_columnar_results)
+        return results
+
+    def get_columnar_results(self):
+        """
+        Mengembalikan hasil TOPSIS dalam bentuk kolumnar: array label dan array nilai (kolom benefit lalu cost).
+
+        Returns:
+            dict: 'alternatives', 'criteria', 'criteria_types', 'criteria_weights', 'normalization_factors',
+                'ideal', 'anti_ideal', 'distance_ideal', 'distance_anti_ideal', 'scores',
+                'ranked_alternatives' dan 'ranked_scores'.
+        """
+        return {
+            'alternatives': label_array(self.alternatives),
+            'criteria': np.asarray(list(self.criteria_benefit) + list(self.criteria_cost), dtype=object),
+            'criteria_types': np.array(['benefit'] * len(self.criteria_benefit) + ['cost'] * len(self.criteria_cost)),
+            'criteria_weights': self._weights(),
+            'normalization_factors': self.norms,
+            'ideal': self.ideal,
+            'anti_ideal': self.anti_ideal,
+            'distance_ideal': self.distance_ideal,
+            'distance_anti_ideal': self.distance_anti_ideal,
+            'scores': self.scores,
+            'ranked_alternatives': label_array(self.ranked_alternatives),
+            'ranked_scores': self.ranked_scores,
+        }
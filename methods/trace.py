@@ -0,0 +1,193 @@
+# methods/trace.py
+
+import json
+import time
+from collections import deque
+
+# Tingkat verbositas trace: event dengan level lebih tinggi dari level tracer tidak dicatat
+OFF = 0
+INFO = 1
+DEBUG = 2
+LEVELS = {'off': OFF, 'info': INFO, 'debug': DEBUG}
+
+
+def _level(level):
+    """
+    Mengubah nama level ('off', 'info', 'debug') atau angka level menjadi angka.
+    """
+    if isinstance(level, str):
+        if level not in LEVELS:
+            raise ValueError(f"Level trace '{level}' tidak dikenal. Pilihan: {', '.join(LEVELS)}.")
+        return LEVELS[level]
+    return int(level)
+
+
+class TraceEvent:
+    """
+    Satu event trace: jenis, tahap, target (matriks/kriteria/alternatif), payload angka dan timestamp.
+    Pesan teks baru diformat saat dibaca, bukan saat event dicatat.
+    """
+    __slots__ = ('kind', 'stage', 'target', 'payload', 'template', 'level', 'timestamp')
+
+    def __init__(self, kind, stage, target, payload, template, level, timestamp):
+        self.kind = kind
+        self.stage = stage
+        self.target = target
+        self.payload = payload
+        self.template = template
+        self.level = level
+        self.timestamp = timestamp
+
+    @property
+    def message(self):
+        """
+        Pesan teks event (None untuk event tanpa pesan, misal diagnostik level debug).
+        """
+        if self.template is None:
+            return None
+        return self.template.format(target=self.target, **self.payload)
+
+    def to_dict(self):
+        """
+        Mengubah event menjadi dictionary yang bisa di-serialize ke JSON.
+        """
+        return {
+            'timestamp': self.timestamp,
+            'level': self.level,
+            'kind': self.kind,
+            'stage': self.stage,
+            'target': self.target,
+            'payload': self.payload,
+            'message': self.message,
+        }
+
+
+def _json_default(value):
+    """
+    Konversi nilai numpy (skalar/array) untuk json.dumps.
+    """
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+class JsonLinesSink:
+    """
+    Sink yang menulis setiap event sebagai satu baris JSON ke file (mode append) atau stream.
+    """
+
+    def __init__(self, target):
+        """
+        Args:
+            target (str | file-like): Path file atau objek dengan method write.
+        """
+        if isinstance(target, str):
+            self.stream = open(target, 'a', encoding='utf-8')
+            self.owns_stream = True
+        else:
+            self.stream = target
+            self.owns_stream = False
+
+    def __call__(self, event):
+        self.stream.write(json.dumps(event.to_dict(), default=_json_default) + "\n")
+        self.stream.flush()
+
+    def close(self):
+        """
+        Menutup file jika dibuka oleh sink ini.
+        """
+        if self.owns_stream:
+            self.stream.close()
+
+
+class Tracer:
+    """
+    Pencatat langkah pengerjaan terstruktur. Event disimpan di ring buffer berukuran tetap
+    dan/atau dikirim ke sink (misal JsonLinesSink). Dengan level 'off' emit langsung kembali
+    tanpa membuat event maupun memformat pesan.
+    """
+
+    def __init__(self, level='info', maxlen=10_000, sink=None):
+        """
+        Args:
+            level (str | int): 'off', 'info' (langkah pengerjaan) atau 'debug' (ditambah diagnostik per matriks).
+            maxlen (int, optional): Jumlah event maksimum di buffer; event terlama dibuang. None = tanpa batas,
+                0 = tidak disimpan (hanya dikirim ke sink).
+            sink (callable, optional): Fungsi yang menerima setiap TraceEvent.
+        """
+        self.level = _level(level)
+        self.events = deque(maxlen=maxlen)
+        self.sink = sink
+
+    def set_level(self, level):
+        """
+        Mengubah level verbositas.
+        """
+        self.level = _level(level)
+
+    def enabled(self, level=INFO):
+        """
+        True jika event dengan level ini akan dicatat. Dipakai untuk melewati penyusunan payload yang mahal.
+        """
+        return level <= self.level
+
+    def emit(self, kind, stage, message=None, target=None, level=INFO, **payload):
+        """
+        Mencatat satu event.
+
+        Args:
+            kind (str): Jenis event, misal 'step', 'metric', 'warning' atau 'diagnostics'.
+            stage (str): Tahap perhitungan.
+            message (str, optional): Template pesan (str.format dengan field target dan payload).
+            target (str, optional): Matriks, kriteria atau alternatif yang bersangkutan.
+            level (int): INFO atau DEBUG.
+            **payload: Nilai angka yang menyertai event.
+        """
+        if level > self.level:
+            return
+        event = TraceEvent(kind, stage, target, payload, message, level, time.time())
+        self.events.append(event)
+        if self.sink is not None:
+            self.sink(event)
+
+    def messages(self):
+        """
+        Mengembalikan pesan teks semua event di buffer yang memiliki pesan.
+        """
+        return [event.message for event in self.events if event.template is not None]
+
+    def to_dicts(self):
+        """
+        Mengembalikan semua event di buffer sebagai list dictionary.
+        """
+        return [event.to_dict() for event in self.events]
+
+    def clear(self):
+        """
+        Mengosongkan buffer event.
+        """
+        self.events.clear()
+
+
+class Traceable:
+    """
+    Mixin untuk metode yang mencatat langkah pengerjaan melalui self.tracer.
+    """
+
+    def set_trace(self, level='info', maxlen=10_000, sink=None):
+        """
+        Mengatur trace langkah pengerjaan.
+
+        Args:
+            level (str | int): 'off', 'info' atau 'debug'.
+            maxlen (int, optional): Ukuran ring buffer event (None = tanpa batas).
+            sink (callable, optional): Tujuan tambahan event, misal JsonLinesSink('trace.jsonl').
+        """
+        self.tracer = Tracer(level, maxlen, sink)
+
+    @property
+    def steps(self):
+        """
+        Langkah-langkah pengerjaan sebagai list teks (dibentuk dari event di buffer).
+        """
+        return self.tracer.messages()
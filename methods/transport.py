@@ -0,0 +1,126 @@
+# methods/transport.py
+#
+# Format biner hasil perhitungan untuk UI Electron:
+#
+#     0   4 byte   magic b'SPKB'
+#     4   uint32   versi format (little-endian)
+#     8   uint32   panjang header JSON (byte)
+#     12  header   JSON UTF-8: {'meta', 'labels', 'arrays': [{'name', 'dtype', 'shape', 'offset', 'length'}]}
+#     ... buffer   array numerik little-endian, setiap buffer mulai di offset kelipatan 8
+#
+# Offset dihitung dari awal frame, sehingga di JavaScript buffer bisa dibungkus langsung dengan
+# new Float64Array(arrayBuffer, byteOffset + offset, length) tanpa menyalin data.
+
+import json
+import struct
+
+import numpy as np
+
+MAGIC = b'SPKB'
+VERSION = 1
+ALIGNMENT = 8
+
+# Tipe numpy -> nama tipe di header (sesuai typed array JavaScript)
+DTYPES = {
+    'float64': '<f8',
+    'float32': '<f4',
+    'int64': '<i8',
+    'int32': '<i4',
+    'uint8': '<u1',
+}
+
+
+def _padding(size):
+    """
+    Jumlah byte pengisi agar size menjadi kelipatan ALIGNMENT.
+    """
+    return -size % ALIGNMENT
+
+
+def _json_default(value):
+    """
+    Konversi skalar/array numpy di label dan metadata untuk json.dumps.
+    """
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+def _split_columns(columns):
+    """
+    Memisahkan kolom menjadi array numerik (dikirim biner) dan label/nilai lain (dikirim di header JSON).
+    """
+    arrays, labels = {}, {}
+    for name, value in columns.items():
+        if isinstance(value, np.ndarray) and value.dtype.kind in 'biuf':
+            if value.dtype.kind == 'b':
+                value = value.astype(np.uint8)
+            dtype = DTYPES.get(value.dtype.name, '<f8' if value.dtype.kind == 'f' else '<i8')
+            arrays[name] = np.ascontiguousarray(value, dtype=dtype)
+        elif isinstance(value, np.ndarray):
+            labels[name] = value.tolist()
+        else:
+            labels[name] = value
+    return arrays, labels
+
+
+def encode_binary(columns, meta=None):
+    """
+    Mengubah hasil kolumnar (lihat LazyResults.to_columnar) menjadi satu frame biner.
+
+    Args:
+        columns (dict): Nama -> np.ndarray numerik (bobot, skor, matriks) atau label (array objek, list, None).
+        meta (dict, optional): Metadata yang bisa di-serialize ke JSON (misal langkah pengerjaan).
+
+    Returns:
+        bytes: Frame biner.
+    """
+    arrays, labels = _split_columns(columns)
+    entries, relative = [], []
+    size = 0
+    for name, array in arrays.items():
+        entries.append({'name': name, 'dtype': array.dtype.name, 'shape': list(array.shape),
+                        'offset': 0, 'length': int(array.size)})
+        relative.append(size)
+        size += array.nbytes + _padding(array.nbytes)
+
+    # Offset absolut bergantung pada panjang header (yang memuat offset itu sendiri); ulangi sampai stabil
+    header = {'meta': meta or {}, 'labels': labels, 'arrays': entries}
+    start = 0
+    while True:
+        for entry, offset in zip(entries, relative):
+            entry['offset'] = start + offset
+        header_bytes = json.dumps(header, default=_json_default).encode('utf-8')
+        new_start = 12 + len(header_bytes) + _padding(12 + len(header_bytes))
+        if new_start == start:
+            break
+        start = new_start
+
+    parts = [MAGIC, struct.pack('<II', VERSION, len(header_bytes)), header_bytes, b'\0' * (start - 12 - len(header_bytes))]
+    for array in arrays.values():
+        parts.append(array.tobytes())
+        parts.append(b'\0' * _padding(array.nbytes))
+    return b''.join(parts)
+
+
+def decode_binary(data):
+    """
+    Membaca frame biner kembali menjadi kolom dan metadata. Array numerik adalah view read-only ke data.
+
+    Args:
+        data (bytes): Frame dari encode_binary.
+
+    Returns:
+        tuple: (dict kolom, dict meta).
+    """
+    if data[:4] != MAGIC:
+        raise ValueError("Data bukan frame hasil biner.")
+    version, header_length = struct.unpack_from('<II', data, 4)
+    if version != VERSION:
+        raise ValueError(f"Versi format {version} tidak didukung.")
+    header = json.loads(bytes(data[12:12 + header_length]).decode('utf-8'))
+    columns = dict(header['labels'])
+    for entry in header['arrays']:
+        array = np.frombuffer(data, dtype=DTYPES[entry['dtype']], count=entry['length'], offset=entry['offset'])
+        columns[entry['name']] = array.reshape(entry['shape'])
+    return columns, header['meta']
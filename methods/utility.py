@@ -0,0 +1,81 @@
+# methods/utility.py
+
+import numpy as np
+
+# Bentuk fungsi utilitas yang didukung beserta parameter default-nya
+UTILITY_SHAPES = {
+    'linear': {},
+    'exponential': {'alpha': 1.0},     # u = (1 - e^(-alpha x)) / (1 - e^(-alpha))
+    'logarithmic': {'alpha': 1.0},     # u = ln(1 + alpha x) / ln(1 + alpha)
+    'piecewise': {'points': None},     # u = interpolasi linear melalui titik (x, u)
+}
+
+
+def make_utility(shape='linear', **params):
+    """
+    Membuat spesifikasi fungsi utilitas untuk satu kriteria.
+
+    Args:
+        shape (str): 'linear', 'exponential', 'logarithmic' atau 'piecewise'.
+        **params: 'alpha' untuk exponential/logarithmic, 'points' (list (x, u)) untuk piecewise.
+
+    Returns:
+        tuple: (shape, params) yang sudah divalidasi.
+    """
+    if shape not in UTILITY_SHAPES:
+        raise ValueError(f"Fungsi utilitas '{shape}' tidak dikenal. Pilihan: {', '.join(UTILITY_SHAPES)}.")
+    unknown = set(params) - set(UTILITY_SHAPES[shape])
+    if unknown:
+        raise ValueError(f"Parameter {', '.join(sorted(unknown))} tidak berlaku untuk utilitas '{shape}'.")
+    params = {**UTILITY_SHAPES[shape], **params}
+    if shape in ('exponential', 'logarithmic'):
+        params['alpha'] = float(params['alpha'])
+        if shape == 'logarithmic' and params['alpha'] <= -1:
+            raise ValueError("Parameter alpha utilitas logarithmic harus > -1.")
+    if shape == 'piecewise':
+        points = np.asarray(params['points'], dtype=float)
+        if points.ndim != 2 or points.shape[1] != 2 or len(points) < 2:
+            raise ValueError("Utilitas piecewise membutuhkan minimal dua titik (x, u).")
+        if (np.diff(points[:, 0]) <= 0).any():
+            raise ValueError("Titik x utilitas piecewise harus naik.")
+        params['points'] = points
+    return shape, params
+
+
+def apply_utilities(matrix, specs):
+    """
+    Menerapkan fungsi utilitas per kriteria pada matriks ternormalisasi.
+    Kolom dengan bentuk yang sama dihitung bersama dalam satu ekspresi ter-vektorisasi.
+
+    Args:
+        matrix (np.ndarray): Matriks ternormalisasi (alternatif x kriteria) dengan nilai 0..1.
+        specs (list): Spesifikasi (shape, params) untuk setiap kolom.
+
+    Returns:
+        np.ndarray: Matriks utilitas.
+    """
+    shapes = np.array([shape for shape, _ in specs])
+    result = matrix.copy()
+
+    columns = np.flatnonzero(shapes == 'exponential')
+    if columns.size:
+        alpha = np.array([specs[j][1]['alpha'] for j in columns])
+        safe_alpha = np.where(alpha == 0, 1.0, alpha)  # alpha = 0 setara dengan utilitas linear
+        x = matrix[:, columns]
+        curved = np.expm1(-safe_alpha * x) / np.expm1(-safe_alpha)
+        result[:, columns] = np.where(alpha == 0, x, curved)
+
+    columns = np.flatnonzero(shapes == 'logarithmic')
+    if columns.size:
+        alpha = np.array([specs[j][1]['alpha'] for j in columns])
+        safe_alpha = np.where(alpha == 0, 1.0, alpha)
+        x = matrix[:, columns]
+        curved = np.log1p(safe_alpha * x) / np.log1p(safe_alpha)
+        result[:, columns] = np.where(alpha == 0, x, curved)
+
+    # Titik piecewise bisa berbeda per kolom, sehingga np.interp dijalankan per kolom piecewise
+    for j in np.flatnonzero(shapes == 'piecewise'):
+        points = specs[j][1]['points']
+        result[:, j] = np.interp(matrix[:, j], points[:, 0], points[:, 1])
+
+    return result
@@ -0,0 +1,70 @@
+# methods/validation.py
+
+import numpy as np
+
+
+def validate_labels(labels, name):
+    """
+    Memastikan daftar label (kriteria atau alternatif) tidak kosong namanya dan tidak duplikat.
+
+    Args:
+        labels (list): Daftar label.
+        name (str): Nama daftar untuk pesan error.
+
+    Returns:
+        list: Salinan daftar label.
+    """
+    labels = list(labels)
+    if any(str(label).strip() == '' for label in labels):
+        raise ValueError(f"Nama {name} tidak boleh kosong.")
+    if len(set(labels)) != len(labels):
+        raise ValueError(f"Terdapat {name} yang duplikat.")
+    return labels
+
+
+def validate_weights(weights, n_criteria, name):
+    """
+    Memvalidasi bobot kriteria sekaligus: jumlah sesuai, berupa angka berhingga dan > 0.
+
+    Args:
+        weights (array-like): Bobot kriteria.
+        n_criteria (int): Jumlah kriteria yang harus diberi bobot.
+        name (str): Tipe kriteria ('benefit' atau 'cost') untuk pesan error.
+
+    Returns:
+        list: Bobot sebagai list float.
+    """
+    weights = np.asarray(weights, dtype=float).reshape(-1)
+    if weights.shape[0] != n_criteria:
+        raise ValueError(f"Jumlah bobot {name} ({weights.shape[0]}) tidak sama dengan jumlah kriteria {name} ({n_criteria}).")
+    if not np.isfinite(weights).all():
+        raise ValueError(f"Bobot {name} harus berupa angka.")
+    if (weights <= 0).any():
+        raise ValueError(f"Bobot {name} harus > 0.")
+    return weights.tolist()
+
+
+def validate_matrix(matrix, n_alternatives, n_criteria, name, strictly_positive=True):
+    """
+    Memvalidasi matriks keputusan sekaligus (ter-vektorisasi): bentuk, angka berhingga dan tanda nilai.
+
+    Args:
+        matrix (array-like): Matriks berbentuk (jumlah alternatif, jumlah kriteria).
+        n_alternatives (int): Jumlah alternatif.
+        n_criteria (int): Jumlah kriteria.
+        name (str): Tipe kriteria ('benefit' atau 'cost') untuk pesan error.
+        strictly_positive (bool): True jika nilai harus > 0, False jika cukup >= 0.
+
+    Returns:
+        np.ndarray: Matriks float berbentuk (n_alternatives, n_criteria).
+    """
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.shape != (n_alternatives, n_criteria):
+        raise ValueError(f"Matriks {name} harus berbentuk ({n_alternatives}, {n_criteria}), bukan {matrix.shape}.")
+    if not np.isfinite(matrix).all():
+        raise ValueError(f"Matriks {name} harus berisi angka.")
+    if strictly_positive and (matrix <= 0).any():
+        raise ValueError(f"Nilai {name} harus > 0.")
+    if not strictly_positive and (matrix < 0).any():
+        raise ValueError(f"Nilai {name} tidak boleh negatif.")
+    return matrix
@@ -0,0 +1,234 @@
+# methods/worker.py
+
+import contextlib
+import json
+import sys
+from collections.abc import Mapping
+
+import numpy as np
+
+from .ahp import AHP
+from .consensus import METHODS, run_consensus
+from .saw import SAW
+from .wp import WP
+from .maut import MAUT
+from .topsis import TOPSIS
+from .transport import encode_binary
+
+
+def to_jsonable(value):
+    """
+    Mengubah hasil perhitungan (ndarray, skalar numpy, dict, list) menjadi objek yang bisa di-serialize ke JSON.
+
+    Args:
+        value: Nilai yang akan dikonversi.
+
+    Returns:
+        Nilai yang aman untuk json.dumps.
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Mapping):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(v) for v in value]
+    return value
+
+
+def run_ahp(params):
+    """
+    Menjalankan AHP dari parameter request.
+
+    Args:
+        params (dict): 'criteria', 'alternatives', 'criteria_comparisons' (list [i, j, value])
+            dan 'alternative_comparisons' (dict kriteria -> list [i, j, value]).
+
+    Returns:
+        dict: Hasil AHP.get_results().
+    """
+    ahp = AHP(params['criteria'], params['alternatives'])
+    ahp.set_criteria_comparisons(params.get('criteria_comparisons', []))
+    alternative_comparisons = params.get('alternative_comparisons', {})
+    for crit in ahp.criteria:
+        ahp.set_alternative_comparisons(crit, alternative_comparisons.get(crit, []))
+    ahp.perform_ahp()
+    return ahp.get_results()
+
+
+def run_saw(params):
+    """
+    Menjalankan SAW dari parameter request.
+
+    Args:
+        params (dict): 'criteria_benefit', 'criteria_cost', 'weight_benefit', 'weight_cost',
+            'alternatives' dan 'alternative_scores' (dict kriteria -> {alternatif: nilai}).
+
+    Returns:
+        dict: Hasil SAW.get_results().
+    """
+    saw = SAW()
+    saw.set_criteria(params.get('criteria_benefit', []), params.get('criteria_cost', []))
+    saw.set_alternatives(params['alternatives'])
+    saw.set_weights(params.get('weight_benefit', []), params.get('weight_cost', []))
+    for criteria, scores in params.get('alternative_scores', {}).items():
+        saw.set_alternative_scores(criteria, scores)
+    saw.perform_saw()
+    return saw.get_results()
+
+
+def run_topsis(params):
+    """
+    Menjalankan TOPSIS dari parameter request (format sama dengan run_saw).
+    """
+    topsis = TOPSIS()
+    topsis.set_criteria(params.get('criteria_benefit', []), params.get('criteria_cost', []))
+    topsis.set_alternatives(params['alternatives'])
+    topsis.set_weights(params.get('weight_benefit', []), params.get('weight_cost', []))
+    for criteria, scores in params.get('alternative_scores', {}).items():
+        topsis.set_alternative_scores(criteria, scores)
+    topsis.perform_topsis(params.get('top_k'))
+    return topsis.get_results()
+
+
+def _run_scores(method, params):
+    """
+    Mengisi objek WP/MAUT dari parameter request lalu menghitung skor dan ranking.
+
+    Args:
+        method (WP | MAUT): Objek metode (mode headless).
+        params (dict): 'criteria_benefit', 'criteria_cost', 'weight_benefit', 'weight_cost',
+            'alternatives', 'matrix_benefit' dan 'matrix_cost' (list baris per alternatif).
+
+    Returns:
+        dict: Hasil get_results() metode.
+    """
+    method.set_criteria(params.get('criteria_benefit', []), params.get('criteria_cost', []))
+    method.set_alternatives(params['alternatives'])
+    method.set_weights(params.get('weight_benefit', []), params.get('weight_cost', []))
+    return method.evaluate(params.get('matrix_benefit'), params.get('matrix_cost'), params.get('top_k'))
+
+
+def run_wp(params):
+    """
+    Menjalankan WP dari parameter request.
+    """
+    return _run_scores(WP(verbose=False), params)
+
+
+def run_maut(params):
+    """
+    Menjalankan MAUT dari parameter request.
+    """
+    return _run_scores(MAUT(verbose=False), params)
+
+
+def run_consensus_request(params):
+    """
+    Menjalankan beberapa metode sekaligus dan peringkat konsensusnya (format sama dengan run_wp,
+    ditambah 'methods' dan 'aggregation').
+    """
+    return run_consensus(params['alternatives'], params.get('criteria_benefit', []), params.get('criteria_cost', []),
+                         params.get('weight_benefit', []), params.get('weight_cost', []),
+                         params.get('matrix_benefit'), params.get('matrix_cost'),
+                         params.get('methods', METHODS), params.get('aggregation', 'borda'))
+
+
+HANDLERS = {
+    'ahp': run_ahp,
+    'saw': run_saw,
+    'wp': run_wp,
+    'maut': run_maut,
+    'topsis': run_topsis,
+    'consensus': run_consensus_request,
+}
+
+
+def to_binary(result):
+    """
+    Mengubah hasil metode menjadi frame biner (lihat transport.encode_binary). Hasil dengan ekspor
+    kolumnar dikirim sebagai array; langkah pengerjaan dan diagnostik dikirim sebagai metadata JSON.
+
+    Args:
+        result (LazyResults | dict): Hasil get_results() atau evaluate().
+
+    Returns:
+        bytes: Frame biner.
+    """
+    if hasattr(result, 'to_columnar'):
+        meta = {key: to_jsonable(result[key]) for key in ('steps', 'diagnostics') if key in result}
+        return encode_binary(result.to_columnar(), meta)
+    columns = {key: value for key, value in result.items() if isinstance(value, np.ndarray)}
+    meta = {key: to_jsonable(value) for key, value in result.items() if key not in columns}
+    return encode_binary(columns, meta)
+
+
+def handle_request(request):
+    """
+    Memproses satu request dan membuat response dengan id yang sama.
+
+    Args:
+        request (dict): Request dalam format {'id': ..., 'method': ..., 'params': {...}, 'format': 'json' | 'binary'}.
+
+    Returns:
+        dict: Response {'id', 'ok', 'result'} atau {'id', 'ok', 'error'}. Untuk format 'binary', 'result'
+            berisi bytes frame biner (lihat serve).
+    """
+    request_id = request.get('id')
+    method = str(request.get('method', '')).lower()
+    handler = HANDLERS.get(method)
+    if handler is None:
+        return {'id': request_id, 'ok': False, 'error': f"Metode '{method}' tidak dikenal."}
+    try:
+        # Output print() dari metode dialihkan ke stderr agar stdout hanya berisi response
+        with contextlib.redirect_stdout(sys.stderr):
+            result = handler(request.get('params', {}))
+        if request.get('format') == 'binary':
+            return {'id': request_id, 'ok': True, 'format': 'binary', 'result': to_binary(result)}
+        return {'id': request_id, 'ok': True, 'result': to_jsonable(result)}
+    except Exception as exc:
+        return {'id': request_id, 'ok': False, 'error': f"{type(exc).__name__}: {exc}"}
+
+
+def serve(stdin=None, stdout=None):
+    """
+    Menjalankan worker: membaca request JSON per baris dari stdin dan menulis response per baris ke stdout.
+
+    Response biner ditulis sebagai satu baris JSON {'id', 'ok', 'format': 'binary', 'length': n}
+    yang langsung diikuti n byte frame biner.
+
+    Args:
+        stdin: Stream input (default sys.stdin).
+        stdout: Stream output teks (default sys.stdout); stdout.buffer dipakai untuk frame biner.
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    binary_stdout = getattr(stdout, 'buffer', None)
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exc:
+            response = {'id': None, 'ok': False, 'error': f"Request bukan JSON yang valid: {exc}"}
+        else:
+            response = handle_request(request)
+        if response.get('format') == 'binary':
+            if binary_stdout is None:
+                response = {'id': response['id'], 'ok': False, 'error': "Output tidak mendukung data biner."}
+            else:
+                payload = response.pop('result')
+                response['length'] = len(payload)
+                stdout.write(json.dumps(response) + "\n")
+                stdout.flush()
+                binary_stdout.write(payload)
+                binary_stdout.flush()
+                continue
+        stdout.write(json.dumps(response) + "\n")
+        stdout.flush()
+
+
+if __name__ == "__main__":
+    serve()
@@ -1,10 +1,25 @@
 import numpy as np
 
-class WP:
-    def __init__(self):
+from .blocked import blocked_results, matrix_rows, open_matrix, open_output, read_block, row_blocks
+from .colstats import ReadOnlyMatrix, StatsIndex, adopt_matrix
+from .inputs import HeadlessInput
+from .ranking import rank_indices, ranked_labels
+from .sensitivity import weight_sensitivity
+from .validation import validate_labels, validate_matrix
+
+class WP(HeadlessInput):
+    strictly_positive = True  # Validasi nilai matriks pada set_matrices
+    matrix_benefit = ReadOnlyMatrix()  # Disimpan read-only; statistik kolom mengikuti identitas array
+    matrix_cost = ReadOnlyMatrix()
+
+    def __init__(self, verbose=True):
         """
         Inisialisasi objek WP tanpa kriteria dan alternatif awal.
+        
+        Parameters:
+            verbose (bool): Jika False, perhitungan tidak mencetak pesan apa pun (mode headless).
         """
+        self.verbose = verbose
         self.criteria_benefit = []
         self.criteria_cost = []
         self.weight_benefit = []
@@ -12,6 +27,8 @@ class WP:
         self.alternatives = []
         self.matrix_benefit = None
         self.matrix_cost = None
+        self.log_matrix = None  # ln(x) matriks gabungan benefit dan 1/cost
+        self.stats_index = StatsIndex()  # Statistik kolom dan nilai turunan, dikaitkan ke array matriks
         self.S_scores = None  # Nilai S untuk setiap alternatif
         self.V_scores = None  # Nilai V untuk setiap alternatif
         self.ranked_alternatives = None
@@ -121,7 +138,7 @@ class WP:
         length_alternative = len(self.alternatives)
 
         if self.criteria_benefit:
-            self.matrix_benefit = np.zeros((length_alternative, len(self.criteria_benefit)))
+            matrix_benefit = np.zeros((length_alternative, len(self.criteria_benefit)))
             print("\n=== Masukkan nilai untuk Matriks Benefit ===")
             for i, alternative in enumerate(self.alternatives):
                 for j, criteria in enumerate(self.criteria_benefit):
@@ -132,15 +149,16 @@ class WP:
                             if value <= 0:
                                 print("Nilai benefit harus > 0. Silakan masukkan kembali.")
                                 continue
-                            self.matrix_benefit[i][j] = value
+                            matrix_benefit[i][j] = value
                             break
                         except ValueError:
                             print("Nilai harus berupa angka. Silakan masukkan kembali.")
+            self.matrix_benefit = matrix_benefit
         else:
             self.matrix_benefit = None
 
         if self.criteria_cost:
-            self.matrix_cost = np.zeros((length_alternative, len(self.criteria_cost)))
+            matrix_cost = np.zeros((length_alternative, len(self.criteria_cost)))
             print("\n=== Masukkan nilai untuk Matriks Cost ===")
             for i, alternative in enumerate(self.alternatives):
                 for j, criteria in enumerate(self.criteria_cost):
@@ -151,30 +169,139 @@ class WP:
                             if value <= 0:
                                 print("Nilai cost harus > 0. Silakan masukkan kembali.")
                                 continue
-                            self.matrix_cost[i][j] = value
+                            matrix_cost[i][j] = value
                             break
                         except ValueError:
                             print("Nilai harus berupa angka. Silakan masukkan kembali.")
+            self.matrix_cost = matrix_cost
         else:
             self.matrix_cost = None
 
         print("Matriks telah dibuat.")
 
-    def normalize_weights(self):
+    def _log(self, message):
+        """
+        Mencetak pesan proses hanya jika verbose aktif.
+        """
+        if self.verbose:
+            print(message)
+
+    def clear_results(self):
+        """
+        Menghapus skor dan ranking sebelumnya.
+        """
+        self.log_matrix = None
+        self.S_scores = None
+        self.V_scores = None
+        self.ranked_alternatives = None
+        self.ranked_V = None
+
+    def append_alternatives(self, alternatives, matrix_benefit=None, matrix_cost=None):
+        """
+        Menambahkan alternatif baru beserta nilainya ke matriks yang sudah diatur. Statistik kolom
+        diperbarui hanya dengan baris baru (tanpa memindai ulang); skor dan ranking sebelumnya dihapus.
+        Matriks log yang tersimpan juga hanya diperpanjang dengan log baris baru.
+        
+        Parameters:
+            alternatives (list): Daftar alternatif baru.
+            matrix_benefit (array-like): Nilai benefit alternatif baru (jumlah alternatif baru, jumlah kriteria benefit).
+            matrix_cost (array-like): Nilai cost alternatif baru (jumlah alternatif baru, jumlah kriteria cost).
+        """
+        alternatives = validate_labels(list(self.alternatives) + list(alternatives), 'alternatif')[len(self.alternatives):]
+        k = len(alternatives)
+        old_log = self.stats_index.lookup('log_matrix', self.matrix_benefit, self.matrix_cost)
+        new_benefit = new_cost = None
+        if self.criteria_benefit:
+            if self.matrix_benefit is None:
+                raise ValueError("Matriks benefit belum diatur.")
+            rows = new_benefit = validate_matrix(matrix_benefit, k, len(self.criteria_benefit), 'benefit', strictly_positive=True)
+            old_matrix = self.matrix_benefit
+            matrix = adopt_matrix(self, 'matrix_benefit', np.vstack((old_matrix, rows)))  # Tanpa salinan kedua
+            self.stats_index.append('benefit', rows, old_matrix, matrix)
+        if self.criteria_cost:
+            if self.matrix_cost is None:
+                raise ValueError("Matriks cost belum diatur.")
+            rows = new_cost = validate_matrix(matrix_cost, k, len(self.criteria_cost), 'cost', strictly_positive=True)
+            old_matrix = self.matrix_cost
+            matrix = adopt_matrix(self, 'matrix_cost', np.vstack((old_matrix, rows)))  # Tanpa salinan kedua
+            self.stats_index.append('cost', rows, old_matrix, matrix)
+        self.alternatives = list(self.alternatives) + alternatives
+        if old_log is not None:
+            # ln(x) dihitung per elemen: cukup tambahkan log baris baru
+            self.stats_index.store('log_matrix', np.vstack((old_log, self.log_values(new_benefit, new_cost))),
+                                   self.matrix_benefit, self.matrix_cost)
+        self.clear_results()
+
+    def column_stats(self, kind):
+        """
+        Statistik kolom matriks benefit atau cost (lihat ColumnStats), dihitung sekali selama matriks tidak berganti.
+        
+        Parameters:
+            kind (str): 'benefit' atau 'cost'.
+        
+        Returns:
+            ColumnStats: Statistik kolom.
+        """
+        matrix = self.matrix_benefit if kind == 'benefit' else self.matrix_cost
+        if matrix is None:
+            raise ValueError(f"Matriks {kind} belum diatur.")
+        return self.stats_index.get(kind, matrix)
+
+    def evaluate(self, matrix_benefit=None, matrix_cost=None, top_k=None):
+        """
+        Menghitung skor dan ranking untuk satu dataset tanpa input/output interaktif.
+        Kriteria, alternatif dan bobot dipakai ulang sehingga banyak dataset bisa dinilai berurutan.
+        
+        Parameters:
+            matrix_benefit (array-like): Matriks benefit.
+            matrix_cost (array-like): Matriks cost.
+            top_k (int, optional): Hanya mengurutkan k alternatif teratas.
+        
+        Returns:
+            dict: Hasil perhitungan (lihat get_results).
+        """
+        self.set_matrices(matrix_benefit, matrix_cost)
+        self.calculate_scores()
+        if self.V_scores is None:
+            raise ValueError("Skor V tidak dapat dihitung.")
+        self.rank_alternatives(top_k)
+        return self.get_results()
+
+    def get_results(self):
+        """
+        Mengembalikan hasil perhitungan WP dalam format dictionary.
+        
+        Returns:
+            dict: Bobot kriteria, skor S, skor V dan ranking akhir.
         """
-        Normalisasi bobot kriteria agar total bobot sama dengan 1.
+        ranking = {}
+        if self.ranked_alternatives is not None:
+            ranking = dict(zip(self.ranked_alternatives, self.ranked_V))
+        return {
+            'criteria_weights': self.weight_benefit + self.weight_cost,
+            'S_scores': self.S_scores,
+            'V_scores': self.V_scores,
+            'final_ranking': ranking,
+        }
+
+    def sensitivity(self, weights):
+        """
+        Analisis sensitivitas bobot WP: ln S untuk semua skenario dihitung sekaligus sebagai log_matrix @ weights.
+        Peringkat berdasarkan ln S sama dengan peringkat berdasarkan V.
+        
+        Parameters:
+            weights (array-like): Skenario bobot berbentuk (s, jumlah kriteria), urutan kriteria benefit lalu cost.
+        
+        Returns:
+            dict: Skor ln S, peringkat per skenario dan ringkasan stabilitas peringkat (lihat weight_sensitivity).
         """
-        total_benefit = sum(self.weight_benefit)
-        total_cost = sum(self.weight_cost)
-        total = total_benefit + total_cost
-        if total == 0:
-            raise ValueError("Total bobot tidak boleh nol.")
-        # Normalisasi
-        self.weight_benefit = [w / total for w in self.weight_benefit]
-        self.weight_cost = [w / total for w in self.weight_cost]
-        print("\nBobot telah dinormalisasi.")
+        if self.log_matrix is None:
+            self.calculate_scores()
+        if self.log_matrix is None:
+            raise ValueError("Matriks log belum dihitung.")
+        return weight_sensitivity(self.log_matrix, weights, self.weight_benefit + self.weight_cost, self.alternatives)
 
-    def calculate_scores(self):
+    def calculate_scores(self, log_matrix=None):
         """
         Hitung skor WP untuk setiap alternatif.
         
@@ -182,29 +309,24 @@ class WP:
         1. Transformasi nilai cost menjadi 1/x untuk kriteria cost.
         2. Hitung nilai S_i = product (x_ij ^ w_j) untuk semua j.
         3. Hitung V_i = S_i / sum(S_i).
+        
+        Parameters:
+            log_matrix (np.ndarray, optional): Hasil log_values yang sudah dihitung sebelumnya
+                (misal dipakai bersama oleh beberapa metode). Default dihitung dari matriks.
         """
         if not self.weight_benefit and not self.weight_cost:
-            print("Belum ada bobot yang diinput.")
+            self._log("Belum ada bobot yang diinput.")
             return
 
         all_weights = self.weight_benefit + self.weight_cost
-        if self.matrix_benefit is not None and self.matrix_cost is not None:
-            # Menghindari pembagian oleh nol dengan menambahkan epsilon
-            epsilon = 1e-10
-            cost_transformed = np.where(self.matrix_cost != 0, 1.0 / self.matrix_cost, epsilon)
-            combined_matrix = np.hstack((self.matrix_benefit, cost_transformed))
-        elif self.matrix_benefit is not None:
-            combined_matrix = self.matrix_benefit
-        elif self.matrix_cost is not None:
-            epsilon = 1e-10
-            combined_matrix = 1.0 / self.matrix_cost
-        else:
-            print("Belum ada data matriks kriteria.")
+        if log_matrix is None:
+            # Dihitung sekali selama matriks tidak berganti; perhitungan ulang (misal bobot berubah) memakai log yang sama
+            log_matrix = self.stats_index.cached('log_matrix', lambda: self.log_values(self.matrix_benefit, self.matrix_cost),
+                                                 self.matrix_benefit, self.matrix_cost)
+        if log_matrix is None:
+            self._log("Belum ada data matriks kriteria.")
             return
-
-        # Menghindari log(0) dengan menambahkan epsilon
-        epsilon = 1e-10
-        log_matrix = np.log(combined_matrix + epsilon)
+        self.log_matrix = log_matrix
         weighted_log_matrix = log_matrix * all_weights
         log_S = weighted_log_matrix.sum(axis=1)
         S = np.exp(log_S)
@@ -213,28 +335,119 @@ class WP:
         # Hitung sum S_i
         sum_S = S.sum()
         if sum_S == 0:
-            print("Jumlah total skor S adalah nol. Tidak dapat menghitung skor V.")
+            self._log("Jumlah total skor S adalah nol. Tidak dapat menghitung skor V.")
             self.V_scores = None
             return
 
         # Hitung V_i
         V = S / sum_S
         self.V_scores = V
-        print("Skor S dan V telah dihitung.")
+        self._log("Skor S dan V telah dihitung.")
+
+    @staticmethod
+    def log_values(matrix_benefit, matrix_cost):
+        """
+        Menghitung ln(x) matriks gabungan benefit dan 1/cost (atau sebagian barisnya).
+        
+        Parameters:
+            matrix_benefit (np.ndarray): Matriks benefit atau None.
+            matrix_cost (np.ndarray): Matriks cost atau None.
+        
+        Returns:
+            np.ndarray: Matriks log berbentuk (jumlah baris, jumlah kriteria), atau None jika tidak ada matriks.
+        """
+        if matrix_benefit is not None and matrix_cost is not None:
+            # Menghindari pembagian oleh nol dengan menambahkan epsilon
+            epsilon = 1e-10
+            cost_transformed = np.where(matrix_cost != 0, 1.0 / matrix_cost, epsilon)
+            combined_matrix = np.hstack((matrix_benefit, cost_transformed))
+        elif matrix_benefit is not None:
+            combined_matrix = matrix_benefit
+        elif matrix_cost is not None:
+            combined_matrix = 1.0 / matrix_cost
+        else:
+            return None
+
+        # Menghindari log(0) dengan menambahkan epsilon
+        epsilon = 1e-10
+        return np.log(combined_matrix + epsilon)
+
+    def evaluate_blocked(self, matrix_benefit=None, matrix_cost=None, out=None, alternatives=None, top_k=None,
+                         chunk_size=100_000):
+        """
+        Menghitung skor dan ranking WP per blok baris untuk matriks yang lebih besar dari RAM
+        (file .npy dibuka sebagai np.memmap).
+        
+        Skor S setiap baris hanya bergantung pada baris itu sendiri, sehingga tidak perlu statistik kolom:
+        pass pertama memvalidasi blok, menghitung S dan menulisnya ke out sambil menjumlahkan S; pass kedua
+        membagi out dengan jumlah S sehingga out berisi V. Memori tambahan sebanding dengan chunk_size x
+        jumlah kriteria. V dan ranking sama dengan evaluate; S_scores dan log_matrix tidak disimpan.
+        
+        Parameters:
+            matrix_benefit (str | np.ndarray): Path .npy atau matriks (n, jumlah kriteria benefit).
+            matrix_cost (str | np.ndarray): Path .npy atau matriks (n, jumlah kriteria cost).
+            out (str | np.ndarray, optional): Path .npy (dibuat sebagai memmap) atau array (n,) untuk skor V.
+            alternatives (list, optional): Label alternatif. Default self.alternatives, atau indeks baris (np.arange).
+            top_k (int, optional): Hanya mengurutkan k alternatif teratas. Default semua alternatif (O(n)).
+            chunk_size (int): Jumlah baris per blok.
+        
+        Returns:
+            LazyResults: Hasil perhitungan (lihat blocked_results); 'final_ranking' dibangun saat dibaca.
+        """
+        if not self.weight_benefit and not self.weight_cost:
+            raise ValueError("Belum ada bobot yang diinput.")
+        matrix_benefit = open_matrix(matrix_benefit) if self.criteria_benefit else None
+        matrix_cost = open_matrix(matrix_cost) if self.criteria_cost else None
+        n = matrix_rows(matrix_benefit, matrix_cost, self.criteria_benefit, self.criteria_cost)
+        if alternatives is not None:
+            self.alternatives = validate_labels(alternatives, 'alternatif')
+        elif len(self.alternatives) != n:
+            self.alternatives = np.arange(n)  # Tanpa list Python berisi jutaan label
+        self.matrix_benefit = None
+        self.matrix_cost = None
+        self.log_matrix = None
+        self.S_scores = None
 
-    def rank_alternatives(self):
+        # Pass 1: S per blok
+        all_weights = self.weight_benefit + self.weight_cost
+        scores = open_output(out, n)
+        sum_S = 0.0
+        for rows in row_blocks(n, chunk_size):
+            benefit = read_block(matrix_benefit, rows, 'benefit', strictly_positive=True)
+            cost = read_block(matrix_cost, rows, 'cost', strictly_positive=True)
+            S = np.exp((self.log_values(benefit, cost) * all_weights).sum(axis=1))
+            scores[rows] = S
+            sum_S += S.sum()
+        if sum_S == 0:
+            raise ValueError("Jumlah total skor S adalah nol. Tidak dapat menghitung skor V.")
+
+        # Pass 2: V = S / sum S
+        for rows in row_blocks(n, chunk_size):
+            scores[rows] /= sum_S
+        if isinstance(scores, np.memmap):
+            scores.flush()
+        self.V_scores = scores
+        self._log("Skor V telah dihitung per blok.")
+        self.rank_alternatives(top_k)
+        return blocked_results(self.weight_benefit + self.weight_cost, self.V_scores, self.ranked_alternatives,
+                               self.ranked_V)
+
+    def rank_alternatives(self, top_k=None):
         """
         Mengurutkan alternatif berdasarkan nilai V (tertinggi ke terendah).
+        
+        Parameters:
+            top_k (int, optional): Hanya mengurutkan k alternatif teratas (seleksi parsial). Default semua alternatif.
         """
         if self.V_scores is None:
             self.calculate_scores()
         if self.V_scores is None:
-            print("Tidak dapat melakukan ranking karena skor V belum tersedia.")
+            self._log("Tidak dapat melakukan ranking karena skor V belum tersedia.")
             return
-        ranked_indices = np.argsort(self.V_scores)[::-1]
-        self.ranked_alternatives = [self.alternatives[i] for i in ranked_indices]
+        ranked_indices = rank_indices(self.V_scores, top_k)
+        self.ranked_alternatives = ranked_labels(self.alternatives, ranked_indices)
         self.ranked_V = self.V_scores[ranked_indices]
-        print("Alternatif telah diurutkan berdasarkan skor V.")
+        self._log("Alternatif telah diurutkan berdasarkan skor V.")
 
     def display(self):
         """
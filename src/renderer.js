@@ -1,35 +1,50 @@
-const { spawn } = require('child_process');
+// Typed array JavaScript untuk setiap dtype di header frame biner (lihat methods/transport.py)
+const TYPED_ARRAYS = {
+    float64: Float64Array,
+    float32: Float32Array,
+    int64: BigInt64Array,
+    int32: Int32Array,
+    uint8: Uint8Array
+};
 
-// Fungsi untuk menjalankan AHP Python
-function runAHP(criteria, alternatives) {
-    return new Promise((resolve, reject) => {
-        // Menjalankan script Python
-        const pythonProcess = spawn('python', ['methods/ahp.py']);
-
-        let output = '';
-        pythonProcess.stdin.write(JSON.stringify({
-            criteria: criteria,
-            alternatives: alternatives
-        }));
-        pythonProcess.stdin.end();
+// Membaca frame biner hasil worker: header JSON berisi label dan metadata, array numerik dibungkus
+// langsung sebagai typed array di atas buffer yang sama (tanpa salinan jika offset sudah sejajar)
+function decodeResults(bytes) {
+    const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+    const magic = new TextDecoder().decode(bytes.subarray(0, 4));
+    if (magic !== 'SPKB') {
+        throw new Error('Data bukan frame hasil biner.');
+    }
+    const headerLength = view.getUint32(8, true);
+    const header = JSON.parse(new TextDecoder().decode(bytes.subarray(12, 12 + headerLength)));
 
-        pythonProcess.stdout.on('data', (data) => {
-            output += data.toString();
-        });
+    const results = { ...header.labels, meta: header.meta };
+    for (const { name, dtype, shape, offset, length } of header.arrays) {
+        const TypedArray = TYPED_ARRAYS[dtype];
+        const start = bytes.byteOffset + offset;
+        const array = start % TypedArray.BYTES_PER_ELEMENT === 0
+            ? new TypedArray(bytes.buffer, start, length)
+            : new TypedArray(bytes.slice(offset, offset + length * TypedArray.BYTES_PER_ELEMENT).buffer);
+        results[name] = { data: array, shape: shape };
+    }
+    return results;
+}
 
-        pythonProcess.stderr.on('data', (data) => {
-            console.error(`Error: ${data}`);
-            reject(data.toString());
-        });
+// Mengubah typed array menjadi array biasa hanya untuk ditampilkan
+function toDisplay(results) {
+    return JSON.stringify(results, (key, value) => {
+        if (ArrayBuffer.isView(value)) return Array.from(value, Number);
+        return value;
+    }, 2);
+}
 
-        pythonProcess.on('close', (code) => {
-            if (code === 0) {
-                resolve(JSON.parse(output));
-            } else {
-                reject(`Process exited with code ${code}`);
-            }
-        });
+// Fungsi untuk menjalankan AHP melalui worker Python di proses utama
+async function runAHP(criteria, alternatives) {
+    const bytes = await window.api.computeBinary('ahp', {
+        criteria: criteria,
+        alternatives: alternatives
     });
+    return decodeResults(bytes);
 }
 
 // Handle Button Click
@@ -39,7 +54,7 @@ document.getElementById('calculate').addEventListener('click', async () => {
 
     try {
         const results = await runAHP(criteriaInput, alternativesInput);
-        document.getElementById('output').textContent = JSON.stringify(results, null, 2);
+        document.getElementById('output').textContent = toDisplay(results);
         document.getElementById('results').classList.remove('hidden');
     } catch (error) {
         alert('Error: ' + error);
@@ -0,0 +1,48 @@
+# tests/test_ahp_batch.py
+
+import numpy as np
+
+from methods.ahp import AHP
+
+
+def random_reciprocal(k, n, seed=0):
+    rng = np.random.default_rng(seed)
+    matrices = np.ones((k, n, n))
+    iu = np.triu_indices(n, 1)
+    values = rng.choice([1/9, 1/5, 1/3, 1, 3, 5, 9], size=(k, len(iu[0])))
+    matrices[:, iu[0], iu[1]] = values
+    matrices[:, iu[1], iu[0]] = 1 / values
+    return matrices
+
+
+def test_batch_matches_single_matrix_calls():
+    ahp = AHP([], [])
+    matrices = random_reciprocal(6, 5)
+    weights, lambda_max, CR = ahp.calculate_weights_batch(matrices)
+    assert weights.shape == (6, 5)
+    for idx, matrix in enumerate(matrices):
+        single = ahp.calculate_weights_from_matrix(matrix)
+        np.testing.assert_allclose(weights[idx], single, atol=1e-10)
+        np.testing.assert_allclose(CR[idx], ahp.calculate_consistency_ratio(matrix, single), atol=1e-10)
+
+
+def test_batch_of_zero_matrices():
+    weights, lambda_max, CR = AHP([], []).calculate_weights_batch(np.empty((0, 4, 4)))
+    assert weights.shape == (0, 4) and lambda_max.shape == (0,) and CR.shape == (0,)
+
+
+def test_perform_ahp_combines_batched_weights():
+    criteria, alternatives = ['c1', 'c2', 'c3'], ['a', 'b', 'c', 'd']
+    ahp = AHP(criteria, alternatives)
+    ahp.set_trace('off')
+    ahp.set_criteria_comparisons([(0, 1, 3), (0, 2, 5), (1, 2, 2)])
+    matrices = random_reciprocal(3, 4, seed=1)
+    iu = np.triu_indices(4, 1)
+    for crit, matrix in zip(criteria, matrices):
+        ahp.set_alternative_comparisons(crit, list(zip(iu[0], iu[1], matrix[iu])))
+    ahp.perform_ahp()
+
+    criteria_weights = ahp.calculate_weights_from_matrix(ahp.criteria_matrix)
+    expected = sum(w * ahp.calculate_weights_from_matrix(m) for w, m in zip(criteria_weights, matrices))
+    np.testing.assert_allclose(ahp.final_ranking, expected, atol=1e-10)
+    assert np.isclose(ahp.final_ranking.sum(), 1.0)
@@ -0,0 +1,117 @@
+# tests/test_ahp_incremental.py
+
+import numpy as np
+import pytest
+
+from methods.ahp import AHP
+
+CRITERIA = ['c1', 'c2', 'c3']
+ALTERNATIVES = ['A', 'B', 'C', 'D']
+CRITERIA_COMPARISONS = [(0, 1, 3), (0, 2, 5), (1, 2, 2)]
+ALTERNATIVE_COMPARISONS = {
+    'c1': [(0, 1, 2), (0, 2, 4), (0, 3, 3), (1, 2, 2), (1, 3, 1 / 2), (2, 3, 1 / 3)],
+    'c2': [(0, 1, 1 / 3), (0, 2, 1 / 5), (0, 3, 1), (1, 2, 1 / 2), (1, 3, 3), (2, 3, 5)],
+    'c3': [(0, 1, 7), (0, 2, 3), (0, 3, 5), (1, 2, 1 / 3), (1, 3, 1), (2, 3, 2)],
+}
+
+
+def make_ahp(criteria_comparisons=CRITERIA_COMPARISONS, alternative_comparisons=ALTERNATIVE_COMPARISONS):
+    ahp = AHP(CRITERIA, ALTERNATIVES)
+    ahp.set_trace('off')
+    ahp.set_criteria_comparisons(criteria_comparisons)
+    for crit, comparisons in alternative_comparisons.items():
+        ahp.set_alternative_comparisons(crit, comparisons)
+    ahp.perform_ahp()
+    return ahp
+
+
+def replaced(comparisons, i, j, value):
+    return [(a, b, value if (a, b) == (i, j) else v) for a, b, v in comparisons]
+
+
+@pytest.mark.parametrize('storage', ['dense', 'packed'])
+def test_single_update_equals_a_full_recompute(storage):
+    ahp = AHP(CRITERIA, ALTERNATIVES)
+    ahp.set_trace('off')
+    ahp.set_storage(storage)
+    ahp.set_criteria_comparisons(CRITERIA_COMPARISONS)
+    for crit, comparisons in ALTERNATIVE_COMPARISONS.items():
+        ahp.set_alternative_comparisons(crit, comparisons)
+    ahp.perform_ahp()
+    ahp.update_comparison('c2', 1, 3, 1 / 4)
+    ahp.update_comparison('criteria', 0, 2, 7)
+    ahp.perform_ahp()
+
+    alternatives = dict(ALTERNATIVE_COMPARISONS, c2=replaced(ALTERNATIVE_COMPARISONS['c2'], 1, 3, 1 / 4))
+    fresh = make_ahp(replaced(CRITERIA_COMPARISONS, 0, 2, 7), alternatives)
+    np.testing.assert_allclose(ahp.criteria_weights, fresh.criteria_weights, atol=1e-12)
+    for crit in CRITERIA:
+        np.testing.assert_allclose(ahp.alternative_weights[crit], fresh.alternative_weights[crit], atol=1e-12)
+        assert ahp.consistency_ratios['alternatives'][crit] == pytest.approx(fresh.consistency_ratios['alternatives'][crit])
+    np.testing.assert_allclose(ahp.final_ranking, fresh.final_ranking, atol=1e-12)
+
+
+def test_only_the_edited_matrix_is_recomputed(monkeypatch):
+    ahp = make_ahp()
+    solved = []
+    original = AHP.calculate_weights_batch
+
+    def counting(self, matrices, initial=None):
+        solved.append(len(matrices))
+        return original(self, matrices, initial)
+
+    monkeypatch.setattr(AHP, 'calculate_weights_batch', counting)
+    untouched = {crit: ahp.alternative_weights[crit] for crit in ('c1', 'c3')}
+    ahp.update_comparison('c2', 0, 1, 2)
+    ahp.perform_ahp()
+    assert solved == [1]
+    for crit, weights in untouched.items():
+        assert ahp.alternative_weights[crit] is weights
+
+
+def test_contributions_add_up_to_the_consistency_index():
+    ahp = make_ahp()
+    for name in ['criteria'] + CRITERIA:
+        matrix = ahp._matrix(name)
+        n = matrix.shape[0]
+        weights = ahp._current_weights(name)
+        lambda_max = float(np.mean(matrix @ weights / weights))
+        contributions = ahp.consistency_contributions(name)
+        assert len(contributions) == n * (n - 1) // 2
+        total = sum(item['contribution'] for item in contributions)
+        assert total == pytest.approx((lambda_max - n) / (n - 1), abs=1e-10)
+        ordered = [item['contribution'] for item in contributions]
+        assert ordered == sorted(ordered, reverse=True)
+
+
+def test_contributions_point_at_the_edited_pair():
+    ahp = make_ahp(alternative_comparisons=dict(ALTERNATIVE_COMPARISONS, c1=[
+        (0, 1, 2), (0, 2, 4), (0, 3, 8), (1, 2, 2), (1, 3, 4), (2, 3, 2)]))  # konsisten
+    assert ahp.consistency_contributions('c1', top=1)[0]['contribution'] == pytest.approx(0, abs=1e-12)
+    ahp.update_comparison('c1', 0, 3, 1 / 8)
+    with pytest.raises(ValueError):
+        ahp.consistency_contributions('c1')  # Bobot belum diperbarui
+    ahp.perform_ahp()
+    worst = ahp.consistency_contributions('c1', top=1)[0]
+    assert (worst['i'], worst['j']) == (0, 3)
+
+
+@pytest.mark.parametrize('storage', ['dense', 'packed', 'sparse'])
+def test_invalid_updates_leave_the_state_unchanged(storage):
+    ahp = make_ahp()
+    if storage == 'sparse':
+        ahp.set_sparse_comparisons('c1', [(0, 1, 2), (1, 2, 3), (2, 3, 2)])
+    else:
+        ahp.set_storage(storage)
+    ahp.perform_ahp()
+    before = ahp.get_results()
+    for name, i, j, value in (('c1', 1, 1, 2), ('c1', 0, 4, 2), ('c1', -1, 0, 2), ('c1', 0, 1, 0),
+                              ('c1', 0, 1, -3), ('criteria', 0, 3, 2), ('c9', 0, 1, 2)):
+        with pytest.raises(ValueError):
+            ahp.update_comparison(name, i, j, value)
+    assert not ahp.dirty
+    if storage == 'sparse':
+        np.testing.assert_array_equal(ahp.sparse_comparisons['c1']['values'], [2, 3, 2])
+    else:
+        np.testing.assert_array_equal(ahp.alternative_matrices['c1'], before['alternative_matrices']['c1'])
+    np.testing.assert_array_equal(ahp.criteria_matrix, before['criteria_matrix'])
@@ -0,0 +1,18 @@
+# tests/test_benchmarks.py
+
+from benchmarks.suite import METHODS, compare, run
+
+
+def test_run_covers_every_method_with_small_sizes():
+    report = run(list(METHODS), alternatives=[5], criteria=[3], repeat=1)
+    assert {row['method'] for row in report['results']} == set(METHODS)
+    for row in report['results']:
+        assert row['time_s'] >= 0 and row['peak_bytes'] >= 0
+
+
+def test_compare_flags_only_slowdowns_above_threshold():
+    row = {'method': 'saw', 'stage': 'perform', 'alternatives': 10, 'criteria': 3}
+    base = {'results': [{**row, 'time_s': 1.0}, {**row, 'stage': 'rank', 'time_s': 1.0}]}
+    new = {'results': [{**row, 'time_s': 1.05}, {**row, 'stage': 'rank', 'time_s': 1.5}]}
+    flags = {result['stage']: result['regression'] for result in compare(base, new, threshold=0.10)}
+    assert flags == {'perform': False, 'rank': True}
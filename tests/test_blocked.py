@@ -0,0 +1,116 @@
+# tests/test_blocked.py
+
+import numpy as np
+import pytest
+
+from methods.blocked import column_bounds, matrix_rows, open_matrix, open_output, row_blocks
+from methods.maut import MAUT
+from methods.saw import SAW
+from methods.wp import WP
+
+N = 37
+RNG = np.random.default_rng(11)
+BENEFIT = RNG.uniform(1, 100, (N, 2))
+COST = RNG.uniform(1, 50, (N, 1))
+LABELS = [f'a{i}' for i in range(N)]
+
+
+@pytest.fixture
+def files(tmp_path):
+    benefit, cost = tmp_path / 'benefit.npy', tmp_path / 'cost.npy'
+    np.save(benefit, BENEFIT)
+    np.save(cost, COST)
+    return str(benefit), str(cost), str(tmp_path / 'scores.npy')
+
+
+def make_saw():
+    saw = SAW()
+    saw.set_trace('off')
+    saw.set_criteria(['b1', 'b2'], ['c1'])
+    saw.set_weights([0.5, 0.3], [0.2])
+    return saw
+
+
+def configure(method):
+    method.set_criteria(['b1', 'b2'], ['c1'])
+    method.set_alternatives(LABELS)
+    method.set_weights([5, 3], [2])
+    return method
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 1000])
+def test_saw_blocked_equals_in_memory(files, chunk_size):
+    benefit, cost, out = files
+    dense = make_saw()
+    dense.set_decision_matrix(np.hstack([BENEFIT, COST]), LABELS, ['b1', 'b2', 'c1'])
+    dense.perform_saw()
+    blocked = make_saw()
+    blocked.perform_saw_blocked(benefit, cost, out=out, alternatives=LABELS, chunk_size=chunk_size)
+    np.testing.assert_allclose(blocked.scores, dense.scores, rtol=1e-12)
+    assert blocked.ranked_alternatives == dense.ranked_alternatives
+    np.testing.assert_allclose(np.load(out), dense.scores, rtol=1e-12)  # Skor tertulis ke file
+
+
+@pytest.mark.parametrize('method_cls', [WP, MAUT])
+@pytest.mark.parametrize('chunk_size', [1, 5, 1000])
+def test_headless_blocked_equals_in_memory(files, method_cls, chunk_size):
+    benefit, cost, out = files
+    dense = configure(method_cls(verbose=False)).evaluate(BENEFIT, COST)
+    blocked = configure(method_cls(verbose=False)).evaluate_blocked(benefit, cost, out=out, chunk_size=chunk_size)
+    np.testing.assert_allclose(blocked['V_scores'], dense['V_scores'], rtol=1e-12)
+    assert list(blocked['final_ranking']) == list(dense['final_ranking'])
+    np.testing.assert_allclose(np.load(out), dense['V_scores'], rtol=1e-12)
+
+
+@pytest.mark.parametrize('method_cls', [WP, MAUT])
+def test_blocked_top_k_is_a_prefix_of_the_full_ranking(files, method_cls):
+    benefit, cost, _ = files
+    full = configure(method_cls(verbose=False)).evaluate_blocked(benefit, cost, chunk_size=8)
+    top = configure(method_cls(verbose=False)).evaluate_blocked(benefit, cost, top_k=4, chunk_size=8)
+    assert list(top['final_ranking']) == list(full['final_ranking'])[:4]
+
+
+def test_blocked_ranking_without_labels_stays_an_index_array(files):
+    benefit, cost, _ = files
+    saw = make_saw()
+    saw.perform_saw_blocked(benefit, cost, chunk_size=8)
+    assert isinstance(saw.ranked_alternatives, np.ndarray) and saw.ranked_alternatives.dtype.kind == 'i'
+    np.testing.assert_array_equal(saw.scores[saw.ranked_alternatives], saw.ranked_scores)
+    assert isinstance(saw.get_results().to_columnar()['ranked_alternatives'], np.ndarray)
+    for method_cls in (WP, MAUT):
+        method = method_cls(verbose=False)
+        method.set_criteria(['b1', 'b2'], ['c1'])
+        method.set_weights([5, 3], [2])
+        results = method.evaluate_blocked(benefit, cost, chunk_size=8)
+        ranked = results['ranked_alternatives']
+        assert isinstance(ranked, np.ndarray) and ranked.dtype.kind == 'i'
+        assert not results.is_loaded('final_ranking')  # Dictionary O(n) hanya dibangun saat dibaca
+        np.testing.assert_array_equal(results['V_scores'][ranked], results['ranked_V'])
+        assert list(results['final_ranking']) == ranked.tolist()
+
+
+def test_wp_blocked_validates_every_block(files, tmp_path):
+    bad = BENEFIT.copy()
+    bad[30, 1] = 0  # Nilai <= 0 di blok terakhir
+    path = tmp_path / 'bad.npy'
+    np.save(path, bad)
+    with pytest.raises(ValueError):
+        configure(WP(verbose=False)).evaluate_blocked(str(path), files[1], chunk_size=8)
+
+
+def test_helpers(files):
+    benefit = open_matrix(files[0])
+    assert isinstance(benefit, np.memmap) and not benefit.flags.writeable
+    assert [(s.start, s.stop) for s in row_blocks(5, 2)] == [(0, 2), (2, 4), (4, 5)]
+    column_max, column_min = column_bounds(benefit, 4, 'benefit')
+    np.testing.assert_array_equal(column_max, BENEFIT.max(axis=0))
+    np.testing.assert_array_equal(column_min, BENEFIT.min(axis=0))
+    assert matrix_rows(benefit, COST, ['b1', 'b2'], ['c1']) == N
+    with pytest.raises(ValueError):
+        matrix_rows(benefit, COST[:-1], ['b1', 'b2'], ['c1'])
+    with pytest.raises(ValueError):
+        matrix_rows(None, COST, ['b1', 'b2'], ['c1'])
+    with pytest.raises(ValueError):
+        open_output(np.empty(3), 4)
+    with pytest.raises(ValueError):
+        list(row_blocks(5, 0))
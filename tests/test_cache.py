@@ -0,0 +1,92 @@
+# tests/test_cache.py
+
+import numpy as np
+import pytest
+
+from methods.ahp import AHP
+from methods.cache import PriorityCache
+from methods.priority import power_priorities
+
+CRITERIA = ['c1', 'c2', 'c3']
+ALTERNATIVES = ['A', 'B', 'C']
+COMPARISONS = {
+    'c1': [(0, 1, 2), (0, 2, 4), (1, 2, 3)],
+    'c2': [(0, 1, 1 / 3), (0, 2, 1 / 5), (1, 2, 1 / 2)],
+    'c3': [(0, 1, 2), (0, 2, 4), (1, 2, 3)],  # Sama dengan c1
+}
+
+
+def make_ahp(solver='eig', cache=None):
+    ahp = AHP(CRITERIA, ALTERNATIVES)
+    ahp.set_trace('off')
+    ahp.set_solver(solver)
+    if cache is not None:
+        ahp.set_cache(cache)
+    ahp.set_criteria_comparisons([(0, 1, 3), (0, 2, 5), (1, 2, 2)])
+    for crit, comparisons in COMPARISONS.items():
+        ahp.set_alternative_comparisons(crit, comparisons)
+    ahp.perform_ahp()
+    return ahp
+
+
+@pytest.mark.parametrize('solver', ['eig', 'power', 'geometric_mean'])
+def test_cached_results_are_identical_to_uncached(solver):
+    cache = PriorityCache()
+    plain = make_ahp(solver)
+    first = make_ahp(solver, cache)
+    second = make_ahp(solver, cache)  # Semua matriks diambil dari cache
+    for ahp in (first, second):
+        np.testing.assert_array_equal(ahp.criteria_weights, plain.criteria_weights)
+        for crit in CRITERIA:
+            np.testing.assert_array_equal(ahp.alternative_weights[crit], plain.alternative_weights[crit])
+        np.testing.assert_array_equal(ahp.final_ranking, plain.final_ranking)
+    assert all(diag['cached'] for diag in second.diagnostics['alternatives'].values())
+
+
+def test_hits_misses_and_shared_cache():
+    cache = PriorityCache()
+    make_ahp(cache=cache)
+    # Kriteria dan c1 dihitung; c3 identik dengan c1 tetapi berada di batch yang sama, c2 baru
+    assert cache.misses == 4 and cache.hits == 0
+    assert len(cache) == 3
+    make_ahp(cache=cache)
+    assert cache.stats()['hits'] == 4 and cache.stats()['hit_rate'] == 0.5
+
+
+def test_key_depends_on_content_solver_and_options():
+    matrix = np.array([[1.0, 2.0], [0.5, 1.0]])
+    key = PriorityCache.make_key(matrix)
+    assert PriorityCache.make_key(matrix.copy()) == key
+    assert PriorityCache.make_key(matrix.astype(np.float32)) != key
+    assert PriorityCache.make_key(matrix, 'power') != key
+    assert PriorityCache.make_key(matrix, 'power', {'tol': 1e-6}) != PriorityCache.make_key(matrix, 'power')
+    edited = matrix.copy()
+    edited[0, 1] = np.nextafter(2.0, 3.0)
+    assert PriorityCache.make_key(edited) != key
+
+
+def test_lru_eviction_and_read_only_entries():
+    cache = PriorityCache(maxsize=2)
+    for key in (b'a', b'b'):
+        cache.put(key, [0.5, 0.5], 2.0, 0.0)
+    cache.get(b'a')
+    cache.put(b'c', [1.0], 1.0, 0.0)
+    assert cache.get(b'b') is None
+    entry = cache.get(b'a')
+    assert entry is not None
+    with pytest.raises(ValueError):
+        entry['weights'][0] = 1.0
+    with pytest.raises(ValueError):
+        PriorityCache(maxsize=0)
+
+
+def test_power_result_does_not_depend_on_the_batch():
+    rng = np.random.default_rng(0)
+    values = rng.choice([1 / 5, 1 / 3, 1, 3, 5], size=(4, 6))
+    matrices = np.ones((4, 4, 4))
+    iu = np.triu_indices(4, 1)
+    matrices[:, iu[0], iu[1]] = values
+    matrices[:, iu[1], iu[0]] = 1 / values
+    batch = power_priorities(matrices)['weights']
+    for idx, matrix in enumerate(matrices):
+        np.testing.assert_array_equal(power_priorities(matrix[None])['weights'][0], batch[idx])
@@ -0,0 +1,184 @@
+# tests/test_colstats.py
+
+import numpy as np
+import pytest
+
+from methods.colstats import SCHEMES, ColumnStats, StatsIndex, is_frozen
+from methods.maut import MAUT
+from methods.saw import SAW
+from methods.wp import WP
+
+RNG = np.random.default_rng(3)
+MATRIX = RNG.uniform(-5, 20, (40, 4))
+MATRIX[::7, 1] = 0
+
+
+def test_stats_match_numpy():
+    stats = ColumnStats.from_matrix(MATRIX)
+    assert stats.count == 40
+    np.testing.assert_allclose(stats.min, MATRIX.min(axis=0))
+    np.testing.assert_allclose(stats.max, MATRIX.max(axis=0))
+    np.testing.assert_allclose(stats.sum, MATRIX.sum(axis=0))
+    np.testing.assert_allclose(stats.mean, MATRIX.mean(axis=0))
+    np.testing.assert_allclose(stats.std, MATRIX.std(axis=0))
+    np.testing.assert_allclose(stats.norm, np.linalg.norm(MATRIX, axis=0))
+    np.testing.assert_allclose(stats.logsum, np.log(np.where(MATRIX > 0, MATRIX, 1)).sum(axis=0))
+    np.testing.assert_array_equal(stats.nnz, (MATRIX != 0).sum(axis=0))
+
+
+def test_appending_blocks_equals_one_pass():
+    stats = ColumnStats(4)
+    for rows in (MATRIX[:1], MATRIX[1:13], MATRIX[13:13], MATRIX[13:]):
+        stats.append(rows)
+    full = ColumnStats.from_matrix(MATRIX)
+    for name in ('min', 'max', 'sum', 'sumsq', 'logsum', 'nnz', 'mean', 'm2'):
+        np.testing.assert_allclose(getattr(stats, name), getattr(full, name), rtol=1e-12, atol=1e-9)
+    with pytest.raises(ValueError):
+        stats.append(np.ones(3))
+
+
+def test_std_keeps_precision_for_a_large_mean():
+    values = 1e9 + RNG.standard_normal((1000, 1))
+    stats = ColumnStats(1)
+    for start in range(0, 1000, 100):
+        stats.append(values[start:start + 100])
+    np.testing.assert_allclose(stats.std, values.std(axis=0), rtol=1e-6)
+
+
+@pytest.mark.parametrize('scheme', SCHEMES)
+@pytest.mark.parametrize('kind', ['benefit', 'cost'])
+def test_normalize_matches_the_direct_formula(scheme, kind):
+    matrix = np.abs(MATRIX) + 1
+    stats = ColumnStats.from_matrix(matrix)
+    column_max, column_min = matrix.max(axis=0), matrix.min(axis=0)
+    expected = {
+        'max': matrix / column_max,
+        'min_ratio': column_min / matrix,
+        'min_max': (matrix - column_min) / (column_max - column_min),
+        'vector': matrix / np.linalg.norm(matrix, axis=0),
+        'zscore': (matrix - matrix.mean(axis=0)) / matrix.std(axis=0),
+    }[scheme]
+    if kind == 'cost' and scheme == 'min_max':
+        expected = 1 - expected
+    if kind == 'cost' and scheme == 'zscore':
+        expected = -expected
+    np.testing.assert_allclose(stats.normalize(matrix, scheme, kind), expected, atol=1e-12)
+    np.testing.assert_allclose(stats.normalize(matrix[5:9], scheme, kind), expected[5:9], atol=1e-12)
+
+
+def test_normalize_rejects_unknown_scheme_or_kind():
+    stats = ColumnStats.from_matrix(MATRIX)
+    with pytest.raises(ValueError):
+        stats.normalize(MATRIX, 'log')
+    with pytest.raises(ValueError):
+        stats.normalize(MATRIX, 'max', 'neutral')
+
+
+def test_stats_index_follows_array_identity():
+    index = StatsIndex()
+    matrix = np.ones((3, 2))
+    stats = index.get('benefit', matrix)
+    assert index.get('benefit', matrix) is stats
+    assert index.get('benefit', matrix.copy()) is not stats
+    index.invalidate()
+    assert index.lookup('benefit', matrix) is None
+
+
+def test_matrices_are_read_only_copies_of_caller_arrays():
+    maut = MAUT(verbose=False)
+    maut.set_criteria(['b1', 'b2'], [])
+    maut.set_alternatives(['A', 'B', 'C'])
+    benefit = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    maut.set_matrices(benefit)
+    assert benefit.flags.writeable and maut.matrix_benefit is not benefit
+    with pytest.raises(ValueError):
+        maut.matrix_benefit[0, 0] = 10.0  # Perubahan di tempat harus lewat pengganti matriks
+    frozen = benefit.copy()
+    frozen.setflags(write=False)
+    assert is_frozen(frozen) and not is_frozen(benefit[:, :1].view())
+    maut.set_matrices(frozen)
+    assert maut.matrix_benefit is frozen  # Array yang sudah beku tidak disalin
+
+
+def test_reassigning_a_matrix_recomputes_its_stats():
+    maut = MAUT(verbose=False)
+    maut.set_criteria(['b1'], ['c1'])
+    maut.set_alternatives(['A', 'B'])
+    maut.set_matrices([[1.0], [2.0]], [[3.0], [4.0]])
+    assert maut.column_stats('benefit').max[0] == 2.0
+    maut.set_matrices([[7.0], [5.0]], [[3.0], [4.0]])
+    assert maut.column_stats('benefit').max[0] == 7.0
+
+
+@pytest.mark.parametrize('method_cls', [WP, MAUT])
+def test_append_alternatives_equals_setting_the_full_matrix(method_cls):
+    benefit, cost = np.abs(MATRIX[:, :2]) + 1, np.abs(MATRIX[:, 2:3]) + 1
+    labels = [f'a{i}' for i in range(40)]
+
+    def configure(method, n):
+        method.set_criteria(['b1', 'b2'], ['c1'])
+        method.set_alternatives(labels[:n])
+        method.set_weights([3, 2], [5])
+        return method
+
+    appended = configure(method_cls(verbose=False), 30)
+    appended.evaluate(benefit[:30], cost[:30])
+    appended.append_alternatives(labels[30:], benefit[30:], cost[30:])
+    full = configure(method_cls(verbose=False), 40)
+    full.set_matrices(benefit, cost)
+    for kind in ('benefit', 'cost'):
+        np.testing.assert_allclose(appended.column_stats(kind).max, full.column_stats(kind).max)
+        np.testing.assert_allclose(appended.column_stats(kind).std, full.column_stats(kind).std)
+    assert appended.V_scores is None  # Skor lama dihapus
+    appended.calculate_scores()
+    full.calculate_scores()
+    np.testing.assert_allclose(appended.V_scores, full.V_scores, rtol=1e-12)
+
+
+def test_wp_append_extends_the_cached_log_matrix():
+    wp = WP(verbose=False)
+    wp.set_criteria(['b1'], ['c1'])
+    wp.set_alternatives(['A', 'B'])
+    wp.set_weights([1], [1])
+    wp.evaluate([[2.0], [4.0]], [[1.0], [2.0]])
+    old_log = wp.stats_index.lookup('log_matrix', wp.matrix_benefit, wp.matrix_cost)
+    wp.append_alternatives(['C'], [[8.0]], [[4.0]])
+    log_matrix = wp.stats_index.lookup('log_matrix', wp.matrix_benefit, wp.matrix_cost)
+    assert log_matrix is not None
+    np.testing.assert_array_equal(log_matrix[:2], old_log)
+    np.testing.assert_allclose(log_matrix[2], [np.log(8.0), -np.log(4.0)])
+
+
+def test_saw_update_score_is_copy_on_write():
+    saw = SAW()
+    saw.set_trace('off')
+    saw.set_criteria(['b1'], ['c1'])
+    saw.set_weights([0.6], [0.4])
+    saw.set_decision_matrix(np.array([[3.0, 2.0], [4.0, 5.0], [1.0, 1.0]]), ['A', 'B', 'C'], ['b1', 'c1'])
+    saw.perform_saw()
+    results = saw.get_results()
+    before = saw.matrix_benefit
+    saw.update_score('A', 'b1', 10.0)
+    assert saw.matrix_benefit is not before and before[0, 0] == 3.0  # Snapshot tetap melihat nilai lama
+    assert saw.column_stats('benefit').max[0] == 10.0
+    assert results['final_ranking']['A'] == pytest.approx(0.6 * 3 / 4 + 0.4 * 1 / 2)  # Hasil sebelum update
+    owned = saw.matrix_benefit
+    saw.update_score('B', 'b1', 2.0)
+    assert saw.matrix_benefit is owned  # Salinan milik objek diubah di tempat
+    assert saw.column_stats('benefit').max[0] == 10.0
+
+
+@pytest.mark.parametrize('method_cls', [WP, MAUT])
+def test_append_keeps_the_stacked_matrix_without_copying_it(method_cls, monkeypatch):
+    method = method_cls(verbose=False)
+    method.set_criteria(['b1'], ['c1'])
+    method.set_alternatives(['A', 'B'])
+    method.set_matrices([[1.0], [2.0]], [[3.0], [4.0]])
+    stacked = []
+    vstack = np.vstack
+    monkeypatch.setattr(np, 'vstack', lambda arrays: stacked.append(vstack(arrays)) or stacked[-1])
+    method.append_alternatives(['C'], [[5.0]], [[6.0]])
+    assert method.matrix_benefit is stacked[0] and method.matrix_cost is stacked[1]
+    assert not method.matrix_benefit.flags.writeable
+    np.testing.assert_array_equal(method.matrix_benefit[:, 0], [1.0, 2.0, 5.0])
+    assert method.column_stats('benefit').max[0] == 5.0
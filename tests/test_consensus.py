@@ -0,0 +1,97 @@
+# tests/test_consensus.py
+
+import numpy as np
+import pytest
+
+from methods.ahp import AHP
+from methods.consensus import borda, copeland, prepare, rank_positions, run_consensus
+from methods.maut import MAUT
+from methods.saw import SAW
+from methods.wp import WP
+
+ALTERNATIVES = ['A', 'B', 'C', 'D']
+BENEFIT = np.array([[4.0, 2.0], [9.0, 9.0], [5.0, 1.0], [2.0, 4.0]])  # B unggul di semua kriteria
+COST = np.array([[2.0], [0.5], [1.0], [3.0]])
+WEIGHTS = ([3, 2], [5])
+
+
+def consensus(**options):
+    return run_consensus(ALTERNATIVES, ['b1', 'b2'], ['c1'], *WEIGHTS, BENEFIT, COST, **options)
+
+
+def configure(method):
+    method.set_criteria(['b1', 'b2'], ['c1'])
+    method.set_alternatives(ALTERNATIVES)
+    method.set_weights(*WEIGHTS)
+    return method
+
+
+@pytest.mark.parametrize('aggregation', ['borda', 'copeland'])
+def test_a_dominating_alternative_wins_every_method(aggregation):
+    result = consensus(aggregation=aggregation)
+    assert set(result['methods']) == {'saw', 'wp', 'maut', 'ahp'}
+    for output in result['methods'].values():
+        assert output['ranking'][0] == 'B'
+    assert result['consensus']['ranking'][0] == 'B'
+    n = len(ALTERNATIVES)
+    expected_top = 4 * (n - 1) if aggregation == 'borda' else n - 1
+    assert result['consensus']['scores'][1] == expected_top
+
+
+def test_method_scores_equal_the_standalone_methods():
+    result = consensus(max_workers=1)
+    saw = SAW()
+    saw.set_trace('off')
+    saw.set_criteria(['b1', 'b2'], ['c1'])
+    saw.set_weights([0.3, 0.2], [0.5])
+    saw.set_decision_matrix(np.hstack([BENEFIT, COST]), ALTERNATIVES, ['b1', 'b2', 'c1'])
+    saw.perform_saw()
+    np.testing.assert_allclose(result['methods']['saw']['scores'], saw.scores)
+    for name, method_cls in (('wp', WP), ('maut', MAUT)):
+        standalone = configure(method_cls(verbose=False)).evaluate(BENEFIT, COST)
+        np.testing.assert_allclose(result['methods'][name]['scores'], standalone['V_scores'])
+        assert result['methods'][name]['ranking'] == list(standalone['final_ranking'])
+
+
+def test_ahp_scores_equal_eig_ahp_on_derived_comparisons():
+    result = consensus(methods=('ahp',))
+    weights = np.array([0.3, 0.2, 0.5])
+    values = np.hstack([BENEFIT, 1 / COST])
+    ahp = AHP(['b1', 'b2', 'c1'], ALTERNATIVES)
+    ahp.set_trace('off')
+    ahp.set_criteria_comparisons([(i, j, weights[i] / weights[j]) for i in range(3) for j in range(i + 1, 3)])
+    for k, crit in enumerate(['b1', 'b2', 'c1']):
+        ahp.set_alternative_comparisons(crit, [(i, j, values[i, k] / values[j, k])
+                                               for i in range(4) for j in range(i + 1, 4)])
+    ahp.perform_ahp()
+    np.testing.assert_allclose(result['methods']['ahp']['scores'], ahp.final_ranking, atol=1e-10)
+
+
+def test_caller_arrays_stay_writeable_and_shared_arrays_are_frozen():
+    benefit, cost = BENEFIT.copy(), COST.copy()
+    shared = prepare(ALTERNATIVES, ['b1', 'b2'], ['c1'], *WEIGHTS, benefit, cost)
+    assert benefit.flags.writeable and cost.flags.writeable
+    for key in ('matrix_benefit', 'matrix_cost', 'max_benefit', 'min_cost', 'log_matrix'):
+        assert not shared[key].flags.writeable
+    benefit[0, 0] = 100.0
+    assert shared['matrix_benefit'][0, 0] == 4.0
+    assert shared['weight_benefit'] == pytest.approx([0.3, 0.2])
+
+
+def test_aggregations_on_a_known_ranking():
+    scores = np.array([[3.0, 2.0, 1.0], [3.0, 1.0, 2.0], [2.0, 3.0, 1.0]])
+    positions = rank_positions(scores)
+    np.testing.assert_array_equal(positions, [[0, 1, 2], [0, 2, 1], [1, 0, 2]])
+    np.testing.assert_array_equal(borda(positions), [5.0, 3.0, 1.0])
+    np.testing.assert_array_equal(copeland(positions), [2.0, 0.0, -2.0])
+
+
+def test_invalid_requests_raise():
+    with pytest.raises(ValueError):
+        consensus(methods=('saw', 'electre'))
+    with pytest.raises(ValueError):
+        consensus(methods=())
+    with pytest.raises(ValueError):
+        consensus(aggregation='plurality')
+    with pytest.raises(ValueError):
+        run_consensus(ALTERNATIVES, ['b1', 'b2'], ['c1'], *WEIGHTS, BENEFIT, -COST)  # WP/AHP butuh nilai > 0
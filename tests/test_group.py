@@ -0,0 +1,76 @@
+# tests/test_group.py
+
+import numpy as np
+import pytest
+
+from methods.ahp import AHP
+from methods.group import GeometricMeanAccumulator, aggregate_priorities, comparison_matrices, iter_chunks
+
+CRITERIA = ['c1', 'c2', 'c3']
+ASSESSORS = [
+    [(0, 1, 3), (0, 2, 5), (1, 2, 2)],
+    [(0, 1, 2), (0, 2, 4), (1, 2, 3)],
+    [(0, 1, 1 / 2), (0, 2, 3), (1, 2, 5)],
+    [(0, 1, 9), (0, 2, 1 / 9), (1, 2, 9)],  # Sangat tidak konsisten
+]
+WEIGHTS = [1.0, 2.0, 0.5, 1.0]
+
+
+def make_ahp():
+    ahp = AHP(CRITERIA, ['A', 'B'])
+    ahp.set_trace('off')
+    return ahp
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 256])
+def test_aij_is_the_weighted_elementwise_geometric_mean(chunk_size):
+    ahp = make_ahp()
+    summary = ahp.set_group_comparisons('criteria', iter(ASSESSORS), iter(WEIGHTS), chunk_size=chunk_size)
+    matrices = comparison_matrices(ASSESSORS, 3)
+    weights = np.asarray(WEIGHTS)
+    expected = np.exp(np.tensordot(weights, np.log(matrices), axes=1) / weights.sum())
+    np.testing.assert_allclose(ahp.criteria_matrix, expected)
+    np.testing.assert_allclose(ahp.criteria_matrix * ahp.criteria_matrix.T, 1.0)  # Tetap resiprokal
+    assert summary == {'assessors': 4, 'included': 4, 'excluded': []}
+    assert 'criteria' in ahp.dirty
+
+
+def test_aip_is_the_normalized_geometric_mean_of_priorities():
+    ahp = make_ahp()
+    result = ahp.group_priorities('criteria', ASSESSORS, WEIGHTS, chunk_size=2)
+    individual = np.stack([ahp.calculate_weights_from_matrix(matrix) for matrix in comparison_matrices(ASSESSORS, 3)])
+    weights = np.asarray(WEIGHTS)
+    expected = np.exp(weights @ np.log(individual) / weights.sum())
+    np.testing.assert_allclose(result['weights'], expected / expected.sum())
+    np.testing.assert_allclose(aggregate_priorities(individual, weights), result['weights'])
+    assert ahp.criteria_matrix is None  # AIP tidak mengubah matriks model
+
+
+def test_cr_threshold_excludes_inconsistent_assessors():
+    ahp = make_ahp()
+    summary = ahp.set_group_comparisons('criteria', ASSESSORS, WEIGHTS, cr_threshold=0.1, chunk_size=3)
+    assert summary['excluded'] == [3]
+    reference = make_ahp()
+    reference.set_group_comparisons('criteria', ASSESSORS[:3], WEIGHTS[:3])
+    np.testing.assert_allclose(ahp.criteria_matrix, reference.criteria_matrix)
+    with pytest.raises(ValueError):
+        make_ahp().set_group_comparisons('criteria', ASSESSORS[3:], cr_threshold=0.1)
+
+
+def test_weight_count_must_match_the_assessors():
+    with pytest.raises(ValueError, match="Jumlah bobot"):
+        list(iter_chunks(ASSESSORS, [1.0, 1.0], chunk_size=2))
+    with pytest.raises(ValueError, match="Jumlah bobot"):
+        make_ahp().group_priorities('criteria', ASSESSORS, WEIGHTS + [1.0])
+
+
+def test_accumulator_validates_its_input():
+    accumulator = GeometricMeanAccumulator(2)
+    with pytest.raises(ValueError):
+        accumulator.mean()
+    with pytest.raises(ValueError):
+        accumulator.add([1.0, 0.0])
+    with pytest.raises(ValueError):
+        accumulator.add([1.0, 2.0, 3.0])
+    accumulator.add([[1.0, 4.0], [4.0, 1.0]])
+    np.testing.assert_allclose(accumulator.mean(), [2.0, 2.0])
@@ -0,0 +1,59 @@
+# tests/test_headless.py
+
+import numpy as np
+import pytest
+
+from methods.maut import MAUT
+from methods.wp import WP
+
+
+def configure(method):
+    method.set_criteria(['b1', 'b2'], ['c1'])
+    method.set_alternatives(['A', 'B', 'C'])
+    method.set_weights([3, 2], [5])
+    return method
+
+
+BENEFIT = np.array([[4.0, 2.0], [3.0, 5.0], [5.0, 1.0]])
+COST = np.array([[2.0], [4.0], [1.0]])
+
+
+def test_wp_evaluate_matches_the_formula_and_prints_nothing(capsys):
+    result = configure(WP(verbose=False)).evaluate(BENEFIT, COST)
+    assert capsys.readouterr().out == ''
+    weights = np.array([0.3, 0.2, 0.5])
+    S = np.prod(np.hstack([BENEFIT, 1 / COST]) ** weights, axis=1)
+    np.testing.assert_allclose(result['S_scores'], S)
+    np.testing.assert_allclose(result['V_scores'], S / S.sum())
+    assert list(result['final_ranking']) == [['A', 'B', 'C'][i] for i in np.argsort(-S)]
+
+
+def test_maut_evaluate_is_reusable_across_datasets():
+    maut = configure(MAUT(verbose=False))
+    first = dict(maut.evaluate(BENEFIT, COST)['final_ranking'])
+    maut.evaluate(BENEFIT[::-1], COST[::-1])
+    again = maut.evaluate(BENEFIT, COST)['final_ranking']
+    assert list(again) == list(first)
+    np.testing.assert_allclose(list(again.values()), list(first.values()))
+
+
+@pytest.mark.parametrize('method, benefit', [
+    (WP, np.array([[4.0, 0.0], [3.0, 5.0], [5.0, 1.0]])),   # WP membutuhkan nilai > 0
+    (MAUT, np.array([[4.0, -1.0], [3.0, 5.0], [5.0, 1.0]])),
+    (MAUT, np.ones((2, 2))),                                 # Bentuk salah
+    (MAUT, np.array([[4.0, np.nan], [3.0, 5.0], [5.0, 1.0]])),
+])
+def test_invalid_matrices_are_rejected(method, benefit):
+    with pytest.raises(ValueError):
+        configure(method(verbose=False)).set_matrices(benefit, COST)
+
+
+def test_invalid_labels_and_weights_are_rejected():
+    wp = WP(verbose=False)
+    with pytest.raises(ValueError):
+        wp.set_criteria(['x'], ['x'])
+    with pytest.raises(ValueError):
+        wp.set_alternatives(['A', 'A'])
+    wp.set_criteria(['b1'], ['c1'])
+    with pytest.raises(ValueError):
+        wp.set_weights([1, 2], [1])
@@ -0,0 +1,111 @@
+# tests/test_hierarchy.py
+
+import numpy as np
+import pytest
+
+from methods.ahp import AHP
+from methods.hierarchy import GOAL, HierarchyAHP
+
+ALTERNATIVES = ['A', 'B', 'C']
+CRITERIA_COMPARISONS = [(0, 1, 3), (0, 2, 5), (1, 2, 2)]
+LEAF_COMPARISONS = {
+    'c1': [(0, 1, 2), (0, 2, 4), (1, 2, 3)],
+    'c2': [(0, 1, 1 / 3), (0, 2, 1 / 5), (1, 2, 1 / 2)],
+    'c3': [(0, 1, 5), (0, 2, 1), (1, 2, 1 / 4)],
+}
+
+
+def flat_hierarchy():
+    hierarchy = HierarchyAHP(ALTERNATIVES)
+    hierarchy.set_trace('off')
+    for crit in LEAF_COMPARISONS:
+        hierarchy.add_criterion(crit)
+    hierarchy.set_comparisons(GOAL, CRITERIA_COMPARISONS)
+    for crit, comparisons in LEAF_COMPARISONS.items():
+        hierarchy.set_comparisons(crit, comparisons)
+    return hierarchy
+
+
+def test_a_single_level_equals_flat_ahp():
+    hierarchy = flat_hierarchy()
+    scores = hierarchy.compute()
+    ahp = AHP(list(LEAF_COMPARISONS), ALTERNATIVES)
+    ahp.set_trace('off')
+    ahp.set_criteria_comparisons(CRITERIA_COMPARISONS)
+    for crit, comparisons in LEAF_COMPARISONS.items():
+        ahp.set_alternative_comparisons(crit, comparisons)
+    ahp.perform_ahp()
+    np.testing.assert_allclose(scores, ahp.final_ranking, atol=1e-12)
+    np.testing.assert_allclose(list(hierarchy.global_weights().values()), ahp.criteria_weights, atol=1e-12)
+    assert hierarchy.consistency_ratios[GOAL] == pytest.approx(ahp.consistency_ratios['criteria'])
+
+
+def test_sub_criteria_compose_through_local_weights():
+    hierarchy = flat_hierarchy()
+    hierarchy.add_criterion('c2a', parent='c2')
+    hierarchy.add_criterion('c2b', parent='c2')
+    hierarchy.set_comparisons('c2', [(0, 1, 3)])
+    hierarchy.set_comparisons('c2a', LEAF_COMPARISONS['c2'])
+    hierarchy.set_comparisons('c2b', LEAF_COMPARISONS['c3'])
+    scores = hierarchy.compute()
+
+    local = hierarchy.local_weights
+    c2 = local['c2'][0] * local['c2a'] + local['c2'][1] * local['c2b']
+    expected = np.column_stack([local['c1'], c2, local['c3']]) @ local[GOAL]
+    np.testing.assert_allclose(scores, expected, atol=1e-12)
+    weights = hierarchy.global_weights()
+    assert weights['c2a'] + weights['c2b'] == pytest.approx(weights['c2'])
+    assert sum(weights[leaf] for leaf in ('c1', 'c2a', 'c2b', 'c3')) == pytest.approx(1.0)
+
+
+def test_an_update_only_recomputes_the_path_to_the_root():
+    hierarchy = flat_hierarchy()
+    hierarchy.compute()
+    untouched = {node: hierarchy.local_weights[node] for node in ('c1', 'c3', GOAL)}
+    hierarchy.update_comparison('c2', 0, 1, 4)
+    assert hierarchy.stale == {'c2', GOAL}
+    scores = hierarchy.compute()
+    for node, weights in untouched.items():
+        assert hierarchy.local_weights[node] is weights
+
+    fresh = flat_hierarchy()
+    fresh.set_comparisons('c2', [(0, 1, 4), (0, 2, 1 / 5), (1, 2, 1 / 2)])
+    np.testing.assert_allclose(scores, fresh.compute(), atol=1e-12)
+
+
+def test_invalid_updates_leave_the_matrix_unchanged():
+    hierarchy = flat_hierarchy()
+    hierarchy.compute()
+    before = hierarchy.matrices['c2'].copy()
+    for i, j, value in ((1, 1, 2), (0, 3, 2), (-1, 0, 2), (0, 1, 0), (0, 1, -4)):
+        with pytest.raises(ValueError):
+            hierarchy.update_comparison('c2', i, j, value)
+    np.testing.assert_array_equal(hierarchy.matrices['c2'], before)
+    assert not hierarchy.stale
+
+
+def test_missing_comparisons_raise():
+    hierarchy = HierarchyAHP(ALTERNATIVES)
+    with pytest.raises(ValueError):
+        hierarchy.compute()  # Belum ada kriteria
+    hierarchy = flat_hierarchy()
+    hierarchy.compute()
+    hierarchy.add_criterion('c4')  # Matriks goal dan c4 belum ada
+    with pytest.raises(ValueError, match="'c4'|'goal'"):
+        hierarchy.compute()
+    hierarchy.set_comparisons(GOAL, [(0, 1, 3), (0, 2, 5), (1, 2, 2), (0, 3, 1), (1, 3, 1), (2, 3, 1)])
+    with pytest.raises(ValueError, match="'c4'"):
+        hierarchy.compute()
+    with pytest.raises(ValueError):
+        hierarchy.add_criterion('c1')
+    with pytest.raises(ValueError):
+        hierarchy.add_criterion('c5', parent='unknown')
+
+
+def test_a_single_child_gets_the_whole_weight():
+    hierarchy = flat_hierarchy()
+    hierarchy.add_criterion('c1a', parent='c1')
+    hierarchy.set_comparisons('c1a', LEAF_COMPARISONS['c1'])
+    before = flat_hierarchy().compute()
+    np.testing.assert_allclose(hierarchy.compute(), before, atol=1e-12)
+    assert hierarchy.get_results()['global_weights']['c1a'] == pytest.approx(hierarchy.global_weights()['c1'])
@@ -0,0 +1,86 @@
+# tests/test_packed.py
+
+import numpy as np
+import pytest
+
+from methods.ahp import AHP
+from methods.packed import PackedComparisons, pack, packed_matvec, solve_packed, unpack
+from methods.priority import solve_priorities
+
+CRITERIA = ['c1', 'c2', 'c3']
+N = 6
+
+
+def random_comparisons(seed):
+    rng = np.random.default_rng(seed)
+    rows, cols = np.triu_indices(N, 1)
+    values = rng.choice([1 / 9, 1 / 5, 1 / 3, 1, 3, 5, 9], size=len(rows))
+    return [(int(i), int(j), float(v)) for i, j, v in zip(rows, cols, values)]
+
+
+def make_ahp(storage, solver, dtype=np.float64):
+    ahp = AHP(CRITERIA, [f'a{i}' for i in range(N)])
+    ahp.set_trace('off')
+    ahp.set_storage(storage, dtype)
+    ahp.set_solver(solver)
+    ahp.set_criteria_comparisons([(0, 1, 3), (0, 2, 5), (1, 2, 2)])
+    for seed, crit in enumerate(CRITERIA):
+        ahp.set_alternative_comparisons(crit, random_comparisons(seed))
+    ahp.perform_ahp()
+    return ahp
+
+
+@pytest.mark.parametrize('solver', ['eig', 'power', 'geometric_mean'])
+def test_packed_weights_equal_dense_weights(solver):
+    dense, packed = make_ahp('dense', solver), make_ahp('packed', solver)
+    for crit in CRITERIA:
+        np.testing.assert_allclose(packed.alternative_weights[crit], dense.alternative_weights[crit], atol=1e-10)
+        assert packed.consistency_ratios['alternatives'][crit] == pytest.approx(dense.consistency_ratios['alternatives'][crit])
+        np.testing.assert_array_equal(packed.alternative_matrices[crit], dense.alternative_matrices[crit])
+    np.testing.assert_allclose(packed.final_ranking, dense.final_ranking, atol=1e-10)
+
+
+def test_float32_storage_halves_memory_with_close_weights():
+    packed64, packed32 = make_ahp('packed', 'eig'), make_ahp('packed', 'eig', np.float32)
+    assert packed32.alternative_matrices.nbytes * 2 == packed64.alternative_matrices.nbytes
+    np.testing.assert_allclose(packed32.final_ranking, packed64.final_ranking, atol=1e-6)
+
+
+def test_pack_unpack_round_trip_and_matvec():
+    np.testing.assert_array_equal(unpack(pack(np.ones((2, N, N))), N), np.ones((2, N, N)))
+    storage = PackedComparisons(['x'], N)
+    storage.set_comparisons('x', random_comparisons(7))
+    dense = storage['x']
+    np.testing.assert_array_equal(unpack(pack(dense), N), dense)
+    weights = np.random.default_rng(0).random((1, N))
+    np.testing.assert_allclose(packed_matvec(storage.packed(), weights, N)[0], dense @ weights[0])
+    for solver in ('eig', 'power', 'geometric_mean'):
+        np.testing.assert_allclose(solve_packed(storage.packed(), N, solver)['weights'][0],
+                                   solve_priorities(dense[None], solver)['weights'][0], atol=1e-10)
+
+
+def test_set_value_keeps_the_reciprocal_and_updates_match_dense():
+    dense, packed = make_ahp('dense', 'eig'), make_ahp('packed', 'eig')
+    for ahp in (dense, packed):
+        ahp.update_comparison('c2', 4, 1, 7)
+        ahp.perform_ahp()
+    matrix = packed.alternative_matrices['c2']
+    assert matrix[4, 1] == 7 and matrix[1, 4] == pytest.approx(1 / 7)
+    np.testing.assert_allclose(packed.final_ranking, dense.final_ranking, atol=1e-10)
+
+
+def test_invalid_indices_leave_the_matrix_unchanged():
+    storage = PackedComparisons(['x'], 3)
+    storage.set_comparisons('x', [(0, 1, 3), (1, 2, 2)])
+    before = storage.buffer.copy()
+    for comparisons in ([(0, 3, 2)], [(1, 1, 2)], [(-1, 0, 2)]):
+        with pytest.raises(ValueError):
+            storage.set_comparisons('x', comparisons, reset=True)
+    np.testing.assert_array_equal(storage.buffer, before)
+    with pytest.raises(ValueError):
+        storage.set_value('x', 0, 3, 2)
+    with pytest.raises(ValueError):
+        storage['x'] = np.ones((2, 2))
+    with pytest.raises(KeyError):
+        storage.set_value('y', 0, 1, 2)
+    assert 'y' not in storage and list(storage) == ['x']
@@ -0,0 +1,35 @@
+# tests/test_priority.py
+
+import numpy as np
+import pytest
+
+from methods.ahp import AHP
+from methods.priority import SOLVERS, compare_solvers, solve_priorities
+
+
+def consistent_matrix(weights):
+    weights = np.asarray(weights, dtype=float)
+    return weights[:, None] / weights[None, :]
+
+
+@pytest.mark.parametrize('solver', sorted(SOLVERS))
+def test_solvers_are_exact_on_consistent_matrices(solver):
+    weights = np.array([5.0, 3.0, 1.0, 1.0])
+    result = solve_priorities(consistent_matrix(weights), solver)
+    np.testing.assert_allclose(result['weights'], weights / weights.sum(), atol=1e-9)
+
+
+def test_power_iteration_matches_eigenvector():
+    rng = np.random.default_rng(3)
+    matrix = consistent_matrix(rng.uniform(1, 9, 8)) * np.exp(0.2 * rng.standard_normal((8, 8)))
+    matrix = np.triu(matrix, 1) + np.tril(1 / matrix.T, -1) + np.eye(8)  # Resiprokal
+    report = compare_solvers(matrix, ['power'], tol=1e-12)
+    assert report['power']['converged']
+    assert report['power']['max_abs_diff'] < 1e-8
+
+
+def test_set_solver_rejects_unknown_solver():
+    with pytest.raises(ValueError):
+        AHP(['c'], ['a']).set_solver('tidak_ada')
+    with pytest.raises(ValueError):
+        solve_priorities(np.eye(2), 'tidak_ada')
@@ -0,0 +1,42 @@
+# tests/test_ranking.py
+
+import numpy as np
+import pytest
+
+from methods.ranking import rank_indices
+from methods.wp import WP
+
+
+def test_full_ranking_orders_ties_from_the_highest_index():
+    np.testing.assert_array_equal(rank_indices(np.array([1.0, 3.0, 3.0, 2.0])), [2, 1, 3, 0])
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_top_k_is_a_prefix_of_the_full_ranking(seed):
+    rng = np.random.default_rng(seed)
+    scores = rng.integers(0, 4, 15).astype(float)  # Banyak skor sama
+    scores[rng.random(15) < 0.2] = np.nan
+    full = rank_indices(scores)
+    for top_k in range(0, 17):
+        np.testing.assert_array_equal(rank_indices(scores, top_k), full[:top_k])
+
+
+def test_nan_scores_are_ranked_last():
+    np.testing.assert_array_equal(rank_indices(np.array([1.0, np.nan, 3.0, np.nan])), [2, 0, 3, 1])
+    np.testing.assert_array_equal(rank_indices(np.array([1.0, np.nan, 3.0, np.nan]), top_k=3), [2, 0, 3])
+
+
+def test_method_top_k_matches_full_ranking():
+    rng = np.random.default_rng(0)
+    matrix = rng.integers(1, 4, (40, 3)).astype(float)
+    alternatives = [f'a{i}' for i in range(40)]
+
+    def evaluate(top_k):
+        wp = WP(verbose=False)
+        wp.set_criteria(['b1', 'b2'], ['c1'])
+        wp.set_alternatives(alternatives)
+        wp.set_weights([2, 1], [1])
+        wp.evaluate(matrix[:, :2], matrix[:, 2:], top_k=top_k)
+        return wp.ranked_alternatives
+
+    assert evaluate(5) == evaluate(None)[:5]
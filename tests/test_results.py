@@ -0,0 +1,91 @@
+# tests/test_results.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from methods.ahp import AHP
+from methods.results import LazyResults
+from methods.saw import SAW
+
+
+def test_values_are_built_once_and_only_when_read():
+    calls = []
+    results = LazyResults({'a': lambda: calls.append('a') or 1, 'b': lambda: calls.append('b') or 2})
+    assert not results.is_loaded('a')
+    assert results['a'] == 1 and results['a'] == 1
+    assert calls == ['a']
+    assert results.to_dict() == {'a': 1, 'b': 2}
+    with pytest.raises(ValueError):
+        results.to_columnar()
+
+
+def make_saw():
+    frame = pd.DataFrame(np.arange(1, 10.0).reshape(3, 3), index=['A', 'B', 'C'], columns=['b1', 'b2', 'c1'])
+    saw = SAW()
+    saw.set_criteria(['b1', 'b2'], ['c1'])
+    saw.set_weights([0.4, 0.35], [0.25])
+    saw.set_decision_matrix(frame)
+    saw.perform_saw()
+    return saw
+
+
+def test_saw_results_are_a_snapshot():
+    saw = make_saw()
+    results = saw.get_results()
+    before = dict(saw.get_results()['final_ranking'])
+    saw.update_score('A', 'b1', 100.0)
+    assert results['final_ranking'] == before
+    assert results['criteria_matrix']['b1']['A'] == 1.0
+    assert results['normalization_factors']['b1'] == 7.0
+    assert results.to_columnar()['matrix'][0, 0] == 1.0
+    assert saw.get_results()['criteria_matrix']['b1']['A'] == 100.0
+
+
+def test_saw_columnar_export_matches_nested_views():
+    results = make_saw().get_results()
+    columnar = results.to_columnar()
+    criteria = list(columnar['criteria'])
+    for j, crit in enumerate(criteria):
+        for i, alt in enumerate(columnar['alternatives']):
+            assert results['criteria_matrix'][crit][alt] == columnar['matrix'][i, j]
+            assert results['normalized_matrix'][crit][alt] == columnar['normalized_matrix'][i, j]
+    assert list(results['final_ranking']) == list(columnar['ranked_alternatives'])
+
+
+@pytest.mark.parametrize('storage', ['dense', 'packed'])
+def test_ahp_results_are_a_snapshot(storage):
+    ahp = AHP(['c1', 'c2'], ['x', 'y', 'z'])
+    ahp.set_storage(storage)
+    ahp.set_criteria_comparisons([(0, 1, 3)])
+    ahp.set_alternative_comparisons('c1', [(0, 1, 2), (0, 2, 4), (1, 2, 2)])
+    ahp.set_alternative_comparisons('c2', [(0, 1, 0.5), (0, 2, 0.25), (1, 2, 0.5)])
+    ahp.perform_ahp()
+    results = ahp.get_results()
+    before = dict(ahp.get_results()['final_ranking'])
+    ahp.update_comparison('c1', 0, 1, 9)
+    ahp.perform_ahp()
+    assert results['final_ranking'] == before
+    assert results['alternative_matrices']['c1'][0, 1] == 2
+    assert results.to_columnar()['alternative_matrices'][0, 0, 1] == 2
+
+
+def test_ahp_snapshot_copies_only_the_matrix_that_changes():
+    ahp = AHP(['c1', 'c2'], ['x', 'y', 'z'])
+    ahp.set_trace('off')
+    ahp.set_criteria_comparisons([(0, 1, 3)])
+    ahp.set_alternative_comparisons('c1', [(0, 1, 2), (0, 2, 4), (1, 2, 2)])
+    ahp.set_alternative_comparisons('c2', [(0, 1, 0.5), (0, 2, 0.25), (1, 2, 0.5)])
+    ahp.perform_ahp()
+    criteria, c1, c2 = ahp.criteria_matrix, ahp.alternative_matrices['c1'], ahp.alternative_matrices['c2']
+    results = ahp.get_results()
+    assert ahp.criteria_matrix is criteria and ahp.alternative_matrices['c1'] is c1  # get_results tidak menyalin
+    ahp.update_comparison('c1', 0, 1, 9)
+    assert ahp.alternative_matrices['c1'] is not c1 and c1[0, 1] == 2  # Hanya matriks yang diubah disalin
+    assert ahp.alternative_matrices['c2'] is c2 and ahp.criteria_matrix is criteria
+    owned = ahp.alternative_matrices['c1']
+    ahp.update_comparison('c1', 0, 2, 3)
+    assert ahp.alternative_matrices['c1'] is owned  # Salinan milik objek diubah di tempat
+    ahp.perform_ahp()
+    assert results['alternative_matrices']['c1'][0, 2] == 4
+    assert results['diagnostics'] is not ahp.diagnostics
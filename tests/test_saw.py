@@ -0,0 +1,64 @@
+# tests/test_saw.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from methods.saw import SAW
+
+CRITERIA = ['b1', 'b2', 'c1']
+
+
+def make_saw():
+    saw = SAW()
+    saw.set_trace('off')
+    saw.set_criteria(['b1', 'b2'], ['c1'])
+    saw.set_weights([0.5, 0.3], [0.2])
+    return saw
+
+
+def test_dict_dataframe_and_ndarray_inputs_give_the_same_ranking():
+    rng = np.random.default_rng(0)
+    alternatives = [f'a{i}' for i in range(6)]
+    matrix = rng.uniform(1, 10, (6, 3))
+
+    from_dict = make_saw()
+    from_dict.set_alternatives(alternatives)
+    for j, crit in enumerate(CRITERIA):
+        from_dict.set_alternative_scores(crit, {alt: matrix[i, j] for i, alt in enumerate(alternatives)})
+    from_frame = make_saw()
+    from_frame.set_decision_matrix(pd.DataFrame(matrix, index=alternatives, columns=CRITERIA))
+    from_array = make_saw()
+    from_array.set_decision_matrix(matrix, alternatives, CRITERIA)
+
+    for saw in (from_dict, from_frame, from_array):
+        saw.perform_saw()
+    assert from_dict.ranked_alternatives == from_frame.ranked_alternatives == from_array.ranked_alternatives
+    np.testing.assert_array_equal(from_dict.ranked_scores, from_frame.ranked_scores)
+    np.testing.assert_array_equal(from_dict.ranked_scores, from_array.ranked_scores)
+
+
+def test_saw_scores_match_the_textbook_formula():
+    matrix = np.array([[70.0, 3.0, 20.0], [90.0, 2.0, 40.0], [80.0, 4.0, 10.0]])
+    saw = make_saw()
+    saw.set_decision_matrix(matrix, ['A', 'B', 'C'], CRITERIA)
+    saw.perform_saw()
+    normal = np.column_stack([matrix[:, :2] / matrix[:, :2].max(axis=0), matrix[:, 2:].min(axis=0) / matrix[:, 2:]])
+    expected = normal @ np.array([0.5, 0.3, 0.2])
+    np.testing.assert_allclose(saw.scores, expected)
+    assert saw.ranked_alternatives == ['C', 'A', 'B']
+
+
+def test_missing_dict_values_count_as_zero():
+    saw = make_saw()
+    saw.set_alternatives(['A', 'B'])
+    saw.set_alternative_scores('b1', {'A': 5})
+    saw.set_alternative_scores('b2', {'A': 1, 'B': 2})
+    saw.set_alternative_scores('c1', {'A': 1, 'B': 1})
+    saw.perform_saw()
+    assert saw.matrix_benefit[1, 0] == 0
+
+
+def test_ndarray_input_requires_labels():
+    with pytest.raises(ValueError):
+        make_saw().set_decision_matrix(np.ones((2, 3)))
@@ -0,0 +1,56 @@
+# tests/test_saw_incremental.py
+
+import numpy as np
+import pandas as pd
+
+from methods.saw import SAW
+
+CRITERIA = ['b1', 'b2', 'c1']
+
+
+def make_saw(frame):
+    saw = SAW()
+    saw.set_trace('off')
+    saw.set_criteria(['b1', 'b2'], ['c1'])
+    saw.set_weights([0.4, 0.35], [0.25])
+    saw.set_decision_matrix(frame)
+    saw.perform_saw()
+    return saw
+
+
+def test_update_score_matches_a_full_recompute():
+    rng = np.random.default_rng(0)
+    alternatives = [f'a{i}' for i in range(60)]
+    values = rng.integers(1, 8, (60, 3)).astype(float)
+    frame = pd.DataFrame(values, index=alternatives, columns=CRITERIA)
+    saw = make_saw(frame)
+    for _ in range(200):
+        i, j = rng.integers(60), rng.integers(3)
+        # Termasuk mengubah nilai ekstrem kolom (faktor normalisasi berubah)
+        value = float(rng.choice([1.0, 9.0, rng.integers(1, 8)]))
+        values[i, j] = value
+        saw.update_score(alternatives[i], CRITERIA[j], value)
+    reference = make_saw(pd.DataFrame(values, index=alternatives, columns=CRITERIA))
+    assert saw.ranked_alternatives == reference.ranked_alternatives
+    np.testing.assert_allclose(saw.scores, reference.scores, atol=1e-12)
+
+
+def test_update_score_does_not_modify_the_callers_frame():
+    frame = pd.DataFrame(np.arange(1, 10.0).reshape(3, 3), index=['A', 'B', 'C'], columns=CRITERIA)
+    saw = make_saw(frame)
+    saw.update_score('A', 'b1', 100.0)
+    assert frame.at['A', 'b1'] == 1.0
+    assert saw.decision_matrix.at['A', 'b1'] == 100.0
+
+
+def test_update_score_after_scoring_without_perform_saw():
+    saw = SAW()
+    saw.set_trace('off')
+    saw.set_criteria(['b1', 'b2'], ['c1'])
+    saw.set_weights([0.4, 0.35], [0.25])
+    saw.set_decision_matrix(np.arange(1, 10.0).reshape(3, 3), ['A', 'B', 'C'], CRITERIA)
+    saw.create_matrices()
+    saw.normalization()
+    saw.calculate_score()
+    saw.update_score('A', 'b1', 100.0)
+    assert saw.ranked_alternatives[0] == 'A'
@@ -0,0 +1,46 @@
+# tests/test_saw_stream.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from methods.saw import SAW
+
+
+def make_saw():
+    saw = SAW()
+    saw.set_trace('off')
+    saw.set_criteria(['b1', 'b2'], ['c1'])
+    saw.set_weights([0.4, 0.3], [0.3])
+    return saw
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    rng = np.random.default_rng(1)
+    n = 500
+    # Nilai bulat agar banyak skor sama: urutan seri harus sama dengan perform_saw
+    frame = pd.DataFrame(rng.integers(1, 6, (n, 3)).astype(float), columns=['b1', 'b2', 'c1'])
+    frame.loc[7, 'b1'] = np.nan
+    frame.insert(0, 'nama', [f'alt{i}' for i in range(n)])
+    path = tmp_path / 'alternatif.csv'
+    frame.to_csv(path, index=False)
+    return path, frame
+
+
+@pytest.mark.parametrize('top_k', [1, 10, 500, 800])
+def test_stream_top_k_matches_full_ranking(csv_path, top_k):
+    path, frame = csv_path
+    full = make_saw()
+    full.set_decision_matrix(frame.set_index('nama'))
+    full.perform_saw()
+
+    stream = make_saw()
+    stream.perform_saw_stream(path, top_k=top_k, chunksize=64)
+    assert stream.ranked_alternatives == full.ranked_alternatives[:top_k]
+    np.testing.assert_array_equal(stream.ranked_scores, full.ranked_scores[:top_k])
+
+
+def test_stream_rejects_non_positive_top_k(csv_path):
+    with pytest.raises(ValueError):
+        make_saw().perform_saw_stream(csv_path[0], top_k=0)
@@ -0,0 +1,78 @@
+# tests/test_sensitivity.py
+
+import numpy as np
+import pytest
+
+from methods.maut import MAUT
+from methods.saw import SAW
+from methods.sensitivity import random_weights, weight_grid, weight_sensitivity
+from methods.wp import WP
+
+ALTERNATIVES = ['A', 'B', 'C', 'D']
+BENEFIT = np.array([[4.0, 2.0], [3.0, 5.0], [5.0, 1.0], [2.0, 4.0]])
+COST = np.array([[2.0], [4.0], [1.0], [3.0]])
+WEIGHTS = [0.3, 0.2, 0.5]
+
+
+def configure(method):
+    method.set_criteria(['b1', 'b2'], ['c1'])
+    method.set_alternatives(ALTERNATIVES)
+    method.set_weights(WEIGHTS[:2], WEIGHTS[2:])
+    return method
+
+
+def test_weight_grid_keeps_every_scenario_on_the_simplex():
+    grid = weight_grid(WEIGHTS, np.linspace(-0.5, 0.5, 5))
+    assert grid.shape == (15, 3)
+    np.testing.assert_allclose(grid.sum(axis=1), 1.0)
+    np.testing.assert_allclose(grid[2], WEIGHTS)  # delta 0 mengembalikan bobot dasar
+
+
+@pytest.mark.parametrize('method_cls', [WP, MAUT])
+def test_sweep_ranks_match_rerunning_the_method_per_scenario(method_cls):
+    scenarios = random_weights(20, 3, seed=1)
+    sweep = configure(method_cls(verbose=False))
+    sweep.evaluate(BENEFIT, COST)
+    result = sweep.sensitivity(scenarios)
+
+    for weights, ranks in zip(scenarios, result['ranks']):
+        method = method_cls(verbose=False)
+        method.set_criteria(['b1', 'b2'], ['c1'])
+        method.set_alternatives(ALTERNATIVES)
+        method.set_weights(weights[:2], weights[2:])
+        ranking = list(method.evaluate(BENEFIT, COST)['final_ranking'])
+        assert [ALTERNATIVES[i] for i in np.argsort(ranks)] == ranking
+
+
+def test_saw_sweep_scores_match_perform_saw_per_scenario():
+    matrix = np.hstack([BENEFIT, COST])
+    saw = SAW()
+    saw.set_trace('off')
+    saw.set_criteria(['b1', 'b2'], ['c1'])
+    saw.set_weights(WEIGHTS[:2], WEIGHTS[2:])
+    saw.set_decision_matrix(matrix, ALTERNATIVES, ['b1', 'b2', 'c1'])
+    saw.perform_saw()
+    scenarios = random_weights(10, 3, seed=2)
+    result = saw.sensitivity(scenarios)
+
+    for weights, scores in zip(scenarios, result['scores']):
+        single = SAW()
+        single.set_trace('off')
+        single.set_criteria(['b1', 'b2'], ['c1'])
+        single.set_weights(list(weights[:2]), list(weights[2:]))
+        single.set_decision_matrix(matrix, ALTERNATIVES, ['b1', 'b2', 'c1'])
+        single.perform_saw()
+        np.testing.assert_allclose(scores, single.scores)
+
+
+def test_summary_of_a_dominating_alternative():
+    matrix = np.array([[1.0, 1.0], [0.5, 0.2], [0.1, 0.4]])
+    result = weight_sensitivity(matrix, random_weights(50, 2, seed=3), [0.5, 0.5], ['x', 'y', 'z'])
+    np.testing.assert_array_equal(result['summary']['first_share'], [1.0, 0.0, 0.0])
+    assert result['baseline_ranks'][0] == 1
+    assert result['summary']['worst_rank'][0] == 1
+
+
+def test_weight_count_must_match_the_criteria():
+    with pytest.raises(ValueError):
+        weight_sensitivity(np.ones((3, 2)), np.ones((4, 3)))
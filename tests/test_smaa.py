@@ -0,0 +1,49 @@
+# tests/test_smaa.py
+
+import numpy as np
+
+from methods.saw import SAW
+from methods.smaa import smaa_saw
+
+ALTERNATIVES = ['A', 'B', 'C', 'D']
+MATRIX = np.array([[4.0, 2.0, 2.0], [3.0, 5.0, 4.0], [5.0, 1.0, 1.0], [2.0, 4.0, 3.0]])
+
+
+def make_saw(matrix=MATRIX):
+    saw = SAW()
+    saw.set_trace('off')
+    saw.set_criteria(['b1', 'b2'], ['c1'])
+    saw.set_weights([0.3, 0.2], [0.5])
+    saw.set_decision_matrix(matrix, ALTERNATIVES, ['b1', 'b2', 'c1'])
+    saw.perform_saw()
+    return saw
+
+
+def test_rank_acceptability_is_a_doubly_stochastic_matrix():
+    result = smaa_saw(make_saw(), n_samples=2_000, chunk_size=300, value_noise=0.1, seed=4)
+    acceptability = result['rank_acceptability']
+    assert acceptability.shape == (4, 4)
+    np.testing.assert_allclose(acceptability.sum(axis=0), 1.0)
+    np.testing.assert_allclose(acceptability.sum(axis=1), 1.0)
+    central = result['central_weights']
+    ranked_first = acceptability[:, 0] > 0
+    np.testing.assert_allclose(central[ranked_first].sum(axis=1), 1.0)
+    assert np.isnan(central[~ranked_first]).all()
+
+
+def test_same_seed_gives_the_same_result_for_any_worker_count():
+    saw = make_saw()
+    serial = smaa_saw(saw, n_samples=1_000, chunk_size=250, weight_concentration=20, value_noise=0.05, seed=7)
+    again = smaa_saw(saw, n_samples=1_000, chunk_size=250, weight_concentration=20, value_noise=0.05, seed=7)
+    pooled = smaa_saw(saw, n_samples=1_000, chunk_size=250, weight_concentration=20, value_noise=0.05, seed=7,
+                      n_workers=2)
+    np.testing.assert_array_equal(serial['rank_acceptability'], again['rank_acceptability'])
+    np.testing.assert_array_equal(serial['rank_acceptability'], pooled['rank_acceptability'])
+    np.testing.assert_array_equal(serial['central_weights'], pooled['central_weights'])
+
+
+def test_a_dominating_alternative_is_always_first():
+    matrix = MATRIX.copy()
+    matrix[1] = [9.0, 9.0, 0.5]  # B terbaik di semua kriteria
+    result = smaa_saw(make_saw(matrix), n_samples=500, chunk_size=100, seed=0)
+    np.testing.assert_array_equal(result['rank_acceptability'][:, 0], [0.0, 1.0, 0.0, 0.0])
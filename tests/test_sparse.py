@@ -0,0 +1,73 @@
+# tests/test_sparse.py
+
+import numpy as np
+import pytest
+
+from methods.ahp import AHP
+from methods.priority import connected_components, geometric_mean_priorities, log_least_squares_priorities
+
+CRITERIA = ['c1', 'c2', 'c3', 'c4']
+TRUE_WEIGHTS = np.array([8.0, 4.0, 2.0, 1.0])
+
+
+def make_ahp():
+    ahp = AHP(CRITERIA, ['A', 'B'])
+    ahp.set_trace('off')
+    for crit in CRITERIA:
+        ahp.set_alternative_comparisons(crit, [(0, 1, 2)])
+    return ahp
+
+
+def test_a_consistent_spanning_tree_recovers_the_weights():
+    ahp = make_ahp()
+    ahp.set_sparse_comparisons('criteria', [(0, 1, 2), (1, 2, 2), (3, 2, 1 / 2)])
+    ahp.perform_ahp()
+    np.testing.assert_allclose(ahp.criteria_weights, TRUE_WEIGHTS / TRUE_WEIGHTS.sum(), atol=1e-10)
+    assert ahp.diagnostics['criteria']['gci'] == pytest.approx(0, abs=1e-12)
+    assert ahp.consistency_ratios['criteria'] is None
+
+
+def test_a_complete_set_equals_the_dense_geometric_mean():
+    rng = np.random.default_rng(1)
+    n = 6
+    rows, cols = np.triu_indices(n, 1)
+    values = rng.choice([1 / 7, 1 / 3, 1, 3, 5, 9], size=len(rows))
+    dense = np.ones((n, n))
+    dense[rows, cols] = values
+    dense[cols, rows] = 1 / values
+    sparse = log_least_squares_priorities(n, rows, cols, values)
+    assert sparse['converged']
+    np.testing.assert_allclose(sparse['weights'], geometric_mean_priorities(dense)['weights'], atol=1e-10)
+
+
+def test_update_replaces_or_adds_a_comparison():
+    ahp = make_ahp()
+    ahp.set_sparse_comparisons('criteria', [(0, 1, 2), (1, 2, 2), (2, 3, 2)])
+    ahp.perform_ahp()
+    ahp.update_comparison('criteria', 1, 0, 1 / 3)   # Pasangan yang sama dengan arah terbalik
+    ahp.update_comparison('criteria', 0, 3, 24)      # Perbandingan baru
+    ahp.perform_ahp()
+    sparse = ahp.sparse_comparisons['criteria']
+    assert len(sparse['values']) == 4 and sparse['values'][0] == pytest.approx(3)
+    expected = make_ahp()
+    expected.set_sparse_comparisons('criteria', [(0, 1, 3), (1, 2, 2), (2, 3, 2), (0, 3, 24)])
+    expected.perform_ahp()
+    np.testing.assert_allclose(ahp.criteria_weights, expected.criteria_weights, atol=1e-12)
+
+
+def test_disconnected_or_invalid_comparisons_raise():
+    ahp = make_ahp()
+    with pytest.raises(ValueError, match="2 kelompok"):
+        ahp.set_sparse_comparisons('criteria', [(0, 1, 2), (2, 3, 2)])
+    with pytest.raises(ValueError):
+        ahp.set_sparse_comparisons('criteria', [(0, 1, 2), (1, 4, 2), (2, 3, 2)])
+    with pytest.raises(ValueError):
+        ahp.set_sparse_comparisons('criteria', [(0, 0, 2), (1, 2, 2), (2, 3, 2)])
+    with pytest.raises(ValueError):
+        ahp.set_sparse_comparisons('criteria', [(0, 1, 0), (1, 2, 2), (2, 3, 2)])
+    assert 'criteria' not in ahp.sparse_comparisons
+
+
+def test_connected_components_labels_each_group_by_its_smallest_item():
+    labels = connected_components(6, np.array([4, 1, 5]), np.array([0, 3, 4]))
+    np.testing.assert_array_equal(labels, [0, 1, 2, 1, 0, 0])
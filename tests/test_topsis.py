@@ -0,0 +1,70 @@
+# tests/test_topsis.py
+
+import numpy as np
+import pytest
+
+from methods.topsis import TOPSIS
+
+CRITERIA = ['b1', 'b2', 'c1']
+
+
+def make_topsis():
+    topsis = TOPSIS()
+    topsis.set_trace('off')
+    topsis.set_criteria(['b1', 'b2'], ['c1'])
+    topsis.set_weights([0.5, 0.3], [0.2])
+    return topsis
+
+
+def reference_closeness(matrix, weights, n_benefit):
+    weighted = matrix / np.sqrt((matrix ** 2).sum(axis=0)) * weights
+    ideal = np.where(np.arange(matrix.shape[1]) < n_benefit, weighted.max(axis=0), weighted.min(axis=0))
+    anti_ideal = np.where(np.arange(matrix.shape[1]) < n_benefit, weighted.min(axis=0), weighted.max(axis=0))
+    d_plus = np.sqrt(((weighted - ideal) ** 2).sum(axis=1))
+    d_minus = np.sqrt(((weighted - anti_ideal) ** 2).sum(axis=1))
+    return d_minus / (d_plus + d_minus)
+
+
+def test_scores_match_the_textbook_formula():
+    matrix = np.array([[7.0, 9.0, 9.0], [8.0, 7.0, 8.0], [9.0, 6.0, 8.0], [6.0, 7.0, 8.0]])
+    topsis = make_topsis()
+    topsis.set_decision_matrix(matrix, ['A', 'B', 'C', 'D'], CRITERIA)
+    topsis.perform_topsis()
+    np.testing.assert_allclose(topsis.scores, reference_closeness(matrix, np.array([0.5, 0.3, 0.2]), 2))
+    assert topsis.ranked_alternatives == [['A', 'B', 'C', 'D'][i] for i in np.argsort(-topsis.scores)]
+    results = topsis.get_results()
+    assert list(results['final_ranking']) == topsis.ranked_alternatives
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1000])
+def test_chunked_equals_in_memory(chunk_size):
+    rng = np.random.default_rng(5)
+    matrix = rng.uniform(1, 100, (50, 3))
+    labels = [f'a{i}' for i in range(50)]
+    dense = make_topsis()
+    dense.set_decision_matrix(matrix, labels, CRITERIA)
+    dense.perform_topsis()
+    chunked = make_topsis()
+    chunked.perform_topsis_chunked(matrix, labels, chunk_size=chunk_size)
+    np.testing.assert_allclose(chunked.scores, dense.scores, rtol=1e-12)
+    np.testing.assert_allclose(chunked.ideal, dense.ideal, rtol=1e-12)
+    np.testing.assert_allclose(chunked.anti_ideal, dense.anti_ideal, rtol=1e-12)
+    assert chunked.ranked_alternatives == dense.ranked_alternatives
+
+
+def test_chunked_top_k_is_a_prefix_of_the_full_ranking():
+    matrix = np.random.default_rng(6).uniform(1, 10, (30, 3))
+    full = make_topsis()
+    full.perform_topsis_chunked(matrix, chunk_size=8)
+    top = make_topsis()
+    top.perform_topsis_chunked(matrix, chunk_size=8, top_k=5)
+    assert list(top.ranked_alternatives) == list(full.ranked_alternatives[:5])
+
+
+def test_identical_alternatives_score_zero_and_bad_shapes_raise():
+    topsis = make_topsis()
+    topsis.set_decision_matrix(np.ones((3, 3)), ['A', 'B', 'C'], CRITERIA)
+    topsis.perform_topsis()
+    np.testing.assert_array_equal(topsis.scores, 0.0)
+    with pytest.raises(ValueError):
+        make_topsis().perform_topsis_chunked(np.ones((3, 2)))
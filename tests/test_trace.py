@@ -0,0 +1,87 @@
+# tests/test_trace.py
+
+import io
+import json
+
+import numpy as np
+import pytest
+
+from methods.ahp import AHP
+from methods.saw import SAW
+from methods.trace import DEBUG, JsonLinesSink, Tracer
+
+
+def run_ahp(level, sink=None):
+    ahp = AHP(['c1', 'c2'], ['A', 'B', 'C'])
+    ahp.set_trace(level, sink=sink)
+    ahp.set_criteria_comparisons([(0, 1, 3)])
+    ahp.set_alternative_comparisons('c1', [(0, 1, 2), (0, 2, 4), (1, 2, 3)])
+    ahp.set_alternative_comparisons('c2', [(0, 1, 1 / 3), (0, 2, 9), (1, 2, 1 / 5)])  # CR > 0.1
+    ahp.perform_ahp()
+    return ahp
+
+
+def test_levels_control_what_is_recorded():
+    off, info, debug = run_ahp('off'), run_ahp('info'), run_ahp('debug')
+    assert len(off.tracer.events) == 0 and off.steps == []
+    kinds = {event.kind for event in info.tracer.events}
+    assert {'step', 'metric', 'warning'} <= kinds and 'diagnostics' not in kinds
+    diagnostics = [event for event in debug.tracer.events if event.kind == 'diagnostics']
+    assert [event.target for event in diagnostics] == ['criteria', 'c1', 'c2']
+    assert all(event.level == DEBUG and event.message is None for event in diagnostics)
+    assert debug.steps == info.steps
+    np.testing.assert_array_equal(off.final_ranking, debug.final_ranking)
+
+
+def test_warning_event_carries_the_numeric_payload():
+    warnings = [event for event in run_ahp('info').tracer.events if event.kind == 'warning']
+    assert [event.target for event in warnings] == ['c2']
+    assert warnings[0].payload['CR'] > 0.1
+    assert "'c2'" in warnings[0].message
+
+
+def test_off_level_does_not_format_messages():
+    tracer = Tracer('off')
+    tracer.emit('step', 'input', "{missing}")  # Field tidak ada: hanya error jika diformat
+    assert len(tracer.events) == 0
+    tracer.set_level('info')
+    tracer.emit('step', 'input', "{missing}")
+    with pytest.raises(KeyError):
+        tracer.messages()
+
+
+def test_ring_buffer_keeps_the_latest_events():
+    tracer = Tracer(maxlen=3)
+    for idx in range(5):
+        tracer.emit('step', 'loop', "Langkah {idx}", idx=idx)
+    assert tracer.messages() == ['Langkah 2', 'Langkah 3', 'Langkah 4']
+    with pytest.raises(ValueError):
+        Tracer('verbose')
+
+
+def test_json_lines_sink_writes_one_object_per_event():
+    stream = io.StringIO()
+    ahp = run_ahp('debug', sink=JsonLinesSink(stream))
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert lines == json.loads(json.dumps(ahp.tracer.to_dicts(), default=lambda value: value.tolist()))
+    assert {'timestamp', 'level', 'kind', 'stage', 'target', 'payload', 'message'} == set(lines[0])
+
+
+def test_saw_steps_follow_the_trace_level(tmp_path):
+    path = tmp_path / 'trace.jsonl'
+    results = {}
+    for level in ('off', 'info'):
+        saw = SAW()
+        sink = JsonLinesSink(str(path)) if level == 'info' else None
+        saw.set_trace(level, sink=sink)
+        saw.set_criteria(['b1'], ['c1'])
+        saw.set_weights([0.6], [0.4])
+        saw.set_decision_matrix(np.array([[3.0, 2.0], [4.0, 5.0]]), ['A', 'B'], ['b1', 'c1'])
+        saw.perform_saw()
+        if sink is not None:
+            sink.close()
+        results[level] = saw
+    assert results['off'].steps == []
+    assert results['info'].steps
+    assert len(path.read_text(encoding='utf-8').splitlines()) == len(results['info'].tracer.events)
+    np.testing.assert_array_equal(results['off'].scores, results['info'].scores)
@@ -0,0 +1,85 @@
+# tests/test_transport.py
+
+import io
+import json
+import struct
+
+import numpy as np
+import pytest
+
+from methods.transport import ALIGNMENT, decode_binary, encode_binary
+from methods.worker import handle_request, serve
+from test_worker import SAW_PARAMS
+
+
+def test_round_trip_preserves_arrays_labels_and_meta():
+    columns = {
+        'scores': np.array([0.25, 0.5, 0.125]),
+        'matrix': np.arange(6, dtype=np.float32).reshape(2, 3),
+        'ranks': np.array([3, 1, 2], dtype=np.int64),
+        'small': np.array([1, 2, 3], dtype=np.int16),  # Tipe tanpa typed array dikirim sebagai int64
+        'flags': np.array([True, False, True]),
+        'alternatives': np.array(['A', 'B', 'C'], dtype=object),
+        'criteria': ['b1', 'c1'],
+        'empty': np.empty((0, 2)),
+    }
+    meta = {'steps': ['satu', 'dua'], 'CR': np.float64(0.05)}
+    decoded, decoded_meta = decode_binary(encode_binary(columns, meta))
+    assert set(decoded) == set(columns)
+    for name in ('scores', 'matrix', 'ranks', 'small', 'empty'):
+        np.testing.assert_array_equal(decoded[name], columns[name])
+        assert decoded[name].shape == columns[name].shape
+    assert decoded['matrix'].dtype == np.float32
+    assert decoded['small'].dtype == np.int64
+    np.testing.assert_array_equal(decoded['flags'], [1, 0, 1])
+    assert decoded['alternatives'] == ['A', 'B', 'C'] and decoded['criteria'] == ['b1', 'c1']
+    assert decoded_meta == {'steps': ['satu', 'dua'], 'CR': 0.05}
+    assert not decoded['scores'].flags.writeable
+
+
+def test_buffers_are_aligned_for_typed_arrays():
+    frame = encode_binary({'a': np.ones(3, dtype=np.float32), 'b': np.arange(5.0)}, {'x': 'y' * 13})
+    header_length = struct.unpack_from('<I', frame, 8)[0]
+    header = json.loads(frame[12:12 + header_length])
+    for entry in header['arrays']:
+        assert entry['offset'] % ALIGNMENT == 0
+        assert entry['offset'] >= 12 + header_length
+    assert len(frame) % ALIGNMENT == 0
+
+
+def test_invalid_frames_raise():
+    frame = encode_binary({'a': np.ones(2)})
+    with pytest.raises(ValueError):
+        decode_binary(b'XXXX' + frame[4:])
+    with pytest.raises(ValueError):
+        decode_binary(frame[:4] + struct.pack('<I', 99) + frame[8:])
+
+
+def test_binary_response_carries_the_same_result_as_json():
+    as_json = handle_request({'id': 1, 'method': 'saw', 'params': SAW_PARAMS})['result']
+    response = handle_request({'id': 2, 'method': 'saw', 'params': SAW_PARAMS, 'format': 'binary'})
+    assert response['ok'] and response['format'] == 'binary'
+    columns, meta = decode_binary(response['result'])
+    assert meta['steps'] == as_json['steps']
+    assert dict(zip(columns['ranked_alternatives'], columns['ranked_scores'].tolist())) == pytest.approx(as_json['final_ranking'])
+    assert list(columns['ranked_alternatives']) == list(as_json['final_ranking'])
+    np.testing.assert_allclose(columns['criteria_weights'], as_json['criteria_weights'])
+
+
+def test_serve_writes_a_length_line_followed_by_the_frame():
+    raw = io.BytesIO()
+    stdout = io.TextIOWrapper(raw, encoding='utf-8', write_through=True)
+    requests = [
+        {'id': 1, 'method': 'saw', 'params': SAW_PARAMS, 'format': 'binary'},
+        {'id': 2, 'method': 'unknown', 'format': 'binary'},
+    ]
+    serve(io.StringIO("\n".join(json.dumps(request) for request in requests) + "\n"), stdout)
+    data = raw.getvalue()
+    line_end = data.index(b'\n')
+    first = json.loads(data[:line_end])
+    assert first['id'] == 1 and first['ok'] and first['format'] == 'binary'
+    frame = data[line_end + 1:line_end + 1 + first['length']]
+    columns, _ = decode_binary(frame)
+    assert columns['ranked_alternatives'] == ['C', 'B', 'A']
+    second = json.loads(data[line_end + 1 + first['length']:])
+    assert second['id'] == 2 and not second['ok']
@@ -0,0 +1,55 @@
+# tests/test_utility.py
+
+import numpy as np
+import pytest
+
+from methods.maut import MAUT
+from methods.utility import apply_utilities, make_utility
+
+
+def test_each_shape_matches_its_scalar_formula():
+    x = np.linspace(0, 1, 11)
+    matrix = np.column_stack([x, x, x, x])
+    specs = [
+        make_utility('linear'),
+        make_utility('exponential', alpha=2.0),
+        make_utility('logarithmic', alpha=3.0),
+        make_utility('piecewise', points=[(0, 0), (0.5, 0.8), (1, 1)]),
+    ]
+    result = apply_utilities(matrix, specs)
+    np.testing.assert_allclose(result[:, 0], x)
+    np.testing.assert_allclose(result[:, 1], (1 - np.exp(-2 * x)) / (1 - np.exp(-2)))
+    np.testing.assert_allclose(result[:, 2], np.log(1 + 3 * x) / np.log(4))
+    np.testing.assert_allclose(result[:, 3], np.interp(x, [0, 0.5, 1], [0, 0.8, 1]))
+    # Semua bentuk memetakan 0 -> 0 dan 1 -> 1
+    np.testing.assert_allclose(result[[0, -1]], [[0] * 4, [1] * 4], atol=1e-12)
+
+
+def test_zero_alpha_is_linear():
+    x = np.linspace(0, 1, 5)[:, None]
+    for shape in ('exponential', 'logarithmic'):
+        np.testing.assert_allclose(apply_utilities(x, [make_utility(shape, alpha=0)]), x)
+
+
+@pytest.mark.parametrize('shape, params', [
+    ('tidak_ada', {}),
+    ('linear', {'alpha': 1}),
+    ('logarithmic', {'alpha': -1}),
+    ('piecewise', {'points': [(0, 0)]}),
+    ('piecewise', {'points': [(0, 0), (0, 1)]}),
+])
+def test_invalid_specs_are_rejected(shape, params):
+    with pytest.raises(ValueError):
+        make_utility(shape, **params)
+
+
+def test_maut_uses_the_configured_utility():
+    benefit = np.array([[1.0], [2.0], [4.0]])
+    maut = MAUT(verbose=False)
+    maut.set_criteria(['b1'], [])
+    maut.set_alternatives(['A', 'B', 'C'])
+    maut.set_weights([1], [])
+    linear = maut.evaluate(benefit, None)['S_scores']
+    maut.set_utility('b1', 'exponential', alpha=2.0)
+    curved = maut.evaluate(benefit, None)['S_scores']
+    np.testing.assert_allclose(curved, (1 - np.exp(-2 * linear)) / (1 - np.exp(-2)))
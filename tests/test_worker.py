@@ -0,0 +1,43 @@
+# tests/test_worker.py
+
+import io
+import json
+
+from methods.worker import handle_request, serve
+
+SAW_PARAMS = {
+    'criteria_benefit': ['harga_jual'],
+    'criteria_cost': ['biaya'],
+    'weight_benefit': [0.6],
+    'weight_cost': [0.4],
+    'alternatives': ['A', 'B', 'C'],
+    'alternative_scores': {
+        'harga_jual': {'A': 70, 'B': 90, 'C': 80},
+        'biaya': {'A': 20, 'B': 40, 'C': 10},
+    },
+}
+
+
+def test_handle_request_returns_json_result_with_same_id():
+    response = handle_request({'id': 7, 'method': 'saw', 'params': SAW_PARAMS})
+    assert response['id'] == 7
+    assert response['ok']
+    ranking = response['result']['final_ranking']
+    assert list(ranking) == ['C', 'B', 'A']
+    json.dumps(response)  # Semua nilai harus bisa di-serialize
+
+
+def test_handle_request_reports_errors_instead_of_raising():
+    assert handle_request({'id': 1, 'method': 'tidak_ada'})['ok'] is False
+    response = handle_request({'id': 2, 'method': 'saw', 'params': {}})
+    assert response['ok'] is False
+    assert 'KeyError' in response['error']
+
+
+def test_serve_answers_each_line_and_survives_invalid_json():
+    stdin = io.StringIO('bukan json\n\n' + json.dumps({'id': 'x', 'method': 'saw', 'params': SAW_PARAMS}) + '\n')
+    stdout = io.StringIO()
+    serve(stdin, stdout)
+    responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert [response['ok'] for response in responses] == [False, True]
+    assert responses[1]['id'] == 'x'